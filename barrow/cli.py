@@ -13,11 +13,26 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - optional dependency
     argcomplete = None
 
+from .core.nodes import Sink
 from .core.plan import format_plan
-from .errors import BarrowError
-from .execution import execute
-from .frontend.cli_to_plan import cli_to_plan
-from .optimizer import optimize
+from .core.plan import LogicalPlan
+from .errors import BarrowError, FrontendError
+from .execution import ExecutionStats, execute, parse_memory_limit, set_memory_limit
+from .io.options import COMPRESSIONS
+from .frontend.cli_to_plan import cli_to_plan, pipeline_to_plan, split_pipeline
+from .optimizer import describe_costs, optimize
+
+_EXTENSION_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".feather": "feather",
+    ".orc": "orc",
+    ".arrows": "arrow",
+}
+
+
+def _format_from_extension(path: str) -> str | None:
+    return _EXTENSION_FORMATS.get(Path(path).suffix.lower())
 
 
 def _add_io_options(parser: argparse.ArgumentParser) -> None:
@@ -27,10 +42,17 @@ def _add_io_options(parser: argparse.ArgumentParser) -> None:
     input format.
     """
 
-    parser.add_argument("--input", "-i", help="Input file. Reads STDIN if omitted.")
+    parser.add_argument(
+        "--input",
+        "-i",
+        help=(
+            "Input file, directory or quoted glob such as 'data/**/*.parquet'. "
+            "Reads STDIN if omitted."
+        ),
+    )
     parser.add_argument(
         "--input-format",
-        choices=["csv", "parquet", "feather", "orc"],
+        choices=["csv", "parquet", "feather", "orc", "arrow"],
         help="Input format",
     )
     parser.add_argument(
@@ -41,7 +63,7 @@ def _add_io_options(parser: argparse.ArgumentParser) -> None:
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
         "--output-format",
-        choices=["csv", "parquet", "feather", "orc"],
+        choices=["csv", "parquet", "feather", "orc", "arrow"],
         help="Output format",
     )
     group.add_argument(
@@ -72,6 +94,13 @@ def _add_io_options(parser: argparse.ArgumentParser) -> None:
         const="orc",
         help="Write output in ORC format",
     )
+    group.add_argument(
+        "--arrow",
+        dest="output_format",
+        action="store_const",
+        const="arrow",
+        help="Write output in the Arrow IPC stream format",
+    )
     parser.add_argument(
         "--delimiter",
         help="Field delimiter for CSV input; also used for output",
@@ -81,34 +110,100 @@ def _add_io_options(parser: argparse.ArgumentParser) -> None:
         dest="output_delimiter",
         help="Field delimiter for CSV output",
     )
+    parser.add_argument(
+        "--partition-by",
+        help=(
+            "Comma-separated columns; write --output as a directory with one "
+            "column=value subdirectory per value"
+        ),
+    )
+    parser.add_argument(
+        "--max-rows-per-file",
+        type=int,
+        help="Write --output as a directory of files holding at most this many rows",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=list(COMPRESSIONS),
+        help=(
+            "Codec for Parquet, Feather, ORC and Arrow outputs "
+            "(Feather and Arrow: zstd, lz4 or none)"
+        ),
+    )
+    parser.add_argument(
+        "--compression-level", type=int, help="Codec level, e.g. 1-22 for zstd"
+    )
+    parser.add_argument(
+        "--row-group-size", type=int, help="Maximum rows per Parquet row group"
+    )
+    parser.add_argument(
+        "--page-size", type=int, help="Target Parquet data page size in bytes"
+    )
+    parser.add_argument(
+        "--dictionary-columns",
+        metavar="COLS",
+        help="Dictionary-encode only these Parquet columns ('' for none)",
+    )
+    parser.add_argument(
+        "--no-statistics",
+        action="store_true",
+        help="Do not write Parquet min/max statistics",
+    )
+    parser.add_argument(
+        "--bloom-filter",
+        metavar="COLS",
+        help="Write Parquet or ORC Bloom filters for these columns",
+    )
+    parser.add_argument(
+        "--sorting-columns",
+        metavar="COLS",
+        help=(
+            "Record these columns (suffix ':desc' to reverse) "
+            "as the Parquet sort order"
+        ),
+    )
+    parser.add_argument(
+        "--memory-limit",
+        metavar="SIZE",
+        type=_memory_size,
+        help=(
+            "Memory budget such as 512M or 4G for sort, summary, join and sql; "
+            "larger inputs spill to the temporary directory "
+            "(default: $BARROW_MEMORY_LIMIT, else unlimited)"
+        ),
+    )
     parser.add_argument(
         "--tmp",
         "-t",
         action="store_true",
-        help="Use Feather for intermediate pipe format",
+        help=(
+            "Stream the Arrow IPC format to STDOUT for intermediate pipes; "
+            "Feather when --output has no known extension"
+        ),
     )
 
     def _set_io_defaults(args: argparse.Namespace) -> None:
-        if args.tmp:
-            if args.output_format is None:
-                args.output_format = "feather"
+        if args.tmp and args.output_format is None:
+            if args.output is None:
+                args.output_format = "arrow"
+            else:
+                args.output_format = _format_from_extension(args.output) or "feather"
         if args.output_format is None:
             if args.input_format is not None:
                 args.output_format = args.input_format
             elif args.input:
-                ext = Path(args.input).suffix.lower()
-                if ext == ".csv":
-                    args.output_format = "csv"
-                elif ext == ".parquet":
-                    args.output_format = "parquet"
-                elif ext == ".feather":
-                    args.output_format = "feather"
-                elif ext == ".orc":
-                    args.output_format = "orc"
+                args.output_format = _format_from_extension(args.input)
 
     parser.set_defaults(_set_io_defaults=_set_io_defaults)
 
 
+def _memory_size(text: str) -> int:
+    try:
+        return parse_memory_limit(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
 def _cmd_filter(args: argparse.Namespace) -> int:
     """Filter rows.
 
@@ -217,6 +312,13 @@ def _cmd_sort(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_limit(args: argparse.Namespace) -> int:
+    plan = cli_to_plan("limit", args)
+    optimized = optimize(plan)
+    execute(optimized.root)
+    return 0
+
+
 def _cmd_sql(args: argparse.Namespace) -> int:
     plan = cli_to_plan("sql", args)
     optimized = optimize(plan)
@@ -231,6 +333,66 @@ def _cmd_window(args: argparse.Namespace) -> int:
     return 0
 
 
+# Stage options that would redirect the pipeline's input or output.
+_STAGE_IO_OPTIONS = {
+    "input": "--input",
+    "input_format": "--input-format",
+    "output": "--output",
+    "output_format": "--output-format",
+    "delimiter": "--delimiter",
+    "output_delimiter": "--csv-out-delimiter",
+    "tmp": "--tmp",
+    "partition_by": "--partition-by",
+    "max_rows_per_file": "--max-rows-per-file",
+    "compression": "--compression",
+    "compression_level": "--compression-level",
+    "row_group_size": "--row-group-size",
+    "page_size": "--page-size",
+    "dictionary_columns": "--dictionary-columns",
+    "no_statistics": "--no-statistics",
+    "bloom_filter": "--bloom-filter",
+    "sorting_columns": "--sorting-columns",
+    "memory_limit": "--memory-limit",
+}
+
+
+def _pipeline_plan(pipeline: str, args: argparse.Namespace) -> LogicalPlan:
+    """Parse the stages of *pipeline* and chain them into one plan."""
+    parser = build_parser()
+    stages: list[tuple[str, argparse.Namespace]] = []
+    for tokens in split_pipeline(pipeline):
+        stage_args = parser.parse_args(tokens)
+        for dest, flag in _STAGE_IO_OPTIONS.items():
+            if getattr(stage_args, dest, None) not in (None, False):
+                raise FrontendError(
+                    f"Stage '{stage_args.command}' cannot set {flag}; "
+                    "pass I/O options to 'barrow pipe'"
+                )
+        stages.append((stage_args.command, stage_args))
+    return pipeline_to_plan(stages, args)
+
+
+def _cmd_pipe(args: argparse.Namespace) -> int:
+    """Run several commands as a single plan.
+
+    The stages are optimized together and executed in this process, so
+    intermediate results are never serialized.
+    """
+
+    plan = _pipeline_plan(args.pipeline, args)
+    optimized = optimize(plan)
+    execute(optimized.root)
+    return 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    """Run the warm server answering the ``barrow`` client."""
+
+    from .server import serve
+
+    return serve(args.socket)
+
+
 def _cmd_explain(args: argparse.Namespace) -> int:
     cmd = args.explain_command
     # Build a namespace compatible with cli_to_plan
@@ -247,19 +409,40 @@ def _cmd_explain(args: argparse.Namespace) -> int:
         plan_args.aggregations = args.expression
     elif cmd in ("sql",):
         plan_args.query = args.expression
+    elif cmd in ("limit", "head"):
+        try:
+            plan_args.n = int(args.expression or 10)
+        except ValueError:
+            raise FrontendError(f"Row count must be an integer: {args.expression!r}")
     # Set IO defaults
     plan_args.output = None
     plan_args.output_format = None
     plan_args.delimiter = None
     plan_args.output_delimiter = None
 
-    plan = cli_to_plan(cmd, plan_args)
+    if cmd == "pipe":
+        plan = _pipeline_plan(args.expression or "", plan_args)
+    else:
+        plan = cli_to_plan(cmd, plan_args)
     print("Logical Plan:")
     print(format_plan(plan.root))
     print()
     optimized = optimize(plan)
-    print("Optimized Plan:")
-    print(format_plan(optimized.root))
+    if not args.analyze:
+        print("Optimized Plan:")
+        print(format_plan(optimized.root, annotate=describe_costs()))
+        return 0
+
+    # Run the plan without writing its output and report per-node statistics.
+    root = optimized.root
+    if isinstance(root, Sink):
+        root = root.child
+    stats = ExecutionStats()
+    result = execute(root, stats)
+    for _ in result.to_batches():
+        pass
+    print("Optimized Plan (analyzed):")
+    print(format_plan(root, annotate=stats.describe))
     return 0
 
 
@@ -362,23 +545,29 @@ def build_parser() -> argparse.ArgumentParser:
         description=(
             "Combine a left table with another table supplied via --right.\n"
             "Specify key columns with LEFT_ON and RIGHT_ON and optionally choose\n"
-            "a join type such as inner or outer."
+            "a join type such as inner or outer. semi keeps the left rows with a\n"
+            "match and anti those without one."
+        ),
+        epilog=(
+            "Examples:\n  barrow join id id --right other.csv -i left.csv\n"
+            "  barrow join 'id,day' 'user_id,day' --right visits.parquet -i users.csv"
         ),
-        epilog="Example:\n  barrow join id id --right other.csv -i left.csv",
         formatter_class=argparse.RawTextHelpFormatter,
     )
     _add_io_options(p)
-    p.add_argument("left_on", help="Join key in the left table")
-    p.add_argument("right_on", help="Join key in the right table")
+    p.add_argument("left_on", help="Comma-separated join keys in the left table")
+    p.add_argument(
+        "right_on", help="Comma-separated join keys in the right table, in order"
+    )
     p.add_argument("--right", required=True, help="Right input file")
     p.add_argument(
         "--right-format",
-        choices=["csv", "parquet", "feather", "orc"],
+        choices=["csv", "parquet", "feather", "orc", "arrow"],
         help="Right file format",
     )
     p.add_argument(
         "--join-type",
-        choices=["inner", "left", "right", "outer"],
+        choices=["inner", "left", "right", "outer", "semi", "anti"],
         default="inner",
     )
     p.set_defaults(func=_cmd_join)
@@ -390,12 +579,20 @@ def build_parser() -> argparse.ArgumentParser:
             "Display a table in CSV format for quick inspection. The output is\n"
             "always written to STDOUT and --output-format is ignored."
         ),
-        epilog="Example:\n  barrow view -i data.parquet",
+        epilog="Example:\n  barrow view -i data.parquet --rows 20",
         formatter_class=argparse.RawTextHelpFormatter,
     )
     p.add_argument("--input", "-i", help="Input file. Reads STDIN if omitted.")
     p.add_argument(
-        "--input-format", choices=["csv", "parquet", "orc"], help="Input format"
+        "--rows",
+        "-n",
+        type=int,
+        help="Show only the first N rows; the input is read only that far",
+    )
+    p.add_argument(
+        "--input-format",
+        choices=["csv", "parquet", "feather", "orc", "arrow"],
+        help="Input format",
     )
     p.add_argument(
         "--output-format",
@@ -427,6 +624,24 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--desc", action="store_true", help="Sort in descending order")
     p.set_defaults(func=_cmd_sort)
 
+    p = subparsers.add_parser(
+        "limit",
+        aliases=["head"],
+        help="Keep the first N rows, optionally in sort order",
+        description=(
+            "Keep the first N rows of the input (10 by default).\n"
+            "With --sort-by, keep the first N rows in sort order without\n"
+            "sorting the whole input."
+        ),
+        epilog="Example:\n  barrow head 5 --sort-by age --desc -i people.csv",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    _add_io_options(p)
+    p.add_argument("n", nargs="?", type=int, default=10, help="Number of rows to keep")
+    p.add_argument("--sort-by", help="Comma-separated column names to sort by")
+    p.add_argument("--desc", action="store_true", help="Sort in descending order")
+    p.set_defaults(func=_cmd_limit)
+
     p = subparsers.add_parser(
         "sql",
         help="Execute a SQL query against the input table",
@@ -457,6 +672,46 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--order-by", help="Comma-separated order columns")
     p.set_defaults(func=_cmd_window)
 
+    p = subparsers.add_parser(
+        "pipe",
+        help="Run several commands in one process",
+        description=(
+            "Chain commands separated by '|' into a single plan that is optimized\n"
+            "as a whole and executed without serializing intermediate results.\n"
+            "I/O options apply to the whole pipeline and cannot be given to a stage."
+        ),
+        epilog=(
+            "Example:\n"
+            "  barrow pipe \"filter 'x > 1' | mutate 'y=x*2' | groupby k"
+            ' | summary y=sum" -i data.csv'
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    _add_io_options(p)
+    p.add_argument("pipeline", help="Commands separated by '|'")
+    p.set_defaults(func=_cmd_pipe)
+
+    p = subparsers.add_parser(
+        "serve",
+        help="Keep barrow loaded in a local server",
+        description=(
+            "Listen on a Unix socket and run the commands of the 'barrow' client\n"
+            "with modules already imported, avoiding per-command startup.\n"
+            "The client falls back to running commands itself when no server\n"
+            "is listening. Stop the server with Ctrl-C or SIGTERM."
+        ),
+        epilog="Example:\n  barrow serve &",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument(
+        "--socket",
+        help=(
+            "Socket path. Defaults to $BARROW_SOCKET, then "
+            "$XDG_RUNTIME_DIR/barrow.sock or /tmp/barrow-UID/barrow.sock"
+        ),
+    )
+    p.set_defaults(func=_cmd_serve)
+
     p = subparsers.add_parser(
         "explain",
         help="Show the execution plan without running it",
@@ -464,7 +719,11 @@ def build_parser() -> argparse.ArgumentParser:
             "Display the logical and optimized plans for a command.\n"
             "Useful for understanding how barrow will execute a pipeline."
         ),
-        epilog="Example:\n  barrow explain filter 'age > 30' -i people.csv",
+        epilog=(
+            "Examples:\n"
+            "  barrow explain filter 'age > 30' -i people.csv\n"
+            "  barrow explain --analyze sort age -i people.csv"
+        ),
         formatter_class=argparse.RawTextHelpFormatter,
     )
     # explain needs the subcommand and its args
@@ -476,9 +735,18 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--input", "-i", help="Input file")
     p.add_argument(
         "--input-format",
-        choices=["csv", "parquet", "feather", "orc"],
+        choices=["csv", "parquet", "feather", "orc", "arrow"],
         help="Input format",
     )
+    p.add_argument(
+        "--analyze",
+        action="store_true",
+        help=(
+            "Execute the optimized plan, discarding its output, and annotate "
+            "each node with wall and CPU time, rows, batches, bytes, Arrow "
+            "memory peak and backend"
+        ),
+    )
     p.set_defaults(func=_cmd_explain)
 
     return parser
@@ -502,6 +770,7 @@ def main(argv: list[str] | None = None) -> int:
         return 1
     if hasattr(args, "_set_io_defaults"):
         args._set_io_defaults(args)
+    set_memory_limit(getattr(args, "memory_limit", None))
 
     if _profile:
         _t_parsed = time.perf_counter()
@@ -0,0 +1,144 @@
+"""Thin ``barrow`` entry point that forwards commands to ``barrow serve``.
+
+The client only imports the standard library.  When a server is listening
+on the socket it sends the command line, working directory, ``BARROW_*``
+environment variables and its ``STDIN``/``STDOUT``/``STDERR`` file
+descriptors, so the server reads and writes the client's streams directly.
+Other environment variables, such as ``TMPDIR``, are not forwarded and keep
+the server's values.
+The socket lives in a directory only the current user can access, and the
+descriptors are only sent to a server running as the same user.  When no
+such server answers, the command runs in-process through
+:func:`barrow.cli.main`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+
+#: Environment variable overriding the server socket path.
+SOCKET_ENV = "BARROW_SOCKET"
+
+# Requests are a length-prefixed JSON header sent together with the three
+# standard file descriptors; the reply is the command's exit status.
+_HEADER = struct.Struct("!I")
+_STATUS = struct.Struct("!i")
+# ``struct ucred`` returned by ``SO_PEERCRED``: pid, uid and gid.
+_PEERCRED = struct.Struct("3i")
+
+
+def default_socket_path() -> str:
+    """Return the socket path from ``BARROW_SOCKET`` or a per-user default.
+
+    The default lives in ``$XDG_RUNTIME_DIR`` or, without one, in the
+    per-user directory ``/tmp/barrow-UID``, which ``barrow serve`` creates.
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "barrow.sock")
+    return os.path.join("/tmp", f"barrow-{os.getuid()}", "barrow.sock")
+
+
+def is_private_dir(path: str) -> bool:
+    """Return ``True`` if *path* is a directory only the current user can use.
+
+    The directory must be owned by the user and grant no permissions to the
+    group or others; symbolic links are not followed.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+    )
+
+
+def encode_request(argv: list[str]) -> bytes:
+    """Serialize a request for *argv* issued from the current process."""
+    payload = json.dumps(
+        {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": {k: v for k, v in os.environ.items() if k.startswith("BARROW_")},
+        }
+    ).encode()
+    return _HEADER.pack(len(payload)) + payload
+
+
+def forward(argv: list[str], path: str | None = None) -> int | None:
+    """Run *argv* on the server listening at *path*.
+
+    Returns the command's exit status, or ``None`` when no server accepted
+    the request and the caller should run it itself.  Requests are only sent
+    if the socket's directory is private and the server runs as the current
+    user.
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(socket, "send_fds"):
+        return None
+    path = path or default_socket_path()
+    if not is_private_dir(os.path.dirname(os.path.abspath(path))):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(path)
+            if not _served_by_user(sock, path):
+                return None
+            sys.stdout.flush()
+            sys.stderr.flush()
+            socket.send_fds(sock, [encode_request(argv)], [0, 1, 2])
+        except OSError:
+            return None
+        reply = b""
+        while len(reply) < _STATUS.size:
+            chunk = sock.recv(_STATUS.size - len(reply))
+            if not chunk:
+                return 1
+            reply += chunk
+        return _STATUS.unpack(reply)[0]
+    finally:
+        sock.close()
+
+
+def _served_by_user(sock: socket.socket, path: str) -> bool:
+    """Return ``True`` if the server behind *sock* runs as the current user."""
+    if hasattr(socket, "SO_PEERCRED"):
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size)
+        _, uid, _ = _PEERCRED.unpack(creds)
+        return uid == os.getuid()
+    # Without peer credentials, trust the owner of the socket file.
+    st = os.lstat(path)
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the ``barrow`` command line tool."""
+    if argv is None:
+        argv = sys.argv[1:]
+    local = (
+        not argv
+        or argv[0] == "serve"
+        or os.environ.get("_ARGCOMPLETE") == "1"
+        or os.environ.get(SOCKET_ENV) == "0"
+    )
+    if not local:
+        status = forward(argv)
+        if status is not None:
+            return status
+
+    from barrow.cli import main as cli_main
+
+    return cli_main(argv)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
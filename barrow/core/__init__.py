@@ -23,6 +23,7 @@ from .nodes import (
     Sink,
     Sort,
     SqlQuery,
+    TopK,
     Ungroup,
     View,
     Window,
@@ -53,6 +54,7 @@ __all__ = [
     "Sink",
     "Sort",
     "SqlQuery",
+    "TopK",
     "Ungroup",
     "View",
     "Window",
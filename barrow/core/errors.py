@@ -27,6 +27,10 @@ class BarrowIOError(BarrowError):
     """Raised for I/O-specific errors."""
 
 
+class CsvTypeError(BarrowIOError):
+    """Raised when a CSV value does not fit the type inferred for its column."""
+
+
 class FrontendError(BarrowError):
     """Raised when a frontend fails to parse user input into a plan."""
 
@@ -42,6 +46,7 @@ __all__ = [
     "ExecutionError",
     "PlanningError",
     "BarrowIOError",
+    "CsvTypeError",
     "FrontendError",
     "OptimizationError",
 ]
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from barrow.expr import Expression
+    from barrow.io.options import WriteOptions
 
 
 @dataclass(frozen=True)
@@ -16,12 +17,20 @@ class LogicalNode:
 
 @dataclass(frozen=True)
 class Scan(LogicalNode):
-    """Read data from a source."""
+    """Read data from a source.
+
+    ``columns``, ``predicate`` and ``limit`` are filled in by the optimizer
+    so readers can skip unused columns and row groups and stop once enough
+    rows have been read.  They only prune: the :class:`Filter` and
+    :class:`Limit` they were derived from stay in the plan.
+    """
 
     path: str | None = None
     format: str | None = None
     delimiter: str | None = None
     columns: list[str] | None = None
+    predicate: Expression | None = None
+    limit: int | None = None
 
 
 @dataclass(frozen=True)
@@ -59,13 +68,20 @@ class Aggregate(LogicalNode):
 
 @dataclass(frozen=True)
 class Join(LogicalNode):
-    """Join two tables."""
+    """Join two tables on pairs of key columns.
+
+    ``join_type`` is ``"inner"``, ``"left"``, ``"right"``, ``"outer"``,
+    ``"semi"`` or ``"anti"``.  ``build_side`` names the side held in memory
+    while the other one is streamed; ``None`` builds the right side.  It is
+    chosen by the optimizer from size estimates.
+    """
 
     left: LogicalNode = field(default_factory=LogicalNode)
     right: LogicalNode = field(default_factory=LogicalNode)
-    left_on: str = ""
-    right_on: str = ""
+    left_on: list[str] = field(default_factory=list)
+    right_on: list[str] = field(default_factory=list)
     join_type: str = "inner"
+    build_side: str | None = None
 
 
 @dataclass(frozen=True)
@@ -110,6 +126,20 @@ class Limit(LogicalNode):
     n: int = 0
 
 
+@dataclass(frozen=True)
+class TopK(LogicalNode):
+    """Keep the first *n* rows in sort order without sorting the whole input.
+
+    Produced by the optimizer from ``Limit(Sort(...))``; ties keep their input
+    order, so the result equals sorting and then limiting.
+    """
+
+    child: LogicalNode = field(default_factory=LogicalNode)
+    keys: list[str] = field(default_factory=list)
+    descending: list[bool] = field(default_factory=list)
+    n: int = 0
+
+
 @dataclass(frozen=True)
 class View(LogicalNode):
     """Display table as CSV to STDOUT."""
@@ -127,12 +157,20 @@ class SqlQuery(LogicalNode):
 
 @dataclass(frozen=True)
 class Sink(LogicalNode):
-    """Write data to a destination."""
+    """Write data to a destination.
+
+    With *partition_by* or *max_rows_per_file*, *path* is a directory that
+    receives a dataset of files instead of a single file.  *write_options*
+    sets compression and encoding; ``None`` keeps the writer defaults.
+    """
 
     child: LogicalNode = field(default_factory=LogicalNode)
     path: str | None = None
     format: str | None = None
     delimiter: str | None = None
+    partition_by: list[str] | None = None
+    max_rows_per_file: int | None = None
+    write_options: WriteOptions | None = None
 
 
 __all__ = [
@@ -148,6 +186,7 @@ __all__ = [
     "GroupBy",
     "Ungroup",
     "Limit",
+    "TopK",
     "View",
     "SqlQuery",
     "Sink",
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Iterator
+from typing import Callable, Iterator
 
-from .nodes import Aggregate, Join, LogicalNode, Scan, Sink
+from .nodes import Aggregate, Join, LogicalNode, Scan, Sink, TopK
 
 
 class LogicalPlan:
@@ -38,12 +38,24 @@ def _walk(node: LogicalNode) -> Iterator[LogicalNode]:
     yield node
 
 
-def format_plan(node: LogicalNode, indent: int = 0) -> str:
-    """Format a plan tree as a human-readable string."""
+def format_plan(
+    node: LogicalNode,
+    indent: int = 0,
+    annotate: Callable[[LogicalNode], str] | None = None,
+) -> str:
+    """Format a plan tree as a human-readable string.
+
+    When *annotate* is given, its non-empty result for each node is appended
+    to that node's line in square brackets.
+    """
     prefix = "  " * indent
     name = type(node).__name__
     detail = _node_detail(node)
-    lines = [f"{prefix}{name}({detail})"]
+    line = f"{prefix}{name}({detail})"
+    note = annotate(node) if annotate is not None else ""
+    if note:
+        line = f"{line}  [{note}]"
+    lines = [line]
 
     for attr in ("child", "left", "right"):
         child = getattr(node, attr, None)
@@ -52,7 +64,7 @@ def format_plan(node: LogicalNode, indent: int = 0) -> str:
             and isinstance(child, LogicalNode)
             and type(child) is not LogicalNode
         ):
-            lines.append(format_plan(child, indent + 1))
+            lines.append(format_plan(child, indent + 1, annotate))
 
     return "\n".join(lines)
 
@@ -65,6 +77,10 @@ def _node_detail(node: LogicalNode) -> str:
             parts.append(f"format={node.format}")
         if node.columns:
             parts.append(f"columns={node.columns}")
+        if node.predicate is not None:
+            parts.append(f"predicate={node.predicate}")
+        if node.limit is not None:
+            parts.append(f"limit={node.limit}")
         return ", ".join(parts)
 
     if isinstance(node, Sink):
@@ -72,6 +88,12 @@ def _node_detail(node: LogicalNode) -> str:
         parts = [f"dest={dst}"]
         if node.format:
             parts.append(f"format={node.format}")
+        if node.partition_by:
+            parts.append(f"partition_by={node.partition_by}")
+        if node.max_rows_per_file:
+            parts.append(f"max_rows_per_file={node.max_rows_per_file}")
+        if node.write_options is not None:
+            parts.append(str(node.write_options))
         return ", ".join(parts)
 
     if hasattr(node, "expression") and node.expression is not None:
@@ -81,7 +103,13 @@ def _node_detail(node: LogicalNode) -> str:
         return f"query={node.query!r}"
 
     if isinstance(node, Join):
-        return f"on={node.left_on}/{node.right_on}, type={node.join_type}"
+        detail = (
+            f"on={','.join(node.left_on)}/{','.join(node.right_on)}, "
+            f"type={node.join_type}"
+        )
+        if node.build_side:
+            detail += f", build={node.build_side}"
+        return detail
 
     if isinstance(node, Aggregate):
         return f"keys={node.group_keys}, aggs={list(node.aggregations.keys())}"
@@ -89,6 +117,9 @@ def _node_detail(node: LogicalNode) -> str:
     if hasattr(node, "columns"):
         return f"columns={node.columns}"
 
+    if isinstance(node, TopK):
+        return f"keys={node.keys}, n={node.n}"
+
     if hasattr(node, "keys") and hasattr(node, "descending"):
         return f"keys={node.keys}"
 
@@ -7,12 +7,18 @@ from dataclasses import dataclass, field
 
 @dataclass
 class LogicalProperties:
-    """Properties tracked through the logical plan."""
+    """Properties tracked through the logical plan.
+
+    The ``estimated_*`` fields and ``columns`` are derived by the optimizer
+    (see :func:`barrow.optimizer.derive_properties`); ``None`` means unknown.
+    """
 
     group_keys: list[str] = field(default_factory=list)
     ordering: list[tuple[str, str]] = field(default_factory=list)
     source_format: str | None = None
     estimated_rows: int | None = None
+    estimated_bytes: int | None = None
+    columns: list[str] | None = None
     is_materialized: bool = False
     backend_hint: str | None = None
 
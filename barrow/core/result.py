@@ -2,51 +2,120 @@
 
 from __future__ import annotations
 
+from typing import Iterable, Iterator
+
 import pyarrow as pa
 
+from .errors import ExecutionError
 from .properties import LogicalProperties
 
 
 class ExecutionResult:
-    """Normalized result from the execution engine."""
+    """Normalized result from the execution engine.
+
+    A result either wraps a materialized :class:`pa.Table` or a lazy stream of
+    :class:`pa.RecordBatch` objects created with :meth:`from_batches`.  A
+    stream can be consumed once through :meth:`to_batches`; calling
+    :meth:`to_table` first materializes it so it can be read repeatedly.
+    """
 
     def __init__(
         self,
         table: pa.Table,
         properties: LogicalProperties | None = None,
     ) -> None:
-        self._table = table
+        self._table: pa.Table | None = table
+        self._schema = table.schema
+        self._batches: Iterator[pa.RecordBatch] | None = None
+        self._consumed = False
+        self._rows_streamed = 0
         self._properties = properties or LogicalProperties()
 
+    @classmethod
+    def from_batches(
+        cls,
+        schema: pa.Schema,
+        batches: Iterable[pa.RecordBatch],
+        properties: LogicalProperties | None = None,
+    ) -> ExecutionResult:
+        """Return a streaming result producing *batches* with *schema*."""
+        result = cls(schema.empty_table(), properties)
+        result._table = None
+        result._batches = iter(batches)
+        return result
+
+    @property
+    def is_streaming(self) -> bool:
+        """``True`` while the result is backed by an unmaterialized stream."""
+        return self._table is None
+
+    @property
+    def is_consumed(self) -> bool:
+        """``True`` once a streaming result's batches have been handed out."""
+        return self._table is None and self._consumed
+
+    def to_batches(self) -> Iterator[pa.RecordBatch]:
+        """Return an iterator over the result's record batches.
+
+        Streaming results can only be iterated once; the number of rows
+        pulled through the iterator remains available as :attr:`num_rows`.
+        """
+        if self._table is not None:
+            return iter(self._table.to_batches())
+        if self._consumed or self._batches is None:
+            raise ExecutionError("Result stream has already been consumed")
+        self._consumed = True
+        return self._count(self._batches)
+
+    def to_reader(self) -> pa.RecordBatchReader:
+        """Return the result as a :class:`pa.RecordBatchReader`."""
+        return pa.RecordBatchReader.from_batches(self._schema, self.to_batches())
+
     def to_table(self) -> pa.Table:
-        """Return the underlying Arrow table."""
+        """Return the underlying Arrow table, materializing a stream."""
+        if self._table is None:
+            batches = list(self.to_batches())
+            self._table = pa.Table.from_batches(batches, schema=self._schema)
         return self._table
 
+    def _count(self, batches: Iterator[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:
+        for batch in batches:
+            self._rows_streamed += batch.num_rows
+            yield batch
+
     @property
     def table(self) -> pa.Table:
-        return self._table
+        return self.to_table()
 
     @property
     def schema(self) -> pa.Schema:
-        return self._table.schema
+        return self._schema
 
     @property
     def num_rows(self) -> int:
-        return self._table.num_rows
+        if self._table is None and self._consumed:
+            return self._rows_streamed
+        return self.to_table().num_rows
 
     @property
     def num_columns(self) -> int:
-        return self._table.num_columns
+        return len(self._schema)
 
     @property
     def column_names(self) -> list[str]:
-        return self._table.column_names
+        return self._schema.names
 
     @property
     def properties(self) -> LogicalProperties:
         return self._properties
 
     def __repr__(self) -> str:
+        if self._table is None and not self._consumed:
+            return (
+                f"ExecutionResult(streaming, "
+                f"cols={self.num_columns}, "
+                f"columns={self.column_names})"
+            )
         return (
             f"ExecutionResult(rows={self.num_rows}, "
             f"cols={self.num_columns}, "
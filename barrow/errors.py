@@ -8,6 +8,7 @@ for backward compatibility.  New code should import directly from
 from .core.errors import (
     BarrowError,
     BarrowIOError,
+    CsvTypeError,
     ExecutionError,
     FrontendError,
     InvalidExpressionError,
@@ -19,6 +20,7 @@ from .core.errors import (
 __all__ = [
     "BarrowError",
     "BarrowIOError",
+    "CsvTypeError",
     "ExecutionError",
     "FrontendError",
     "InvalidExpressionError",
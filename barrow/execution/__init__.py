@@ -1,5 +1,14 @@
 """Execution engine for barrow."""
 
 from .engine import execute
+from .memory import memory_limit, parse_memory_limit, set_memory_limit
+from .stats import ExecutionStats, NodeStats
 
-__all__ = ["execute"]
+__all__ = [
+    "execute",
+    "ExecutionStats",
+    "NodeStats",
+    "memory_limit",
+    "parse_memory_limit",
+    "set_memory_limit",
+]
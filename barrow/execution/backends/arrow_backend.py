@@ -73,14 +73,31 @@ class ArrowBackend:
         self,
         left: pa.Table,
         right: pa.Table,
-        left_on: str,
-        right_on: str,
+        left_on: list[str],
+        right_on: list[str],
         join_type: str = "inner",
     ) -> ExecutionResult:
         from barrow.operations import join
 
         return ExecutionResult(join(left, right, left_on, right_on, join_type))
 
+    def execute_join_stream(
+        self,
+        probe: ExecutionResult,
+        build: pa.Table,
+        left_on: list[str],
+        right_on: list[str],
+        join_type: str = "inner",
+        build_side: str = "right",
+    ) -> ExecutionResult:
+        """Join the batches of *probe* against a hash table on *build*."""
+        from barrow.operations import join_batches
+
+        reader = join_batches(
+            probe.to_reader(), build, left_on, right_on, join_type, build_side
+        )
+        return ExecutionResult.from_batches(reader.schema, reader)
+
     def execute_groupby(self, table: pa.Table, keys: list[str]) -> ExecutionResult:
         from barrow.operations import groupby
 
@@ -10,7 +10,7 @@ from barrow.core.result import ExecutionResult
 class DuckDBBackend:
     """Execute operations using DuckDB."""
 
-    def execute_sql(self, table: pa.Table, query: str) -> ExecutionResult:
+    def execute_sql(self, table: pa.Table | None, query: str) -> ExecutionResult:
         from barrow.operations import sql
 
         return ExecutionResult(sql(table, query))
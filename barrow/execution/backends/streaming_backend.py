@@ -0,0 +1,138 @@
+"""Batch-at-a-time execution backend.
+
+Stateless operators (projection, filtering, mutation, grouping metadata and
+limits) are applied to each :class:`pa.RecordBatch` of their input as it is
+pulled, so a pipeline of such operators holds only one batch per operator in
+memory.  Top-k selection likewise folds each batch into a bounded set of
+candidate rows.  Filters and mutations whose expressions are not
+element-wise (e.g. ``cumsum(x)`` or ``x - mean(x)``), and mutations whose
+result type may vary between batches, run on the materialized input
+instead.  The per-batch work is delegated to :mod:`barrow.operations`, which
+keeps operating on :class:`pa.Table` objects.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterator
+
+import pyarrow as pa
+
+from barrow.core.result import ExecutionResult
+
+if TYPE_CHECKING:
+    from barrow.expr import Expression
+
+
+class StreamingBackend:
+    """Execute stateless plan operations on streams of record batches."""
+
+    def execute_project(
+        self, result: ExecutionResult, columns: list[str]
+    ) -> ExecutionResult:
+        from barrow.operations import select
+
+        return _map_batches(result, lambda table: select(table, columns))
+
+    def execute_filter(
+        self, result: ExecutionResult, expression: Expression
+    ) -> ExecutionResult:
+        from barrow.expr.compiler_arrow import is_elementwise
+        from barrow.operations import filter as op_filter
+
+        if not is_elementwise(expression):
+            return ExecutionResult(op_filter(result.to_table(), expression))
+        return _map_batches(result, lambda table: op_filter(table, expression))
+
+    def execute_mutate(
+        self, result: ExecutionResult, assignments: dict[str, Expression]
+    ) -> ExecutionResult:
+        from barrow.expr.compiler_arrow import is_arrow_typed, is_elementwise
+        from barrow.operations import mutate
+
+        if not all(
+            is_elementwise(expr) and is_arrow_typed(expr)
+            for expr in assignments.values()
+        ):
+            return ExecutionResult(mutate(result.to_table(), **assignments))
+        return _map_batches(result, lambda table: mutate(table, **assignments))
+
+    def execute_groupby(
+        self, result: ExecutionResult, keys: list[str]
+    ) -> ExecutionResult:
+        from barrow.operations import groupby
+
+        return _map_batches(result, lambda table: groupby(table, keys))
+
+    def execute_ungroup(self, result: ExecutionResult) -> ExecutionResult:
+        from barrow.operations import ungroup
+
+        return _map_batches(result, ungroup)
+
+    def execute_limit(self, result: ExecutionResult, n: int) -> ExecutionResult:
+        def _limited() -> Iterator[pa.RecordBatch]:
+            remaining = n
+            if remaining <= 0:
+                return
+            for batch in result.to_batches():
+                if batch.num_rows >= remaining:
+                    yield batch.slice(0, remaining)
+                    return
+                remaining -= batch.num_rows
+                yield batch
+
+        return ExecutionResult.from_batches(result.schema, _limited())
+
+    def execute_topk(
+        self,
+        result: ExecutionResult,
+        keys: list[str],
+        descending: list[bool],
+        n: int,
+    ) -> ExecutionResult:
+        """Select the top *n* rows while streaming, holding at most *n*
+        candidates plus one batch in memory."""
+        from barrow.operations import top_k
+
+        schema = result.schema
+        candidates = schema.empty_table()
+        for batch in result.to_batches():
+            batch_table = pa.Table.from_batches([batch], schema=schema)
+            # Candidates precede the batch, so ties still favour earlier rows.
+            combined = pa.concat_tables([candidates, batch_table])
+            candidates = top_k(combined, n, keys, descending)
+        return ExecutionResult(candidates)
+
+
+def _map_batches(
+    result: ExecutionResult, func: Callable[[pa.Table], pa.Table]
+) -> ExecutionResult:
+    """Apply *func* lazily to every batch of *result*.
+
+    The first batch is processed eagerly to learn the output schema, which
+    may depend on the data (e.g. the type of a mutated column).  An empty
+    input is processed as a single empty batch so the schema is still known.
+    Callers only stream functions whose output types follow from the input
+    types.  Later batches are still cast to the first schema, and the cast
+    fails rather than losing values if a type differs.
+    """
+    schema = result.schema
+    batches = result.to_batches()
+    first = next(batches, None)
+    if first is None:
+        first_out = func(schema.empty_table())
+    else:
+        first_out = func(pa.Table.from_batches([first], schema=schema))
+    out_schema = first_out.schema
+
+    def _rest() -> Iterator[pa.RecordBatch]:
+        yield from first_out.to_batches()
+        for batch in batches:
+            out = func(pa.Table.from_batches([batch], schema=schema))
+            if not out.schema.equals(out_schema, check_metadata=False):
+                out = out.cast(out_schema)
+            yield from out.to_batches()
+
+    return ExecutionResult.from_batches(out_schema, _rest())
+
+
+__all__ = ["StreamingBackend"]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 import os
 import sys
 import time
 
-from barrow.core.errors import ExecutionError
+from barrow.core.errors import CsvTypeError, ExecutionError
 from barrow.core.nodes import (
     Aggregate,
     Filter,
@@ -20,57 +22,113 @@ from barrow.core.nodes import (
     Sink,
     Sort,
     SqlQuery,
+    TopK,
     Ungroup,
     View,
     Window,
 )
 from barrow.core.result import ExecutionResult
 
+from . import spill
 from .backends.arrow_backend import ArrowBackend
 from .backends.duckdb_backend import DuckDBBackend
+from .backends.streaming_backend import StreamingBackend
+from .memory import memory_limit
+from .stats import ExecutionStats
 
 _arrow = ArrowBackend()
 _duckdb = DuckDBBackend()
+_streaming = StreamingBackend()
 
-_PROFILE = os.environ.get("BARROW_PROFILE") == "1"
+# Set while a plan is re-run reading its CSV files whole (see _exec_sink).
+_WHOLE_CSV: ContextVar[bool] = ContextVar("whole_csv", default=False)
 
 
-def execute(node: LogicalNode) -> ExecutionResult:
-    """Execute a logical plan tree and return the result."""
-    return _execute(node)
+def _profiling() -> bool:
+    """Return ``True`` if ``BARROW_PROFILE=1`` asks for timings on STDERR.
 
+    The variable is read per call because ``barrow serve`` adopts each
+    client's environment after this module is imported.
+    """
+    return os.environ.get("BARROW_PROFILE") == "1"
 
-def _execute(node: LogicalNode) -> ExecutionResult:
+
+def execute(node: LogicalNode, stats: ExecutionStats | None = None) -> ExecutionResult:
+    """Execute a logical plan tree and return the result.
+
+    Execution is pull-based: scans produce record batches and stateless
+    operators (Project, Filter, Mutate, GroupBy, Ungroup, Limit, View) process
+    them one batch at a time, so the returned result may be a stream.  Only
+    pipeline breakers (Sort, Aggregate, Window and SQL) materialize their
+    input as a table; TopK consumes its input stream while keeping only the
+    current top rows, and Join materializes its build side only.
+
+    With a memory budget (see :mod:`barrow.execution.memory`), Sort,
+    Aggregate, Join and SQL inputs larger than the budget are spilled to
+    disk instead (see :mod:`barrow.execution.spill`).
+
+    When *stats* is given, every node's time, row counts and memory use are
+    recorded in it as the plan runs.
+    """
+    return _execute(node, stats)
+
+
+def _execute(node: LogicalNode, stats: ExecutionStats | None) -> ExecutionResult:
+    if stats is not None:
+        return stats.measure(node, lambda: _execute_node(node, stats))
+    return _execute_node(node, stats)
+
+
+def _execute_node(node: LogicalNode, stats: ExecutionStats | None) -> ExecutionResult:
     if isinstance(node, Scan):
         return _exec_scan(node)
 
     if isinstance(node, Sink):
-        return _exec_sink(node)
+        return _exec_sink(node, stats)
 
     if isinstance(node, Join):
-        left_result = _execute(node.left)
-        right_result = _execute(node.right)
-        return _arrow.execute_join(
-            left_result.table,
-            right_result.table,
-            node.left_on,
-            node.right_on,
-            node.join_type,
-        )
+        return _exec_join(node, stats)
+
+    if isinstance(node, SqlQuery) and type(node.child) is LogicalNode:
+        return _exec_sql_source(node)
 
     # All other nodes have a single child
-    child_result = _execute(node.child)  # type: ignore[attr-defined]
-    table = child_result.table
+    child_result = _execute(node.child, stats)  # type: ignore[attr-defined]
 
+    # Stateless operators stream batch by batch.
     if isinstance(node, Project):
-        return _arrow.execute_project(table, node.columns)
+        return _streaming.execute_project(child_result, node.columns)
 
     if isinstance(node, Filter):
         assert node.expression is not None
-        return _arrow.execute_filter(table, node.expression)
+        return _streaming.execute_filter(child_result, node.expression)
 
     if isinstance(node, Mutate):
-        return _arrow.execute_mutate(table, node.assignments)
+        return _streaming.execute_mutate(child_result, node.assignments)
+
+    if isinstance(node, GroupBy):
+        return _streaming.execute_groupby(child_result, node.keys)
+
+    if isinstance(node, Ungroup):
+        return _streaming.execute_ungroup(child_result)
+
+    if isinstance(node, Limit):
+        return _streaming.execute_limit(child_result, node.n)
+
+    if isinstance(node, View):
+        return child_result
+
+    if isinstance(node, TopK):
+        return _streaming.execute_topk(child_result, node.keys, node.descending, node.n)
+
+    limit = memory_limit()
+    if limit is not None:
+        spilled = _exec_spilling(node, child_result, limit)
+        if spilled is not None:
+            return spilled
+
+    # Pipeline breakers materialize their input.
+    table = child_result.table
 
     if isinstance(node, Aggregate):
         return _arrow.execute_aggregate(table, node.group_keys, node.aggregations)
@@ -81,55 +139,196 @@ def _execute(node: LogicalNode) -> ExecutionResult:
     if isinstance(node, Window):
         return _arrow.execute_window(table, node.by, node.order_by, node.assignments)
 
-    if isinstance(node, GroupBy):
-        return _arrow.execute_groupby(table, node.keys)
+    if isinstance(node, SqlQuery):
+        return _duckdb.execute_sql(table, node.query)
 
-    if isinstance(node, Ungroup):
-        return _arrow.execute_ungroup(table)
+    raise ExecutionError(f"Unknown node type: {type(node).__name__}")
 
-    if isinstance(node, Limit):
-        return ExecutionResult(table.slice(0, node.n))
 
-    if isinstance(node, View):
-        return child_result
+def _exec_spilling(
+    node: LogicalNode, child_result: ExecutionResult, limit: int
+) -> ExecutionResult | None:
+    """Execute a pipeline breaker within *limit* bytes, if it can spill."""
+    if isinstance(node, Aggregate):
+        return spill.aggregate(
+            child_result,
+            node.group_keys,
+            lambda table: _arrow.execute_aggregate(
+                table, node.group_keys, node.aggregations
+            ).table,
+            limit,
+        )
+
+    if isinstance(node, Sort):
+        return spill.sort(child_result, node.keys, node.descending, limit)
 
     if isinstance(node, SqlQuery):
-        return _duckdb.execute_sql(table, node.query)
+        return spill.sql(child_result, node.query, limit)
+
+    return None
 
-    raise ExecutionError(f"Unknown node type: {type(node).__name__}")
+
+def _exec_sql_source(node: SqlQuery) -> ExecutionResult:
+    """Execute a SQL query that reads its input files itself."""
+    limit = memory_limit()
+    if limit is not None:
+        return spill.sql(None, node.query, limit)
+    return _duckdb.execute_sql(None, node.query)
+
+
+def _exec_join(node: Join, stats: ExecutionStats | None) -> ExecutionResult:
+    """Execute a Join node as a hash join.
+
+    The build side is read into a table on a worker thread while the probe
+    side is opened, and the probe side is then streamed through the hash
+    table, so only the build side is held in memory.  Joins that need every
+    row of both sides (right and full outer joins) read both sides
+    concurrently and join the tables.  Under a memory budget, a build side
+    larger than the budget is joined partition by partition from disk.
+    """
+    from barrow.operations.join import can_stream
+
+    build_side = node.build_side or "right"
+    if build_side == "left":
+        build_node, probe_node = node.left, node.right
+    else:
+        build_node, probe_node = node.right, node.left
+    limit = memory_limit()
+    if limit is not None:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            buffered = pool.submit(_buffer, build_node, stats, limit // 2)
+            probe = _execute(probe_node, stats)
+            build = buffered.result()
+        return spill.join(
+            build,
+            probe,
+            node.left_on,
+            node.right_on,
+            node.join_type,
+            build_side,
+            limit,
+        )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        if not can_stream(node.join_type, build_side):
+            left = pool.submit(_materialize, node.left, stats)
+            right = pool.submit(_materialize, node.right, stats)
+            return _arrow.execute_join(
+                left.result(),
+                right.result(),
+                node.left_on,
+                node.right_on,
+                node.join_type,
+            )
+        build = pool.submit(_materialize, build_node, stats)
+        probe = _execute(probe_node, stats)
+        build_table = build.result()
+    return _arrow.execute_join_stream(
+        probe, build_table, node.left_on, node.right_on, node.join_type, build_side
+    )
+
+
+def _materialize(node: LogicalNode, stats: ExecutionStats | None):
+    return _execute(node, stats).table
+
+
+def _buffer(node: LogicalNode, stats: ExecutionStats | None, limit: int):
+    return spill.buffer(_execute(node, stats), limit)
 
 
 def _exec_scan(node: Scan) -> ExecutionResult:
-    """Execute a Scan node by reading from file or STDIN."""
-    t0 = time.perf_counter() if _PROFILE else 0.0
-    from barrow.io import read_table
-
-    table = read_table(node.path, node.format, node.delimiter)
-    if node.columns:
-        available = set(table.column_names)
-        cols = [c for c in node.columns if c in available]
-        if cols:
-            table = table.select(cols)
-    if _PROFILE:
+    """Execute a Scan node by opening a batch stream on a file or STDIN."""
+    profile = _profiling()
+    t0 = time.perf_counter() if profile else 0.0
+    from barrow.io import read_batches
+
+    predicate = None
+    if node.predicate is not None:
+        from barrow.expr import to_arrow
+
+        predicate = to_arrow(node.predicate)
+    reader = read_batches(
+        node.path,
+        node.format,
+        node.delimiter,
+        columns=node.columns,
+        predicate=predicate,
+        limit=node.limit,
+        whole_csv=_WHOLE_CSV.get(),
+    )
+    if profile:
         elapsed = time.perf_counter() - t0
         print(
-            f"BARROW_PROFILE: scan={elapsed:.4f}s rows={table.num_rows} cols={table.num_columns}",
+            f"BARROW_PROFILE: scan={elapsed:.4f}s cols={len(reader.schema)}",
             file=sys.stderr,
         )
-    return ExecutionResult(table)
+    return ExecutionResult.from_batches(reader.schema, reader)
+
 
+def _exec_sink(node: Sink, stats: ExecutionStats | None) -> ExecutionResult:
+    """Execute a Sink node by writing to file or STDOUT.
 
-def _exec_sink(node: Sink) -> ExecutionResult:
-    """Execute a Sink node by writing to file or STDOUT."""
-    child_result = _execute(node.child)
-    t0 = time.perf_counter() if _PROFILE else 0.0
-    from barrow.io import write_table
+    Streaming inputs are written batch by batch; the drained child result is
+    returned so callers can still inspect its schema and row count.
 
-    write_table(child_result.table, node.path, node.format, node.delimiter)
-    if _PROFILE:
+    CSV files are parsed block by block with column types inferred from the
+    first block.  If a later value does not fit, a plan writing to a file
+    and reading only files runs again with its CSV files read whole, which
+    infers the types from every row and overwrites the partial output.
+    """
+    profile = _profiling()
+    t0 = time.perf_counter() if profile else 0.0
+    try:
+        child_result, rows = _write_sink(node, stats)
+    except CsvTypeError:
+        if not node.path or _WHOLE_CSV.get() or _reads_stdin(node.child):
+            raise
+        token = _WHOLE_CSV.set(True)
+        try:
+            child_result, rows = _write_sink(node, stats)
+        finally:
+            _WHOLE_CSV.reset(token)
+    if profile:
         elapsed = time.perf_counter() - t0
         print(
-            f"BARROW_PROFILE: sink={elapsed:.4f}s rows={child_result.table.num_rows}",
+            f"BARROW_PROFILE: sink={elapsed:.4f}s rows={rows}",
             file=sys.stderr,
         )
     return child_result
+
+
+def _write_sink(
+    node: Sink, stats: ExecutionStats | None
+) -> tuple[ExecutionResult, int]:
+    child_result = _execute(node.child, stats)
+    from barrow.io import write_batches, write_dataset
+
+    if node.partition_by or node.max_rows_per_file:
+        rows = write_dataset(
+            child_result.to_reader(),
+            node.path,
+            node.format,
+            node.delimiter,
+            partition_by=node.partition_by,
+            max_rows_per_file=node.max_rows_per_file,
+            options=node.write_options,
+        )
+    else:
+        rows = write_batches(
+            child_result.to_reader(),
+            node.path,
+            node.format,
+            node.delimiter,
+            options=node.write_options,
+        )
+    return child_result, rows
+
+
+def _reads_stdin(node: LogicalNode) -> bool:
+    """Return ``True`` if a scan in the plan rooted at *node* reads ``STDIN``."""
+    if isinstance(node, Scan):
+        return not node.path
+    return any(
+        _reads_stdin(child)
+        for attr in ("child", "left", "right")
+        if isinstance(child := getattr(node, attr, None), LogicalNode)
+    )
@@ -0,0 +1,63 @@
+"""Memory budget for pipeline breakers."""
+
+from __future__ import annotations
+
+import os
+import re
+
+from barrow.core.errors import ExecutionError
+
+#: Environment variable holding the default memory budget.
+MEMORY_LIMIT_ENV = "BARROW_MEMORY_LIMIT"
+
+_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+_SIZE = re.compile(r"\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?\s*", re.IGNORECASE)
+
+_unset = object()
+_limit: object = _unset
+
+
+def parse_memory_limit(text: str) -> int:
+    """Return the number of bytes in a size such as ``"512M"`` or ``"4GiB"``.
+
+    Units are powers of 1024; a plain number is a byte count.
+    """
+    match = _SIZE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid memory size: {text!r}")
+    value, unit = match.groups()
+    size = int(float(value) * _UNITS[unit.lower()])
+    if size <= 0:
+        raise ValueError(f"Memory size must be positive: {text!r}")
+    return size
+
+
+def set_memory_limit(limit: int | None) -> None:
+    """Override the budget for this process; ``None`` restores the default."""
+    global _limit
+    _limit = _unset if limit is None else limit
+
+
+def memory_limit() -> int | None:
+    """Return the memory budget in bytes, or ``None`` when unlimited.
+
+    The budget set with :func:`set_memory_limit` wins over
+    ``BARROW_MEMORY_LIMIT``.
+    """
+    if _limit is not _unset:
+        return _limit  # type: ignore[return-value]
+    value = os.environ.get(MEMORY_LIMIT_ENV)
+    if not value:
+        return None
+    try:
+        return parse_memory_limit(value)
+    except ValueError as exc:
+        raise ExecutionError(f"{MEMORY_LIMIT_ENV}: {exc}") from exc
+
+
+__all__ = [
+    "MEMORY_LIMIT_ENV",
+    "memory_limit",
+    "parse_memory_limit",
+    "set_memory_limit",
+]
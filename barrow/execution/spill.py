@@ -0,0 +1,741 @@
+"""Out-of-core sort, aggregation and join under a memory budget.
+
+Pipeline breakers buffer their input up to a share of the budget (see
+:mod:`barrow.execution.memory`).  Inputs that fit are processed in memory as
+usual; larger ones are spilled as Arrow IPC files to a temporary directory
+(``TMPDIR``), which is removed once the result has been read:
+
+- Sort writes sorted runs and merges them.  Sorting copies its input
+  about twice, so runs hold a quarter of the budget.
+- Aggregate hash-partitions its rows on the group keys and aggregates one
+  partition at a time.
+- Join hash-partitions both sides on the join keys (grace hash join) and
+  joins one pair of partitions at a time.
+- SQL queries stream their input into DuckDB, which spills on its own.
+
+Partitions that still exceed half of the budget are split again on other
+bits of the row hash.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+import os
+import tempfile
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from barrow.core.result import ExecutionResult
+
+# Partitions created per level.  A power of two, so that every level uses
+# its own bits of the 64-bit row hash.
+_FANOUT_BITS = 4
+_FANOUT = 1 << _FANOUT_BITS
+_MAX_LEVEL = 64 // _FANOUT_BITS - 1
+
+#: Rows per record batch written to spill files.
+_SPILL_BATCH_ROWS = 16 * 1024
+
+#: Smallest number of rows a sorted run contributes to a merge step.
+_MIN_MERGE_ROWS = 1024
+
+#: Smallest budget given to DuckDB, which needs a few blocks per thread.
+_DUCKDB_MIN_MEMORY = 32 << 20
+
+
+@dataclass
+class Buffered:
+    """The leading batches of a stream, read up to a byte budget.
+
+    ``rest`` continues the stream after ``batches``; it is ``None`` when the
+    whole stream fit in the budget.
+    """
+
+    schema: pa.Schema
+    batches: deque[pa.RecordBatch]
+    rest: Iterator[pa.RecordBatch] | None
+
+    @property
+    def fits(self) -> bool:
+        return self.rest is None
+
+    def table(self) -> pa.Table:
+        return pa.Table.from_batches(self.batches, schema=self.schema)
+
+    def drain(self) -> Iterator[pa.RecordBatch]:
+        """Yield every batch of the stream, releasing the buffered ones."""
+        while self.batches:
+            yield self.batches.popleft()
+        if self.rest is not None:
+            yield from self.rest
+
+
+def buffer(result: ExecutionResult, limit: int) -> Buffered:
+    """Read batches of *result* until they hold more than *limit* bytes."""
+    batches = result.to_batches()
+    buffered: deque[pa.RecordBatch] = deque()
+    size = 0
+    for batch in batches:
+        buffered.append(batch)
+        size += batch.nbytes
+        if size > limit:
+            return Buffered(result.schema, buffered, batches)
+    return Buffered(result.schema, buffered, None)
+
+
+# ---- Sort ---------------------------------------------------------------
+
+
+def sort(
+    result: ExecutionResult,
+    keys: list[str],
+    descending: list[bool] | None,
+    limit: int,
+) -> ExecutionResult:
+    """Sort *result* like :func:`barrow.operations.sort` within *limit* bytes.
+
+    Ties keep their input order, as with the in-memory sort.
+    """
+    from barrow.operations import sort as sort_table
+
+    buffered = buffer(result, limit // 4)
+    if buffered.fits:
+        return ExecutionResult(sort_table(buffered.table(), keys, descending))
+    return ExecutionResult.from_batches(
+        buffered.schema, _external_sort(buffered, keys, descending, limit)
+    )
+
+
+def _external_sort(
+    buffered: Buffered,
+    keys: list[str],
+    descending: list[bool] | None,
+    limit: int,
+) -> Iterator[pa.RecordBatch]:
+    from barrow.operations import sort as sort_table
+
+    schema = buffered.schema
+    with _SpillDirectory() as spill:
+        runs = []
+        batches = buffered.drain()
+        while run := _take_bytes(batches, limit // 4):
+            table = sort_table(
+                pa.Table.from_batches(run, schema=schema), keys, descending
+            )
+            del run
+            runs.append(spill.write(schema, table.to_batches(_SPILL_BATCH_ROWS)))
+            del table
+        yield from _merge_runs(runs, schema, keys, descending, limit)
+
+
+def _take_bytes(batches: Iterator[pa.RecordBatch], limit: int) -> list[pa.RecordBatch]:
+    taken, size = [], 0
+    for batch in batches:
+        taken.append(batch)
+        size += batch.nbytes
+        if size > limit:
+            break
+    return taken
+
+
+def _merge_runs(
+    runs: list[_SpillFile],
+    schema: pa.Schema,
+    keys: list[str],
+    descending: list[bool] | None,
+    limit: int,
+) -> Iterator[pa.RecordBatch]:
+    """Merge sorted *runs*, loading about a quarter of *limit* per step.
+
+    Every step loads the next rows of the runs that are running low and
+    sorts them together with the rows left over from the previous step.  The
+    run whose last loaded row sorts first bounds the step: no row still on
+    disk can sort before it, so everything up to that row is emitted.  The
+    run index and the row position break ties, which keeps equal keys in
+    input order.
+    """
+    run_col = _unique_name(schema.names, "__barrow_run")
+    pos_col = _unique_name([*schema.names, run_col], "__barrow_pos")
+    sort_keys = _sort_keys(keys, descending) + [
+        (run_col, "ascending"),
+        (pos_col, "ascending"),
+    ]
+    chunk_bytes = max(limit // (4 * len(runs)), 1)
+    readers = [
+        _RunReader(run, index, run_col, pos_col, chunk_bytes)
+        for index, run in enumerate(runs)
+    ]
+    pending = np.zeros(len(readers), dtype=np.int64)
+    carry: pa.Table | None = None
+    while True:
+        tables = [carry] if carry is not None else []
+        for reader in readers:
+            if not reader.exhausted and pending[reader.index] * 2 < reader.chunk_rows:
+                chunk = reader.read()
+                if chunk is not None:
+                    tables.append(chunk)
+        merged = pa.concat_tables(tables)
+        merged = merged.take(pc.sort_indices(merged, sort_keys=sort_keys))
+        active = [reader.last for reader in readers if not reader.exhausted]
+        if not active:
+            yield from _drop_columns(merged, [run_col, pos_col], schema)
+            return
+        lasts = pa.concat_tables(active)
+        bound = pc.sort_indices(lasts, sort_keys=sort_keys)[0].as_py()
+        mask = pc.and_(
+            pc.equal(merged[run_col], lasts[run_col][bound]),
+            pc.equal(merged[pos_col], lasts[pos_col][bound]),
+        )
+        end = pc.index(mask, True).as_py() + 1
+        carry = merged.slice(end)
+        pending = np.bincount(
+            carry[run_col].to_numpy().astype(np.intp), minlength=len(readers)
+        )
+        yield from _drop_columns(merged.slice(0, end), [run_col, pos_col], schema)
+
+
+class _RunReader:
+    """Read a sorted run in chunks, tagging rows with their run and position."""
+
+    def __init__(
+        self, run: _SpillFile, index: int, run_col: str, pos_col: str, chunk_bytes: int
+    ) -> None:
+        self.index = index
+        self.exhausted = False
+        self.last: pa.Table | None = None
+        self.chunk_rows = max(
+            _MIN_MERGE_ROWS, chunk_bytes * run.num_rows // max(run.nbytes, 1)
+        )
+        self._reader = run.open()
+        self._next = 0
+        self._position = 0
+        self._run_col = run_col
+        self._pos_col = pos_col
+
+    def read(self) -> pa.Table | None:
+        batches, rows = [], 0
+        while self._next < self._reader.num_record_batches and rows < self.chunk_rows:
+            batch = self._reader.get_batch(self._next)
+            self._next += 1
+            batches.append(batch)
+            rows += batch.num_rows
+        self.exhausted = self._next >= self._reader.num_record_batches
+        if not rows:
+            return None
+        table = pa.Table.from_batches(batches, schema=self._reader.schema)
+        table = table.append_column(
+            self._run_col, pa.array(np.full(rows, self.index, dtype=np.int32))
+        ).append_column(
+            self._pos_col,
+            pa.array(np.arange(self._position, self._position + rows, dtype=np.int64)),
+        )
+        self._position += rows
+        self.last = table.slice(rows - 1)
+        return table
+
+
+def _sort_keys(keys: list[str], descending: list[bool] | None) -> list[tuple[str, str]]:
+    descending = descending or []
+    return [
+        (key, "descending" if i < len(descending) and descending[i] else "ascending")
+        for i, key in enumerate(keys)
+    ]
+
+
+def _unique_name(names: list[str], name: str) -> str:
+    while name in names:
+        name = f"_{name}"
+    return name
+
+
+def _drop_columns(
+    table: pa.Table, columns: list[str], schema: pa.Schema
+) -> Iterator[pa.RecordBatch]:
+    table = table.drop_columns(columns).replace_schema_metadata(schema.metadata)
+    return iter(table.to_batches())
+
+
+# ---- Aggregate ----------------------------------------------------------
+
+
+def aggregate(
+    result: ExecutionResult,
+    group_keys: list[str],
+    aggregate_table: Callable[[pa.Table], pa.Table],
+    limit: int,
+) -> ExecutionResult:
+    """Apply *aggregate_table* to *result* within *limit* bytes.
+
+    Inputs larger than the budget are hash-partitioned on *group_keys*, or
+    on the ``grouped_by`` keys of their metadata, so every group lies in one
+    partition; the groups come out in partition order.
+    """
+    buffered = buffer(result, limit // 2)
+    keys = group_keys or _grouped_by(buffered.schema)
+    if buffered.fits or not keys:
+        table = pa.Table.from_batches(buffered.drain(), schema=buffered.schema)
+        return ExecutionResult(aggregate_table(table))
+    schema = aggregate_table(buffered.schema.empty_table()).schema
+    return ExecutionResult.from_batches(
+        schema, _partitioned_aggregate(buffered, keys, aggregate_table, limit)
+    )
+
+
+def _partitioned_aggregate(
+    buffered: Buffered,
+    keys: list[str],
+    aggregate_table: Callable[[pa.Table], pa.Table],
+    limit: int,
+) -> Iterator[pa.RecordBatch]:
+    schema = buffered.schema
+    with _SpillDirectory() as spill:
+        parts = _partition(spill, schema, buffered.drain(), keys, 0)
+        yield from _aggregate_parts(
+            spill, schema, parts, keys, aggregate_table, limit, 0
+        )
+
+
+def _aggregate_parts(
+    spill: _SpillDirectory,
+    schema: pa.Schema,
+    parts: list[_SpillFile | None],
+    keys: list[str],
+    aggregate_table: Callable[[pa.Table], pa.Table],
+    limit: int,
+    level: int,
+) -> Iterator[pa.RecordBatch]:
+    for part in parts:
+        if part is None:
+            continue
+        if part.nbytes > limit // 2 and level < _MAX_LEVEL:
+            subparts = _partition(spill, schema, part.batches(), keys, level + 1)
+            part.remove()
+            yield from _aggregate_parts(
+                spill, schema, subparts, keys, aggregate_table, limit, level + 1
+            )
+            continue
+        table = part.read()
+        part.remove()
+        yield from aggregate_table(table).to_batches()
+
+
+def _grouped_by(schema: pa.Schema) -> list[str]:
+    grouped = (schema.metadata or {}).get(b"grouped_by")
+    return grouped.decode().split(",") if grouped else []
+
+
+# ---- Join ---------------------------------------------------------------
+
+
+def join(
+    build: Buffered,
+    probe: ExecutionResult,
+    left_on: list[str],
+    right_on: list[str],
+    join_type: str,
+    build_side: str,
+    limit: int,
+) -> ExecutionResult:
+    """Join a buffered *build* side with *probe* within *limit* bytes.
+
+    A build side that fits is used as the hash table of a streaming join,
+    as without a budget.  Otherwise both sides are hash-partitioned on their
+    keys and joined one partition pair at a time.  Joins that need both
+    sides in memory (right and full outer joins) do the same unless both
+    fit.
+    """
+    from barrow.operations.join import can_stream, join_batches
+
+    if build.fits and can_stream(join_type, build_side):
+        reader = join_batches(
+            probe.to_reader(), build.table(), left_on, right_on, join_type, build_side
+        )
+        return ExecutionResult.from_batches(reader.schema, reader)
+
+    if build.fits:
+        probed = buffer(probe, limit // 2)
+        if probed.fits:
+            return ExecutionResult(
+                _join_pair(
+                    build.table(),
+                    probed.table(),
+                    left_on,
+                    right_on,
+                    join_type,
+                    build_side,
+                )
+            )
+    else:
+        probed = Buffered(probe.schema, deque(), probe.to_batches())
+
+    schema = _join_pair(
+        build.schema.empty_table(),
+        probed.schema.empty_table(),
+        left_on,
+        right_on,
+        join_type,
+        build_side,
+    ).schema
+
+    def join_pair(build_table: pa.Table, probe_table: pa.Table) -> pa.Table:
+        table = _join_pair(
+            build_table, probe_table, left_on, right_on, join_type, build_side
+        )
+        return table if table.schema == schema else table.cast(schema)
+
+    build_keys, probe_keys = (
+        (left_on, right_on) if build_side == "left" else (right_on, left_on)
+    )
+    return ExecutionResult.from_batches(
+        schema,
+        _grace_join(build, probed, build_keys, probe_keys, join_pair, limit),
+    )
+
+
+def _join_pair(
+    build: pa.Table,
+    probe: pa.Table,
+    left_on: list[str],
+    right_on: list[str],
+    join_type: str,
+    build_side: str,
+) -> pa.Table:
+    from barrow.operations import join as join_tables
+
+    left, right = (build, probe) if build_side == "left" else (probe, build)
+    return join_tables(left, right, left_on, right_on, join_type)
+
+
+def _grace_join(
+    build: Buffered,
+    probe: Buffered,
+    build_keys: list[str],
+    probe_keys: list[str],
+    join_pair: Callable[[pa.Table, pa.Table], pa.Table],
+    limit: int,
+) -> Iterator[pa.RecordBatch]:
+    with _SpillDirectory() as spill:
+        build_parts = _partition(spill, build.schema, build.drain(), build_keys, 0)
+        probe_parts = _partition(spill, probe.schema, probe.drain(), probe_keys, 0)
+        yield from _join_parts(
+            spill,
+            (build.schema, probe.schema),
+            (build_parts, probe_parts),
+            (build_keys, probe_keys),
+            join_pair,
+            limit,
+            0,
+        )
+
+
+def _join_parts(
+    spill: _SpillDirectory,
+    schemas: tuple[pa.Schema, pa.Schema],
+    parts: tuple[list[_SpillFile | None], list[_SpillFile | None]],
+    keys: tuple[list[str], list[str]],
+    join_pair: Callable[[pa.Table, pa.Table], pa.Table],
+    limit: int,
+    level: int,
+) -> Iterator[pa.RecordBatch]:
+    build_schema, probe_schema = schemas
+    build_keys, probe_keys = keys
+    for build, probe in zip(*parts):
+        if build is None and probe is None:
+            continue
+        if build is not None and build.nbytes > limit // 2 and level < _MAX_LEVEL:
+            subparts = (
+                _partition(spill, build_schema, build.batches(), build_keys, level + 1),
+                _partition(
+                    spill,
+                    probe_schema,
+                    probe.batches() if probe is not None else iter(()),
+                    probe_keys,
+                    level + 1,
+                ),
+            )
+            build.remove()
+            if probe is not None:
+                probe.remove()
+            yield from _join_parts(
+                spill, schemas, subparts, keys, join_pair, limit, level + 1
+            )
+            continue
+        build_table = build.read() if build is not None else build_schema.empty_table()
+        probe_table = probe.read() if probe is not None else probe_schema.empty_table()
+        yield from join_pair(build_table, probe_table).to_batches()
+        for part in (build, probe):
+            if part is not None:
+                part.remove()
+
+
+# ---- SQL ----------------------------------------------------------------
+
+
+def sql(result: ExecutionResult | None, query: str, limit: int) -> ExecutionResult:
+    """Run *query* over *result* in DuckDB, spilling beyond *limit* bytes.
+
+    *result* is ``None`` for queries that read their own inputs.  Budgets
+    below ``_DUCKDB_MIN_MEMORY`` are raised to it.
+    """
+    from barrow.operations.sql import sql_batches
+
+    directory = tempfile.TemporaryDirectory(
+        prefix="barrow-spill-", ignore_cleanup_errors=True
+    )
+    reader = sql_batches(
+        None if result is None else result.to_reader(),
+        query,
+        max(limit, _DUCKDB_MIN_MEMORY),
+        directory.name,
+    )
+
+    def _batches() -> Iterator[pa.RecordBatch]:
+        with directory:
+            yield from reader
+
+    return ExecutionResult.from_batches(reader.schema, _batches())
+
+
+# ---- Partitioning and spill files -----------------------------------------
+
+
+def _partition(
+    spill: _SpillDirectory,
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch],
+    keys: list[str],
+    level: int,
+) -> list[_SpillFile | None]:
+    """Write *batches* to one spill file per hash partition of *keys*."""
+    files: list[_SpillFile | None] = [None] * _FANOUT
+    shift = np.uint64(level * _FANOUT_BITS)
+    mask = np.uint64(_FANOUT - 1)
+    try:
+        for piece in _rebatch(schema, batches):
+            ids = ((_hash_rows(piece, keys) >> shift) & mask).astype(np.intp)
+            order = np.argsort(ids, kind="stable")
+            counts = np.bincount(ids, minlength=_FANOUT)
+            piece = piece.take(pa.array(order))
+            start = 0
+            for index, count in enumerate(counts):
+                if not count:
+                    continue
+                if files[index] is None:
+                    files[index] = spill.create(schema)
+                files[index].write(piece.slice(start, count))  # type: ignore[union-attr]
+                start += count
+    finally:
+        for file in files:
+            if file is not None:
+                file.close()
+    return files
+
+
+def _rebatch(
+    schema: pa.Schema, batches: Iterable[pa.RecordBatch]
+) -> Iterator[pa.RecordBatch]:
+    """Yield *batches* as batches of about ``_SPILL_BATCH_ROWS`` rows."""
+    pending: list[pa.RecordBatch] = []
+    rows = 0
+    for batch in batches:
+        if rows + batch.num_rows < _SPILL_BATCH_ROWS:
+            pending.append(batch)
+            rows += batch.num_rows
+            continue
+        table = pa.Table.from_batches([*pending, batch], schema=schema)
+        pending, rows = [], 0
+        for offset in range(0, table.num_rows, _SPILL_BATCH_ROWS):
+            piece = table.slice(offset, _SPILL_BATCH_ROWS)
+            if piece.num_rows < _SPILL_BATCH_ROWS:
+                pending = piece.to_batches()
+                rows = piece.num_rows
+            else:
+                yield piece.combine_chunks().to_batches()[0]
+    if rows:
+        yield pa.Table.from_batches(
+            pending, schema=schema
+        ).combine_chunks().to_batches()[0]
+
+
+class _SpillDirectory:
+    """Temporary directory holding the spill files of one operator."""
+
+    def __init__(self) -> None:
+        self._directory = tempfile.TemporaryDirectory(
+            prefix="barrow-spill-", ignore_cleanup_errors=True
+        )
+        self._count = 0
+
+    def __enter__(self) -> _SpillDirectory:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._directory.cleanup()
+
+    def create(self, schema: pa.Schema) -> _SpillFile:
+        self._count += 1
+        path = os.path.join(self._directory.name, f"spill-{self._count}.arrow")
+        return _SpillFile(path, schema)
+
+    def write(self, schema: pa.Schema, batches: Iterable[pa.RecordBatch]) -> _SpillFile:
+        file = self.create(schema)
+        for batch in batches:
+            file.write(batch)
+        file.close()
+        return file
+
+
+class _SpillFile:
+    """An Arrow IPC file of spilled batches, read back memory-mapped.
+
+    Small batches are gathered into batches of about ``_SPILL_BATCH_ROWS``
+    rows before they are written.
+    """
+
+    def __init__(self, path: str, schema: pa.Schema) -> None:
+        self.path = path
+        self.num_rows = 0
+        self.nbytes = 0
+        self._schema = schema
+        self._pending: list[pa.RecordBatch] = []
+        self._pending_rows = 0
+        self._writer: pa.ipc.RecordBatchFileWriter | None = pa.ipc.new_file(
+            path, schema
+        )
+
+    def write(self, batch: pa.RecordBatch) -> None:
+        self.num_rows += batch.num_rows
+        self.nbytes += batch.nbytes
+        if batch.num_rows >= _SPILL_BATCH_ROWS:
+            self._flush()
+            self._writer.write_batch(batch)  # type: ignore[union-attr]
+            return
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        if self._pending_rows >= _SPILL_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            table = pa.Table.from_batches(self._pending, schema=self._schema)
+            self._writer.write_table(table.combine_chunks())  # type: ignore[union-attr]
+            self._pending, self._pending_rows = [], 0
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+
+    def open(self) -> pa.ipc.RecordBatchFileReader:
+        return pa.ipc.open_file(pa.memory_map(self.path))
+
+    def batches(self) -> Iterator[pa.RecordBatch]:
+        reader = self.open()
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+
+    def read(self) -> pa.Table:
+        return self.open().read_all()
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+# ---- Row hashing --------------------------------------------------------
+
+_NULL_HASH = np.uint64(0x2545F4914F6CDD1D)
+_COMBINE = np.uint64(0x9E3779B97F4A7C15)
+_BYTE_PRIME = 0x100000001B3
+_BYTE_PRIME_INVERSE = pow(_BYTE_PRIME, -1, 1 << 64)
+
+
+def _hash_rows(batch: pa.RecordBatch, keys: list[str]) -> np.ndarray:
+    """Return a 64-bit hash of the *keys* of every row of *batch*.
+
+    Equal values hash equally across batches and across integer widths,
+    so both sides of a join partition alike.
+    """
+    hashes = np.zeros(batch.num_rows, dtype=np.uint64)
+    for key in keys:
+        hashes = _mix(hashes * _COMBINE + _hash_array(batch.column(key)))
+    return hashes
+
+
+def _hash_array(array: pa.Array) -> np.ndarray:
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    data_type = array.type
+    if pa.types.is_integer(data_type) or pa.types.is_boolean(data_type):
+        values = pc.cast(array, pa.int64(), safe=False).fill_null(0)
+        hashes = values.to_numpy(zero_copy_only=False).view(np.uint64)
+    elif pa.types.is_floating(data_type):
+        values = pc.cast(array, pa.float64()).fill_null(0.0)
+        # Adding 0.0 turns -0.0 into 0.0, which compares equal to it.
+        hashes = (values.to_numpy(zero_copy_only=False) + 0.0).view(np.uint64)
+    elif pa.types.is_temporal(data_type) and data_type.bit_width in (32, 64):
+        values = array.view(pa.int32() if data_type.bit_width == 32 else pa.int64())
+        width = np.array([data_type.bit_width], dtype=np.uint64)
+        return _hash_array(values) ^ _mix(width)
+    elif (
+        pa.types.is_string(data_type)
+        or pa.types.is_binary(data_type)
+        or (pa.types.is_large_string(data_type) or pa.types.is_large_binary(data_type))
+    ):
+        hashes = _hash_bytes(pc.cast(array, pa.large_binary()))
+    else:
+        hashes = np.array(
+            [hash(value) & 0xFFFFFFFFFFFFFFFF for value in array.to_pylist()],
+            dtype=np.uint64,
+        )
+    hashes = _mix(hashes.copy())
+    if array.null_count:
+        hashes[array.is_null().to_numpy(zero_copy_only=False)] = _NULL_HASH
+    return hashes
+
+
+def _hash_bytes(array: pa.LargeBinaryArray) -> np.ndarray:
+    """Polynomial hash of every value of *array*, computed with prefix sums."""
+    _, offsets_buffer, data_buffer = array.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=np.int64)[
+        array.offset : array.offset + len(array) + 1
+    ]
+    start, end = int(offsets[0]), int(offsets[-1])
+    data = (
+        np.frombuffer(data_buffer, dtype=np.uint8)[start:end].astype(np.uint64)
+        if data_buffer is not None
+        else np.zeros(0, dtype=np.uint64)
+    )
+    offsets = offsets - start
+    size = end - start
+    powers = np.ones(size + 1, dtype=np.uint64)
+    inverse = np.ones(size + 1, dtype=np.uint64)
+    if size:
+        powers[1:] = np.cumprod(np.full(size, _BYTE_PRIME, dtype=np.uint64))
+        inverse[1:] = np.cumprod(np.full(size, _BYTE_PRIME_INVERSE, dtype=np.uint64))
+    prefix = np.zeros(size + 1, dtype=np.uint64)
+    np.cumsum(data * powers[:size], out=prefix[1:])
+    starts, ends = offsets[:-1], offsets[1:]
+    # Dividing by the power at the value's start makes the hash independent
+    # of where the value lies in the buffer.
+    hashes = (prefix[ends] - prefix[starts]) * inverse[starts]
+    return hashes + (ends - starts).astype(np.uint64) * _COMBINE
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer: spread every input bit over the whole hash."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+__all__ = ["Buffered", "aggregate", "buffer", "join", "sort", "sql"]
@@ -0,0 +1,158 @@
+"""Per-operator runtime statistics for ``explain --analyze``."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+import pyarrow as pa
+
+from barrow.core.nodes import LogicalNode, Scan, SqlQuery
+from barrow.core.result import ExecutionResult
+
+
+@dataclass
+class NodeStats:
+    """Measurements collected for one plan node.
+
+    Times are inclusive of the node's inputs; :meth:`ExecutionStats.describe`
+    reports them exclusive of the child nodes.  CPU time is process-wide, so
+    it includes Arrow and DuckDB worker threads.  The memory peak is the
+    Arrow memory pool's high-water mark while the node was running, inputs
+    included.  The backend is the engine, ``arrow`` or ``duckdb``, that
+    executed the node.
+    """
+
+    backend: str = ""
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    rows: int = 0
+    batches: int = 0
+    bytes: int = 0
+    peak_memory: int = 0
+
+    def record_memory(self, high_water: int) -> None:
+        """Update the peak after a run that began at pool peak *high_water*.
+
+        The pool's peak cannot be reset, so it only measures a run that
+        exceeded every earlier allocation; otherwise the memory still
+        allocated at the end of the run is the best estimate.
+        """
+        pool = pa.default_memory_pool()
+        peak = pool.max_memory()
+        if peak <= high_water:
+            peak = pool.bytes_allocated()
+        self.peak_memory = max(self.peak_memory, peak)
+
+
+class ExecutionStats:
+    """Collect :class:`NodeStats` for the nodes of an executing plan."""
+
+    def __init__(self) -> None:
+        self._stats: dict[int, NodeStats] = {}
+
+    def get(self, node: LogicalNode) -> NodeStats | None:
+        """Return the statistics recorded for *node*, if it ran."""
+        return self._stats.get(id(node))
+
+    def measure(
+        self, node: LogicalNode, run: Callable[[], ExecutionResult]
+    ) -> ExecutionResult:
+        """Execute *run* for *node*, recording time, rows and memory.
+
+        Streaming results are wrapped so the time spent producing each batch
+        is attributed to *node* as the batches are pulled.
+        """
+        stats = self._stats.setdefault(id(node), NodeStats(backend=_backend(node)))
+        wall, cpu = time.perf_counter(), time.process_time()
+        high_water = pa.default_memory_pool().max_memory()
+        result = run()
+        stats.wall_time += time.perf_counter() - wall
+        stats.cpu_time += time.process_time() - cpu
+        stats.record_memory(high_water)
+        if result.is_streaming and not result.is_consumed:
+            batches = self._instrument(stats, result.to_batches())
+            return ExecutionResult.from_batches(
+                result.schema, batches, result.properties
+            )
+        if result.is_streaming:
+            stats.rows = result.num_rows
+        else:
+            table = result.table
+            stats.rows = table.num_rows
+            stats.batches = len(table.to_batches())
+            stats.bytes = table.nbytes
+        return result
+
+    def _instrument(
+        self, stats: NodeStats, batches: Iterator[pa.RecordBatch]
+    ) -> Iterator[pa.RecordBatch]:
+        while True:
+            wall, cpu = time.perf_counter(), time.process_time()
+            high_water = pa.default_memory_pool().max_memory()
+            batch = next(batches, None)
+            stats.wall_time += time.perf_counter() - wall
+            stats.cpu_time += time.process_time() - cpu
+            stats.record_memory(high_water)
+            if batch is None:
+                return
+            stats.rows += batch.num_rows
+            stats.batches += 1
+            stats.bytes += batch.nbytes
+            yield batch
+
+    def describe(self, node: LogicalNode) -> str:
+        """Return a one-line summary of *node*'s statistics for plan output."""
+        stats = self.get(node)
+        if stats is None:
+            return ""
+        wall, cpu = stats.wall_time, stats.cpu_time
+        rows_in = 0
+        for child in _children(node):
+            child_stats = self.get(child)
+            if child_stats is not None:
+                wall -= child_stats.wall_time
+                cpu -= child_stats.cpu_time
+                rows_in += child_stats.rows
+        parts = [f"backend={stats.backend}"]
+        parts.append(f"wall={max(wall, 0.0) * 1000:.2f}ms")
+        parts.append(f"cpu={max(cpu, 0.0) * 1000:.2f}ms")
+        if not isinstance(node, Scan):
+            parts.append(f"rows_in={rows_in}")
+        parts.append(f"rows_out={stats.rows}")
+        parts.append(f"batches={stats.batches}")
+        parts.append(f"bytes={_format_bytes(stats.bytes)}")
+        parts.append(f"peak_mem={_format_bytes(stats.peak_memory)}")
+        return " ".join(parts)
+
+
+def _children(node: LogicalNode) -> list[LogicalNode]:
+    children = []
+    for attr in ("child", "left", "right"):
+        child = getattr(node, attr, None)
+        if (
+            child is not None
+            and isinstance(child, LogicalNode)
+            and type(child) is not LogicalNode
+        ):
+            children.append(child)
+    return children
+
+
+def _backend(node: LogicalNode) -> str:
+    # Only SQL queries run on DuckDB; every other node, including scans and
+    # sinks, runs on Arrow, batch by batch or on materialized tables.
+    return "duckdb" if isinstance(node, SqlQuery) else "arrow"
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GiB"
+
+
+__all__ = ["NodeStats", "ExecutionStats"]
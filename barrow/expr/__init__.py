@@ -15,6 +15,10 @@ from .parser import (
 )
 from .analyzer import referenced_names, validate_expression
 from .compiler import to_sql
+from .compiler_arrow import evaluate_arrow, to_arrow
+from .evaluator import compile_expression
+from .rewrite import eliminate_common_subexpressions, simplify_expression
+from .types import ExpressionType, infer_type
 
 __all__ = [
     "Expression",
@@ -27,4 +31,11 @@ __all__ = [
     "referenced_names",
     "validate_expression",
     "to_sql",
+    "to_arrow",
+    "evaluate_arrow",
+    "compile_expression",
+    "simplify_expression",
+    "eliminate_common_subexpressions",
+    "ExpressionType",
+    "infer_type",
 ]
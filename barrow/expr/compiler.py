@@ -15,12 +15,19 @@ from barrow.expr.parser import (
 def to_sql(expr: Expression) -> str:
     """Compile an expression to a SQL string fragment."""
     if isinstance(expr, Literal):
+        if isinstance(expr.value, (list, tuple, set, frozenset)):
+            values = ", ".join(to_sql(Literal(v)) for v in expr.value)
+            return f"({values})"
+        if expr.value is None:
+            return "NULL"
+        if isinstance(expr.value, bool):
+            return "TRUE" if expr.value else "FALSE"
         if isinstance(expr.value, str):
-            return f"'{expr.value}'"
+            return quote_string(expr.value)
         return str(expr.value)
 
     if isinstance(expr, Name):
-        return f'"{expr.identifier}"'
+        return quote_identifier(expr.identifier)
 
     if isinstance(expr, UnaryExpression):
         operand = to_sql(expr.operand)
@@ -40,6 +47,8 @@ def to_sql(expr: Expression) -> str:
             op = "="
         elif op == "!=":
             op = "<>"
+        elif op in ("in", "not in", "like"):
+            op = op.upper()
         return f"({left} {op} {right})"
 
     if isinstance(expr, FunctionCall):
@@ -47,3 +56,13 @@ def to_sql(expr: Expression) -> str:
         return f"{expr.name}({args})"
 
     return str(expr)
+
+
+def quote_identifier(name: str) -> str:
+    """Return *name* as a double-quoted SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_string(value: str) -> str:
+    """Return *value* as a single-quoted SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
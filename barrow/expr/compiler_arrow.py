@@ -0,0 +1,341 @@
+"""Compile expressions to Arrow compute expressions and kernel calls.
+
+:func:`to_arrow` builds a :class:`pyarrow.compute.Expression` that dataset
+scanners can evaluate.  :func:`evaluate_arrow` runs an expression directly
+on the columns of a table with :mod:`pyarrow.compute` kernels, so strings
+and nulls stay in Arrow buffers instead of being copied to NumPy.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from barrow.core.errors import InvalidExpressionError
+from barrow.expr.parser import (
+    Expression,
+    Name,
+    Literal,
+    UnaryExpression,
+    BinaryExpression,
+    FunctionCall,
+)
+
+# Arithmetic uses the unchecked kernels so overflow wraps like NumPy does.
+_ARROW_BINARY: dict[str, str] = {
+    "+": "add",
+    "-": "subtract",
+    "*": "multiply",
+    "/": "divide",
+    "**": "power",
+    "==": "equal",
+    "!=": "not_equal",
+    "<": "less",
+    "<=": "less_equal",
+    ">": "greater",
+    ">=": "greater_equal",
+    "and": "and_kleene",
+    "or": "or_kleene",
+}
+
+# Element-wise NumPy/math functions with an equivalent Arrow kernel.
+_ARROW_FUNCTIONS: dict[str, str] = {
+    "abs": "abs",
+    "sqrt": "sqrt",
+    "exp": "exp",
+    "log": "ln",
+    "log2": "log2",
+    "log10": "log10",
+    "log1p": "log1p",
+    "sin": "sin",
+    "cos": "cos",
+    "tan": "tan",
+    "arcsin": "asin",
+    "arccos": "acos",
+    "arctan": "atan",
+    "asin": "asin",
+    "acos": "acos",
+    "atan": "atan",
+    "floor": "floor",
+    "ceil": "ceil",
+    "trunc": "trunc",
+}
+
+
+# Operators matching a column against a literal pattern or value set.
+_ARROW_MATCHING = {"in", "not in", "like"}
+
+
+def to_arrow(expr: Expression) -> pc.Expression:
+    """Compile an expression to a :class:`pyarrow.compute.Expression`.
+
+    The result can be handed to :mod:`pyarrow.dataset` scanners as a
+    filter.  Only column references, scalar literals, arithmetic,
+    comparisons, boolean operators, and ``in``, ``not in`` and ``like``
+    against a literal are supported; anything else raises
+    :class:`InvalidExpressionError`.  Division always produces floating point
+    values, matching Python semantics.
+    """
+    if isinstance(expr, Literal):
+        if expr.value is None or not isinstance(expr.value, (bool, int, float, str)):
+            raise InvalidExpressionError(
+                f"Literal {expr.value!r} cannot be compiled to Arrow"
+            )
+        return pc.scalar(expr.value)
+
+    if isinstance(expr, Name):
+        return pc.field(expr.identifier)
+
+    if isinstance(expr, UnaryExpression):
+        operand = to_arrow(expr.operand)
+        if expr.op == "not":
+            return pc.invert(operand)
+        if expr.op == "-":
+            return pc.negate(operand)
+        return operand
+
+    if (
+        isinstance(expr, BinaryExpression)
+        and expr.op in _ARROW_MATCHING
+        and isinstance(expr.right, Literal)
+        and _matchable(expr.op, expr.right.value)
+    ):
+        return _match(to_arrow(expr.left), expr.op, expr.right.value)
+
+    if isinstance(expr, BinaryExpression):
+        func = _ARROW_BINARY.get(expr.op)
+        if func is None or expr.op == "**":
+            raise InvalidExpressionError(
+                f"Operator {expr.op!r} cannot be compiled to Arrow"
+            )
+        left = to_arrow(expr.left)
+        right = to_arrow(expr.right)
+        if expr.op == "/":
+            left = left.cast(pa.float64())
+        return getattr(pc, func)(left, right)
+
+    raise InvalidExpressionError(f"Expression {expr!r} cannot be compiled to Arrow")
+
+
+def evaluate_arrow(
+    expr: Expression,
+    table: pa.Table,
+    fallback: Callable[[Expression], Any],
+) -> Any:
+    """Evaluate *expr* on the columns of *table* with Arrow kernels.
+
+    ``in`` and ``not in`` look values up in a hash set built once per
+    literal sequence, and ``like`` matches a literal pattern with
+    ``match_like``.  Sub-expressions Arrow cannot evaluate (names that are
+    not columns, functions without a kernel, ``%`` and operations on
+    literals only) are handed to *fallback*, whose result is converted
+    back to Arrow.  Kernel errors for unsupported types are not caught, so
+    callers can retry the whole expression another way.
+
+    Returns a :class:`pa.ChunkedArray` or :class:`pa.Array` for expressions
+    over columns and a Python scalar otherwise.
+    """
+    if isinstance(expr, Literal):
+        return expr.value
+
+    if isinstance(expr, Name) and expr.identifier in table.column_names:
+        return table[expr.identifier]
+
+    if isinstance(expr, UnaryExpression) and expr.op in ("-", "+", "not"):
+        operand = evaluate_arrow(expr.operand, table, fallback)
+        if _is_arrow(operand):
+            if expr.op == "-":
+                return pc.negate(operand)
+            if expr.op == "not":
+                return pc.invert(operand)
+            return operand
+
+    elif isinstance(expr, BinaryExpression) and expr.op in _ARROW_BINARY:
+        left = evaluate_arrow(expr.left, table, fallback)
+        right = evaluate_arrow(expr.right, table, fallback)
+        if _is_arrow(left) or _is_arrow(right):
+            if expr.op == "/":
+                left, right = _as_float(left), _as_float(right)
+            if expr.op == "+" and (_is_string(left) or _is_string(right)):
+                return pc.binary_join_element_wise(left, right, "")
+            return getattr(pc, _ARROW_BINARY[expr.op])(left, right)
+
+    elif (
+        isinstance(expr, BinaryExpression)
+        and expr.op in _ARROW_MATCHING
+        and isinstance(expr.right, Literal)
+        and _matchable(expr.op, expr.right.value)
+    ):
+        left = evaluate_arrow(expr.left, table, fallback)
+        if _is_arrow(left):
+            return _match(left, expr.op, expr.right.value)
+
+    elif (
+        isinstance(expr, FunctionCall)
+        and expr.name in _ARROW_FUNCTIONS
+        and expr.name not in table.column_names
+        and len(expr.args) == 1
+    ):
+        arg = evaluate_arrow(expr.args[0], table, fallback)
+        if _is_arrow(arg):
+            return getattr(pc, _ARROW_FUNCTIONS[expr.name])(arg)
+
+    return _from_fallback(fallback(expr))
+
+
+def is_elementwise(expr: Expression) -> bool:
+    """Return ``True`` if every row of *expr* depends only on the same row.
+
+    Literals, names, operators and functions with an Arrow kernel qualify.
+    Other functions, such as NumPy's ``cumsum`` or ``mean``, may scan or
+    reduce the whole column, so evaluating them batch by batch is wrong.
+    """
+    if isinstance(expr, (Literal, Name)):
+        return True
+    if isinstance(expr, UnaryExpression):
+        return is_elementwise(expr.operand)
+    if isinstance(expr, BinaryExpression):
+        return is_elementwise(expr.left) and is_elementwise(expr.right)
+    if isinstance(expr, FunctionCall):
+        return expr.name in _ARROW_FUNCTIONS and all(
+            is_elementwise(arg) for arg in expr.args
+        )
+    return False
+
+
+def is_arrow_typed(expr: Expression) -> bool:
+    """Return ``True`` if Arrow kernels evaluate every operation of *expr*.
+
+    The result type then follows from the operand types alone.  Operations
+    handed to NumPy, such as ``%``, may change type with the values: an
+    integer column holding nulls becomes a float array.
+    """
+    if isinstance(expr, (Literal, Name)):
+        return True
+    if isinstance(expr, UnaryExpression):
+        return is_arrow_typed(expr.operand)
+    if isinstance(expr, BinaryExpression):
+        if expr.op in _ARROW_MATCHING:
+            return (
+                isinstance(expr.right, Literal)
+                and _matchable(expr.op, expr.right.value)
+                and is_arrow_typed(expr.left)
+            )
+        return (
+            expr.op in _ARROW_BINARY
+            and is_arrow_typed(expr.left)
+            and is_arrow_typed(expr.right)
+        )
+    if isinstance(expr, FunctionCall):
+        return (
+            expr.name in _ARROW_FUNCTIONS
+            and len(expr.args) == 1
+            and is_arrow_typed(expr.args[0])
+        )
+    return False
+
+
+def match_array(values: np.ndarray, op: str, operand: Any) -> np.ndarray | None:
+    """Apply ``in``, ``not in`` or ``like`` to a NumPy column.
+
+    The column is matched with the same kernels as Arrow columns, so both
+    share their null handling: a null is ``in`` a sequence that holds
+    ``None``, and ``like`` yields null for it.  Returns ``None`` if the
+    operand is not a pattern or sequence, or if Arrow cannot match the
+    column's values.
+    """
+    if not _matchable(op, operand):
+        return None
+    try:
+        result = _match(pa.array(values), op, operand)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    return result.to_numpy(zero_copy_only=False)
+
+
+def logical_array(op: str, *operands: Any) -> np.ndarray:
+    """Apply ``and``, ``or`` or ``not`` element-wise with Kleene logic.
+
+    Operands are NumPy arrays or scalars; ``None`` and null elements are
+    unknown, so ``False and None`` is ``False`` and ``True or None`` is
+    ``True``.  The result is a boolean array, of objects if it has nulls.
+    """
+    values = [_as_boolean(operand) for operand in operands]
+    if op == "not":
+        result = pc.invert(values[0])
+    else:
+        result = getattr(pc, _ARROW_BINARY[op])(*values)
+    if isinstance(result, pa.Scalar):
+        return np.asarray(result.as_py())
+    return result.to_numpy(zero_copy_only=False)
+
+
+def _as_boolean(value: Any) -> Any:
+    if isinstance(value, np.ndarray) and value.ndim:
+        array = pa.array(value, type=pa.bool_()) if value.dtype == object else None
+        return array if array is not None else pc.cast(pa.array(value), pa.bool_())
+    if isinstance(value, np.generic):
+        value = value.item()
+    return pa.scalar(None if value is None else bool(value), pa.bool_())
+
+
+def _matchable(op: str, operand: Any) -> bool:
+    if op == "like":
+        return isinstance(operand, str)
+    return isinstance(operand, (list, tuple, set, frozenset))
+
+
+def _match(values: Any, op: str, operand: Any) -> Any:
+    if op == "like":
+        return pc.match_like(values, operand)
+    found = pc.is_in(values, value_set=_value_set(_set_key(operand)))
+    return pc.invert(found) if op == "not in" else found
+
+
+def _set_key(values: Any) -> tuple[tuple[type, Any], ...]:
+    # Keep types in the key: 1, 1.0 and True hash alike but differ in Arrow.
+    return tuple((type(v), v) for v in values)
+
+
+@lru_cache(maxsize=256)
+def _value_set(key: tuple[tuple[type, Any], ...]) -> pa.Array:
+    """Return the Arrow array of a literal sequence, built once per sequence."""
+    return pa.array([v for _, v in key])
+
+
+def _is_arrow(value: Any) -> bool:
+    return isinstance(value, (pa.Array, pa.ChunkedArray))
+
+
+def _is_string(value: Any) -> bool:
+    if _is_arrow(value):
+        return pa.types.is_string(value.type) or pa.types.is_large_string(value.type)
+    return isinstance(value, str)
+
+
+def _as_float(value: Any) -> Any:
+    if _is_arrow(value) and pa.types.is_integer(value.type):
+        return pc.cast(value, pa.float64())
+    return value
+
+
+def _from_fallback(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return pa.array(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+__all__ = [
+    "to_arrow",
+    "evaluate_arrow",
+    "is_arrow_typed",
+    "is_elementwise",
+    "logical_array",
+    "match_array",
+]
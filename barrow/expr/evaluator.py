@@ -0,0 +1,128 @@
+"""Compile expression trees into flat Python callables.
+
+:func:`compile_expression` walks an :class:`~barrow.expr.Expression` once
+and returns a closure that takes the evaluation environment.  Operators
+and default functions are looked up while compiling, so evaluating the
+closure only reads the environment and calls the resolved
+implementations.  Compiled closures are cached on the expression and by
+expression text, so an expression evaluated once per batch or partition
+is compiled only once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from barrow.core.errors import InvalidExpressionError
+
+from .parser import (
+    _BINARY_OPERATORS,
+    _FUNCTIONS,
+    _UNARY_OPERATORS,
+    BinaryExpression,
+    Expression,
+    FunctionCall,
+    Literal,
+    Name,
+    UnaryExpression,
+    _is_scalar,
+    _logical,
+)
+
+#: A compiled expression: evaluates the expression in an environment.
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+#: Compiled expressions keyed by expression text.
+_CACHE: dict[str, Evaluator] = {}
+_CACHE_SIZE = 1024
+
+
+def compile_expression(expression: Expression) -> Evaluator:
+    """Return a callable evaluating *expression* in an environment.
+
+    The callable behaves like :meth:`Expression.evaluate`: a missing column
+    raises ``KeyError`` and a missing function ``NameError``.
+    """
+    evaluator = expression.__dict__.get("_evaluator")
+    if evaluator is not None:
+        return evaluator
+    key = repr(expression)
+    evaluator = _CACHE.get(key)
+    if evaluator is None:
+        evaluator = _compile(expression)
+        if len(_CACHE) >= _CACHE_SIZE:
+            _CACHE.clear()
+        _CACHE[key] = evaluator
+    # Expressions are frozen; the closure is not a field, so equality,
+    # hashing and repr are unaffected.
+    object.__setattr__(expression, "_evaluator", evaluator)
+    return evaluator
+
+
+def _compile(expr: Expression) -> Evaluator:
+    if isinstance(expr, Literal):
+        value = expr.value
+        return lambda env: value
+    if isinstance(expr, Name):
+        identifier = expr.identifier
+        return lambda env: env[identifier]
+    if isinstance(expr, UnaryExpression):
+        return _compile_unary(expr)
+    if isinstance(expr, BinaryExpression):
+        return _compile_binary(expr)
+    if isinstance(expr, FunctionCall):
+        return _compile_call(expr)
+    raise InvalidExpressionError(f"Unsupported expression: {expr!r}")
+
+
+def _compile_unary(expr: UnaryExpression) -> Evaluator:
+    operand = _compile(expr.operand)
+    func = _UNARY_OPERATORS[expr.op]
+    if expr.op != "not":
+        return lambda env: func(operand(env))
+
+    def evaluate_not(env: Mapping[str, Any]) -> Any:
+        value = operand(env)
+        return func(value) if _is_scalar(value) else _logical("not", value)
+
+    return evaluate_not
+
+
+def _compile_binary(expr: BinaryExpression) -> Evaluator:
+    left = _compile(expr.left)
+    right = _compile(expr.right)
+    op = expr.op
+    if op not in ("and", "or"):
+        func = _BINARY_OPERATORS[op]
+        return lambda env: func(left(env), right(env))
+    short_circuit_on = op == "or"
+
+    def evaluate_logical(env: Mapping[str, Any]) -> Any:
+        # Scalars short-circuit like Python; arrays use Kleene logic.
+        lhs = left(env)
+        if _is_scalar(lhs) and bool(lhs) is short_circuit_on:
+            return lhs
+        rhs = right(env)
+        if _is_scalar(lhs) and _is_scalar(rhs):
+            return rhs
+        return _logical(op, lhs, rhs)
+
+    return evaluate_logical
+
+
+def _compile_call(expr: FunctionCall) -> Evaluator:
+    name = expr.name
+    default = _FUNCTIONS.get(name)
+    args = [_compile(arg) for arg in expr.args]
+
+    def call(env: Mapping[str, Any]) -> Any:
+        func = env.get(name, default)
+        if func is None:
+            raise NameError(name)
+        return func(*[arg(env) for arg in args])
+
+    return call
+
+
+__all__ = ["Evaluator", "compile_expression"]
@@ -14,6 +14,7 @@ import operator
 import re
 import tokenize
 from dataclasses import dataclass
+from functools import lru_cache
 from io import StringIO
 from typing import Any, Callable, Mapping, Sequence, cast
 
@@ -23,35 +24,28 @@ from ..errors import InvalidExpressionError
 class Expression:
     """Base class for all expression nodes."""
 
-    def evaluate(self, env: Mapping[str, Any]) -> Any:  # pragma: no cover - abstract
-        raise NotImplementedError
+    def evaluate(self, env: Mapping[str, Any]) -> Any:
+        """Evaluate the expression with the values and functions in *env*."""
+        from .evaluator import compile_expression
+
+        return compile_expression(self)(env)
 
 
 @dataclass(frozen=True)
 class Literal(Expression):
     value: Any
 
-    def evaluate(self, env: Mapping[str, Any]) -> Any:
-        return self.value
-
 
 @dataclass(frozen=True)
 class Name(Expression):
     identifier: str
 
-    def evaluate(self, env: Mapping[str, Any]) -> Any:
-        return env[self.identifier]
-
 
 @dataclass(frozen=True)
 class UnaryExpression(Expression):
     op: str
     operand: Expression
 
-    def evaluate(self, env: Mapping[str, Any]) -> Any:
-        func = _UNARY_OPERATORS[self.op]
-        return func(self.operand.evaluate(env))
-
 
 @dataclass(frozen=True)
 class BinaryExpression(Expression):
@@ -59,26 +53,12 @@ class BinaryExpression(Expression):
     op: str
     right: Expression
 
-    def evaluate(self, env: Mapping[str, Any]) -> Any:
-        if self.op == "and":
-            return self.left.evaluate(env) and self.right.evaluate(env)
-        if self.op == "or":
-            return self.left.evaluate(env) or self.right.evaluate(env)
-        func = _BINARY_OPERATORS[self.op]
-        return func(self.left.evaluate(env), self.right.evaluate(env))
-
 
 @dataclass(frozen=True)
 class FunctionCall(Expression):
     name: str
     args: Sequence[Expression]
 
-    def evaluate(self, env: Mapping[str, Any]) -> Any:
-        func = env.get(self.name, _FUNCTIONS.get(self.name))
-        if func is None:
-            raise NameError(self.name)
-        return func(*(arg.evaluate(env) for arg in self.args))
-
 
 # Mapping of supported operators to their implementations
 _BINARY_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
@@ -94,8 +74,8 @@ _BINARY_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
     "<=": operator.le,
     ">": operator.gt,
     ">=": operator.ge,
-    "in": lambda a, b: a in b,
-    "not in": lambda a, b: a not in b,
+    "in": lambda a, b: _in(a, b),
+    "not in": lambda a, b: not _in(a, b) if _is_scalar(a) else ~_in(a, b),
     "like": lambda a, b: _like(a, b),
 }
 
@@ -111,10 +91,57 @@ _FUNCTIONS: dict[str, Callable[..., Any]] = {
 _FUNCTIONS.update({"abs": abs, "max": max, "min": min})
 
 
-def _like(value: str, pattern: str) -> bool:
-    """Simple SQL-like pattern matching."""
-    regex = "^" + re.escape(pattern).replace("%", ".*").replace("_", ".") + "$"
-    return re.match(regex, value) is not None
+def _in(value: Any, values: Any) -> Any:
+    """Membership test, element-wise for array columns."""
+    if not _is_scalar(value):
+        result = _match_array(value, "in", values)
+        if result is not None:
+            return result
+        return _elementwise(lambda v: v in values, value)
+    return value in values
+
+
+def _like(value: Any, pattern: str) -> Any:
+    """Simple SQL-like pattern matching, element-wise for array columns."""
+    if not _is_scalar(value):
+        result = _match_array(value, "like", pattern)
+        if result is not None:
+            return result
+        return _elementwise(lambda v: _like(v, pattern), value)
+    return _like_regex(pattern).match(value) is not None
+
+
+@lru_cache(maxsize=256)
+def _like_regex(pattern: str) -> re.Pattern[str]:
+    """Return the compiled regex of a ``like`` pattern, built once per pattern."""
+    regex = re.escape(pattern).replace("%", ".*").replace("_", ".")
+    return re.compile(regex + r"\Z", re.DOTALL)
+
+
+def _is_scalar(value: Any) -> bool:
+    return not hasattr(value, "__array__") or getattr(value, "ndim", 1) == 0
+
+
+def _logical(op: str, *operands: Any) -> Any:
+    import numpy as np
+
+    from .compiler_arrow import logical_array
+
+    return logical_array(op, *(v if _is_scalar(v) else np.asarray(v) for v in operands))
+
+
+def _match_array(values: Any, op: str, operand: Any) -> Any:
+    import numpy as np
+
+    from .compiler_arrow import match_array
+
+    return match_array(np.asarray(values), op, operand)
+
+
+def _elementwise(func: Callable[[Any], bool], values: Any) -> Any:
+    import numpy as np
+
+    return np.array([func(v) for v in values], dtype=bool)
 
 
 def _replace_like_tokens(expression: str) -> str:
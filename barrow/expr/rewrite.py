@@ -0,0 +1,272 @@
+"""Expression rewriting: constant folding and algebraic simplification.
+
+:func:`simplify_expression` rewrites a single expression bottom-up:
+
+* operators applied only to literals are folded into a :class:`Literal`;
+* ``x * 1``, ``1 * x``, ``x + 0``, ``0 + x`` and ``x - 0`` become
+  ``x`` for integer literals, but only when a schema is given and the
+  operation keeps the numeric type of ``x``: ``flag + 0`` turns a boolean
+  column into integers and ``x * 1`` widens ``int32`` to ``int64``;
+* ``not not x`` becomes ``x`` when ``x`` is a comparison or logical
+  expression, so the result stays boolean;
+* comparisons of one column against numeric literals in the same direction
+  are merged within a conjunction: ``a > 5 and a > 3`` becomes ``a > 5``.
+
+:func:`eliminate_common_subexpressions` makes a set of assignments, evaluated
+in order as by ``mutate``, reuse the columns computed by earlier ones: in
+``{"c": a + b, "d": (a + b) * 2}`` the second becomes ``c * 2``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import pyarrow as pa
+
+from barrow.core.errors import InvalidExpressionError
+
+from .analyzer import referenced_names
+from .evaluator import compile_expression
+from .parser import (
+    BinaryExpression,
+    Expression,
+    FunctionCall,
+    Literal,
+    Name,
+    UnaryExpression,
+)
+from .types import infer_type
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+# Identity elements: (op, literal on the left) -> value that leaves x as is.
+_IDENTITIES = {
+    ("*", False): 1,
+    ("*", True): 1,
+    ("+", False): 0,
+    ("+", True): 0,
+    ("-", False): 0,
+}
+
+_COMPARISON_OPS = {"==", "!=", "<", "<=", ">", ">=", "in", "not in", "like"}
+
+# Comparison with the operands swapped: ``5 < a`` is ``a > 5``.
+_FLIPPED = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+
+def simplify_expression(
+    expr: Expression, schema: pa.Schema | None = None
+) -> Expression:
+    """Return *expr* with literals folded and redundant operations removed.
+
+    *schema* describes the table *expr* is evaluated on.  Without it, the
+    types of columns are unknown and arithmetic identities are kept.
+    """
+    if isinstance(expr, UnaryExpression):
+        operand = simplify_expression(expr.operand, schema)
+        if (
+            expr.op == "not"
+            and isinstance(operand, UnaryExpression)
+            and operand.op == "not"
+            and _is_boolean(operand.operand)
+        ):
+            return operand.operand
+        return _fold(UnaryExpression(expr.op, operand))
+    if isinstance(expr, BinaryExpression):
+        left = simplify_expression(expr.left, schema)
+        right = simplify_expression(expr.right, schema)
+        identity = _identity(left, expr.op, right, schema)
+        if identity is not None:
+            return identity
+        result = _fold(BinaryExpression(left, expr.op, right))
+        if isinstance(result, BinaryExpression) and result.op == "and":
+            return _merge_ranges(result)
+        return result
+    if isinstance(expr, FunctionCall):
+        # Calls are not folded: the environment may replace the function.
+        return FunctionCall(
+            expr.name, [simplify_expression(a, schema) for a in expr.args]
+        )
+    return expr
+
+
+def eliminate_common_subexpressions(
+    assignments: Mapping[str, Expression],
+) -> dict[str, Expression]:
+    """Return *assignments* with repeated subexpressions read from columns.
+
+    Assignments are evaluated in order, each seeing the columns created by
+    the earlier ones.  A subexpression equal to an earlier assignment is
+    replaced by that assignment's column, as long as neither the column nor
+    the names it was computed from have been reassigned in between.
+    Expressions that reference no column are left alone.
+    """
+    # Expression text -> (column holding its value, names it reads)
+    available: dict[str, tuple[str, set[str]]] = {}
+    result: dict[str, Expression] = {}
+    for name, expr in assignments.items():
+        expr = _reuse(expr, available)
+        result[name] = expr
+        available = {
+            key: (column, names)
+            for key, (column, names) in available.items()
+            if column != name and name not in names
+        }
+        names = referenced_names(expr)
+        if names and name not in names and not isinstance(expr, (Name, Literal)):
+            available[repr(expr)] = (name, names)
+    return result
+
+
+def _reuse(
+    expr: Expression, available: Mapping[str, tuple[str, set[str]]]
+) -> Expression:
+    if not available or isinstance(expr, (Name, Literal)):
+        return expr
+    if isinstance(expr, UnaryExpression):
+        expr = UnaryExpression(expr.op, _reuse(expr.operand, available))
+    elif isinstance(expr, BinaryExpression):
+        expr = BinaryExpression(
+            _reuse(expr.left, available), expr.op, _reuse(expr.right, available)
+        )
+    elif isinstance(expr, FunctionCall):
+        expr = FunctionCall(expr.name, [_reuse(a, available) for a in expr.args])
+    match = available.get(repr(expr))
+    return expr if match is None else Name(match[0])
+
+
+def _fold(expr: UnaryExpression | BinaryExpression) -> Expression:
+    """Evaluate *expr* when its operands are literals."""
+    operands = (
+        [expr.operand] if isinstance(expr, UnaryExpression) else [expr.left, expr.right]
+    )
+    if not all(isinstance(o, Literal) for o in operands):
+        return expr
+    try:
+        value = compile_expression(expr)({})
+    except Exception:
+        # Leave the error, e.g. a division by zero, to evaluation.
+        return expr
+    if not _is_foldable(value):
+        return expr
+    return Literal(value)
+
+
+def _is_foldable(value: object) -> bool:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return _INT64_MIN <= value <= _INT64_MAX
+    return isinstance(value, (bool, float, str))
+
+
+def _identity(
+    left: Expression, op: str, right: Expression, schema: pa.Schema | None
+) -> Expression | None:
+    """Return the operand *left op right* reduces to, if any."""
+    if schema is None:
+        return None
+    if _is_int_literal(right, _IDENTITIES.get((op, False))):
+        operand = left
+    elif _is_int_literal(left, _IDENTITIES.get((op, True))):
+        operand = right
+    else:
+        return None
+    if _keeps_numeric_type(BinaryExpression(left, op, right), operand, schema):
+        return operand
+    return None
+
+
+def _keeps_numeric_type(
+    expr: Expression, operand: Expression, schema: pa.Schema
+) -> bool:
+    """Return ``True`` if *expr* has the same numeric type as *operand*."""
+    try:
+        expr_type = infer_type(expr, schema).type
+        operand_type = infer_type(operand, schema).type
+    except InvalidExpressionError:
+        return False
+    numeric = pa.types.is_integer(expr_type) or pa.types.is_floating(expr_type)
+    return numeric and expr_type == operand_type
+
+
+def _is_int_literal(expr: Expression, value: int | None) -> bool:
+    return (
+        value is not None
+        and isinstance(expr, Literal)
+        and type(expr.value) is int
+        and expr.value == value
+    )
+
+
+def _is_boolean(expr: Expression) -> bool:
+    """Return ``True`` if *expr* always evaluates to booleans."""
+    if isinstance(expr, BinaryExpression):
+        if expr.op in ("and", "or"):
+            # Python's ``and``/``or`` return an operand for scalars.
+            return _is_boolean(expr.left) and _is_boolean(expr.right)
+        return expr.op in _COMPARISON_OPS
+    if isinstance(expr, UnaryExpression):
+        return expr.op == "not"
+    return isinstance(expr, Literal) and isinstance(expr.value, bool)
+
+
+def _merge_ranges(expr: BinaryExpression) -> Expression:
+    """Keep only the tightest bound per column and direction in a conjunction."""
+    conjuncts = _conjuncts(expr)
+    # (column, direction) -> (index, op, value) of the tightest bound so far
+    tightest: dict[tuple[str, str], tuple[int, str, float]] = {}
+    dropped: set[int] = set()
+    for index, conjunct in enumerate(conjuncts):
+        bound = _bound(conjunct)
+        if bound is None:
+            continue
+        column, op, value = bound
+        key = (column, op[0])
+        if key not in tightest:
+            tightest[key] = (index, op, value)
+            continue
+        other_index, other_op, other_value = tightest[key]
+        if _tighter(op, value, other_op, other_value):
+            dropped.add(other_index)
+            tightest[key] = (index, op, value)
+        else:
+            dropped.add(index)
+    if not dropped:
+        return expr
+    kept = [c for i, c in enumerate(conjuncts) if i not in dropped]
+    result = kept[0]
+    for conjunct in kept[1:]:
+        result = BinaryExpression(result, "and", conjunct)
+    return result
+
+
+def _conjuncts(expr: Expression) -> list[Expression]:
+    if isinstance(expr, BinaryExpression) and expr.op == "and":
+        return _conjuncts(expr.left) + _conjuncts(expr.right)
+    return [expr]
+
+
+def _bound(expr: Expression) -> tuple[str, str, float] | None:
+    """Return ``(column, op, value)`` for ``column op number`` comparisons."""
+    if not isinstance(expr, BinaryExpression) or expr.op not in _FLIPPED:
+        return None
+    left, op, right = expr.left, expr.op, expr.right
+    if isinstance(left, Literal) and isinstance(right, Name):
+        left, op, right = right, _FLIPPED[op], left
+    if (
+        isinstance(left, Name)
+        and isinstance(right, Literal)
+        and isinstance(right.value, (int, float))
+        and not isinstance(right.value, bool)
+    ):
+        return left.identifier, op, right.value
+    return None
+
+
+def _tighter(op: str, value: float, other_op: str, other_value: float) -> bool:
+    """Return ``True`` if bound *op value* implies *other_op other_value*."""
+    if value == other_value:
+        return len(op) == 1 and len(other_op) == 2
+    return value > other_value if op[0] == ">" else value < other_value
+
+
+__all__ = ["eliminate_common_subexpressions", "simplify_expression"]
@@ -0,0 +1,281 @@
+"""Static type inference for expressions.
+
+:func:`infer_type` derives the Arrow type and nullability of an expression
+from the schema of the table it is evaluated on, without touching data.
+Operators and functions evaluated by Arrow kernels (see
+:mod:`barrow.expr.compiler_arrow`) take the type the kernel returns for
+zero-length inputs of the operand types; ``%`` and NumPy functions take the
+type NumPy returns for empty arrays, assuming no nulls.  A type that
+cannot be known statically is ``null``.
+
+Operations that cannot succeed for the operand types, such as arithmetic
+on strings, and names that are neither columns nor functions raise
+:class:`~barrow.core.errors.InvalidExpressionError`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+import warnings
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from barrow.core.errors import InvalidExpressionError
+
+from .compiler_arrow import _ARROW_BINARY, _ARROW_FUNCTIONS
+from .parser import (
+    _FUNCTIONS,
+    BinaryExpression,
+    Expression,
+    FunctionCall,
+    Literal,
+    Name,
+    UnaryExpression,
+)
+
+_ORDERING_OPS = {"<", "<=", ">", ">="}
+_PREDICATE_OPS = {"==", "!=", *_ORDERING_OPS, "in", "not in", "like", "and", "or"}
+
+# NumPy ufuncs of the arithmetic operators, for operands without a kernel.
+_BINARY_NUMPY = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.true_divide,
+    "%": np.mod,
+    "**": np.power,
+}
+
+# Errors raised by kernels that do not accept the operand types.
+_KERNEL_ERRORS = (pa.ArrowNotImplementedError, pa.ArrowTypeError, pa.ArrowInvalid)
+
+
+@dataclass(frozen=True)
+class ExpressionType:
+    """Arrow type of an expression's values and whether they may be null."""
+
+    type: pa.DataType
+    nullable: bool = True
+
+    @property
+    def known(self) -> bool:
+        """``False`` when the type could not be inferred."""
+        return not pa.types.is_null(self.type)
+
+
+def infer_type(expr: Expression, schema: pa.Schema) -> ExpressionType:
+    """Return the type and nullability of *expr* evaluated on *schema*.
+
+    Raises
+    ------
+    InvalidExpressionError
+        If *expr* references an unknown name or applies an operator or
+        function to values it does not accept.
+    """
+    if isinstance(expr, Literal):
+        return _literal_type(expr.value)
+    if isinstance(expr, Name):
+        return _name_type(expr.identifier, schema)
+    if isinstance(expr, UnaryExpression):
+        return _unary_type(expr, infer_type(expr.operand, schema))
+    if isinstance(expr, BinaryExpression):
+        return _binary_type(
+            expr, infer_type(expr.left, schema), infer_type(expr.right, schema)
+        )
+    if isinstance(expr, FunctionCall):
+        return _call_type(expr, [infer_type(arg, schema) for arg in expr.args], schema)
+    raise InvalidExpressionError(f"Unsupported expression: {expr!r}")
+
+
+def _literal_type(value: Any) -> ExpressionType:
+    if value is None:
+        return ExpressionType(pa.null(), nullable=True)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        # Only valid as the operand of ``in``; it has no column type.
+        return ExpressionType(pa.null(), nullable=False)
+    try:
+        return ExpressionType(pa.scalar(value).type, nullable=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return ExpressionType(pa.null(), nullable=False)
+
+
+def _name_type(name: str, schema: pa.Schema) -> ExpressionType:
+    if name in schema.names:
+        field = schema.field(name)
+        return ExpressionType(field.type, field.nullable)
+    # Other names resolve to NumPy attributes, e.g. ``pi``.
+    value = getattr(np, name, None)
+    if value is None:
+        raise InvalidExpressionError(f"name '{name}' is not defined")
+    if isinstance(value, (int, float, np.number)):
+        return _literal_type(value)
+    return ExpressionType(pa.null(), nullable=False)
+
+
+def _unary_type(expr: UnaryExpression, operand: ExpressionType) -> ExpressionType:
+    if expr.op == "not":
+        return ExpressionType(pa.bool_(), operand.nullable)
+    if _is_text(operand.type):
+        raise InvalidExpressionError(
+            f"Operator {expr.op!r} is not defined for {operand.type}"
+        )
+    if expr.op == "+":
+        return operand
+    return _kernel_type("negate", [operand], [None], operand.nullable)
+
+
+def _binary_type(
+    expr: BinaryExpression, left: ExpressionType, right: ExpressionType
+) -> ExpressionType:
+    op = expr.op
+    nullable = left.nullable or right.nullable
+    if op in _PREDICATE_OPS:
+        if op in _ORDERING_OPS and _mixes_text(left.type, right.type):
+            raise InvalidExpressionError(
+                f"Cannot compare {left.type} and {right.type} with {op!r}"
+            )
+        if op in ("in", "not in"):
+            # ``is_in`` matches nulls against the value set.
+            nullable = False
+        elif op == "like":
+            nullable = left.nullable
+        return ExpressionType(pa.bool_(), nullable)
+
+    if not left.known or not right.known:
+        return ExpressionType(pa.null(), nullable)
+    if _is_text(left.type) or _is_text(right.type):
+        return _text_type(op, left, right, nullable)
+
+    values = [_literal_value(expr.left), _literal_value(expr.right)]
+    operands = [left, right]
+    if op == "/":
+        operands = [_as_float(t) for t in operands]
+    if op in _ARROW_BINARY:
+        result = _kernel_type(_ARROW_BINARY[op], operands, values, nullable)
+        if result.known:
+            return result
+    return _numpy_type(_BINARY_NUMPY[op], [left, right], values, nullable)
+
+
+def _text_type(
+    op: str, left: ExpressionType, right: ExpressionType, nullable: bool
+) -> ExpressionType:
+    """Type of arithmetic on strings, which follows Python's semantics."""
+    integer = pa.types.is_integer
+    if op == "+" and _is_text(left.type) and _is_text(right.type):
+        text = pa.large_string() if pa.types.is_large_string(left.type) else left.type
+        return ExpressionType(text, nullable)
+    if op == "*" and _is_text(left.type) and integer(right.type):
+        return ExpressionType(left.type, nullable)
+    if op == "*" and integer(left.type) and _is_text(right.type):
+        return ExpressionType(right.type, nullable)
+    if op == "%" and _is_text(left.type):
+        # String formatting; whether it succeeds depends on the values.
+        return ExpressionType(pa.null(), nullable)
+    raise InvalidExpressionError(
+        f"Operator {op!r} is not defined for {left.type} and {right.type}"
+    )
+
+
+def _call_type(
+    expr: FunctionCall, args: list[ExpressionType], schema: pa.Schema
+) -> ExpressionType:
+    name = expr.name
+    nullable = any(arg.nullable for arg in args)
+    if name in schema.names:
+        # A column shadowing a function; calling it is left to evaluation.
+        return ExpressionType(pa.null(), nullable)
+    if name in _ARROW_FUNCTIONS and len(args) == 1:
+        if _is_text(args[0].type):
+            raise InvalidExpressionError(f"{name}() is not defined for {args[0].type}")
+        result = _kernel_type(_ARROW_FUNCTIONS[name], args, [None], nullable)
+        if result.known or not args[0].known:
+            return result
+    func = getattr(np, name, None)
+    if func is None:
+        if name not in _FUNCTIONS:
+            raise InvalidExpressionError(f"name '{name}' is not defined")
+        return ExpressionType(pa.null(), nullable)
+    if not callable(func):
+        raise InvalidExpressionError(f"'{name}' is not a function")
+    values = [_literal_value(arg) for arg in expr.args]
+    return _numpy_type(func, args, values, nullable)
+
+
+def _kernel_type(
+    func: str, operands: list[ExpressionType], values: list[Any], nullable: bool
+) -> ExpressionType:
+    """Return the type *func* returns for empty inputs of the operand types.
+
+    Literal operands are passed as values, as :func:`evaluate_arrow` does.
+    """
+    columns = [t for t, v in zip(operands, values) if v is None]
+    if not columns or not all(t.known for t in columns):
+        # Operations on literals only are evaluated in Python.
+        return ExpressionType(pa.null(), nullable)
+    inputs = [
+        pa.array([], type=t.type) if v is None else v for t, v in zip(operands, values)
+    ]
+    try:
+        result = getattr(pc, func)(*inputs)
+    except _KERNEL_ERRORS:
+        return ExpressionType(pa.null(), nullable)
+    return ExpressionType(result.type, nullable)
+
+
+def _numpy_type(
+    func: Any, operands: list[ExpressionType], values: list[Any], nullable: bool
+) -> ExpressionType:
+    """Return the type *func* returns for empty NumPy arrays."""
+    inputs = []
+    for operand, value in zip(operands, values):
+        if value is not None:
+            inputs.append(value)
+            continue
+        try:
+            dtype = operand.type.to_pandas_dtype()
+        except NotImplementedError:
+            return ExpressionType(pa.null(), nullable)
+        inputs.append(np.empty(0, dtype=dtype))
+    try:
+        # Reductions of empty arrays warn, e.g. "Mean of empty slice".
+        with np.errstate(all="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = np.asarray(func(*inputs))
+        return ExpressionType(pa.from_numpy_dtype(result.dtype), nullable)
+    except Exception:
+        return ExpressionType(pa.null(), nullable)
+
+
+def _literal_value(expr: Expression) -> Any:
+    """Return the value of a scalar literal, passed to kernels as is."""
+    if isinstance(expr, Literal) and isinstance(expr.value, (bool, int, float, str)):
+        return expr.value
+    return None
+
+
+def _as_float(operand: ExpressionType) -> ExpressionType:
+    if pa.types.is_integer(operand.type):
+        return ExpressionType(pa.float64(), operand.nullable)
+    return operand
+
+
+def _is_text(type: pa.DataType) -> bool:
+    return (
+        pa.types.is_string(type)
+        or pa.types.is_large_string(type)
+        or pa.types.is_binary(type)
+        or pa.types.is_large_binary(type)
+    )
+
+
+def _mixes_text(left: pa.DataType, right: pa.DataType) -> bool:
+    """Return ``True`` if exactly one side is text and the other is known."""
+    known = not pa.types.is_null(left) and not pa.types.is_null(right)
+    return known and _is_text(left) != _is_text(right)
+
+
+__all__ = ["ExpressionType", "infer_type"]
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import shlex
+from typing import Any
 
+from barrow.core.errors import FrontendError
 from barrow.core.nodes import (
+    LogicalNode,
     Scan,
     Sink,
     Project,
@@ -14,6 +18,7 @@ from barrow.core.nodes import (
     Aggregate,
     Ungroup as UngroupNode,
     Join as JoinNode,
+    Limit as LimitNode,
     Sort as SortNode,
     Window as WindowNode,
     View as ViewNode,
@@ -21,26 +26,55 @@ from barrow.core.nodes import (
 )
 from barrow.core.plan import LogicalPlan
 from barrow.expr import parse, Expression
+from barrow.io.options import WriteOptions
 
 
 def cli_to_plan(command: str, args: argparse.Namespace) -> LogicalPlan:
     """Build a LogicalPlan from CLI command name and parsed args."""
-    builders = {
-        "filter": _build_filter,
-        "select": _build_select,
-        "mutate": _build_mutate,
-        "groupby": _build_groupby,
-        "summary": _build_summary,
-        "ungroup": _build_ungroup,
-        "join": _build_join,
-        "sort": _build_sort,
-        "sql": _build_sql,
-        "window": _build_window,
-        "view": _build_view,
-    }
-    builder = builders[command]
-    root = builder(args)
-    return LogicalPlan(root)
+    if command == "view":
+        return LogicalPlan(_build_view(args))
+    op = _OPERATIONS[command]
+    return LogicalPlan(_sink(op(_scan(args), args), args))
+
+
+def pipeline_to_plan(
+    stages: list[tuple[str, argparse.Namespace]], args: argparse.Namespace
+) -> LogicalPlan:
+    """Build one LogicalPlan chaining the operations of *stages*.
+
+    Each stage is a command name with its parsed arguments.  The first stage
+    reads from the input described by *args*, every following stage consumes
+    the output of the previous one, and the last one writes to the output
+    described by *args*.
+    """
+    node: LogicalNode = _scan(args)
+    for command, stage_args in stages:
+        op = _OPERATIONS.get(command)
+        if op is None:
+            raise FrontendError(f"Command '{command}' cannot be used in a pipeline")
+        node = op(node, stage_args)
+    return LogicalPlan(_sink(node, args))
+
+
+def split_pipeline(pipeline: str) -> list[list[str]]:
+    """Split a shell-like ``"cmd args | cmd args"`` string into stages.
+
+    Arguments are tokenized with :mod:`shlex`, so quoted expressions may
+    contain spaces and ``|`` characters.
+    """
+    lexer = shlex.shlex(pipeline, posix=True, punctuation_chars="|")
+    lexer.whitespace_split = True
+    stages: list[list[str]] = [[]]
+    for token in lexer:
+        if token == "|":
+            stages.append([])
+        elif set(token) == {"|"}:
+            raise FrontendError(f"Invalid pipeline separator: {token!r}")
+        else:
+            stages[-1].append(token)
+    if any(not stage for stage in stages):
+        raise FrontendError(f"Empty stage in pipeline: {pipeline!r}")
+    return stages
 
 
 def _scan(args: argparse.Namespace) -> Scan:
@@ -57,48 +91,71 @@ def _sink(child, args: argparse.Namespace) -> Sink:
     delimiter = getattr(args, "output_delimiter", None) or getattr(
         args, "delimiter", None
     )
+    partition_by = None
+    if getattr(args, "partition_by", None):
+        partition_by = [c.strip() for c in args.partition_by.split(",") if c.strip()]
     return Sink(
         child=child,
         path=getattr(args, "output", None),
         format=getattr(args, "output_format", None),
         delimiter=delimiter,
+        partition_by=partition_by,
+        max_rows_per_file=getattr(args, "max_rows_per_file", None),
+        write_options=_write_options(args),
     )
 
 
-def _build_filter(args: argparse.Namespace):
-    scan = _scan(args)
+def _write_options(args: argparse.Namespace) -> WriteOptions | None:
+    """Build the sink's WriteOptions, or ``None`` when no option is set."""
+
+    def _columns(name: str) -> tuple[str, ...] | None:
+        value = getattr(args, name, None)
+        if value is None:
+            return None
+        return tuple(c.strip() for c in value.split(",") if c.strip())
+
+    settings: dict[str, Any] = {
+        "compression": getattr(args, "compression", None),
+        "compression_level": getattr(args, "compression_level", None),
+        "row_group_size": getattr(args, "row_group_size", None),
+        "page_size": getattr(args, "page_size", None),
+        "dictionary_columns": _columns("dictionary_columns"),
+        "bloom_filter_columns": _columns("bloom_filter"),
+        "sorting_columns": _columns("sorting_columns"),
+    }
+    settings = {k: v for k, v in settings.items() if v is not None}
+    if getattr(args, "no_statistics", False):
+        settings["write_statistics"] = False
+    if not settings:
+        return None
+    return WriteOptions(**settings)
+
+
+def _filter_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
     expr = parse(args.expression)
-    op = FilterNode(child=scan, expression=expr)
-    return _sink(op, args)
+    return FilterNode(child=child, expression=expr)
 
 
-def _build_select(args: argparse.Namespace):
-    scan = _scan(args)
+def _select_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
     cols = [c.strip() for c in args.columns.split(",") if c.strip()]
-    op = Project(child=scan, columns=cols)
-    return _sink(op, args)
+    return Project(child=child, columns=cols)
 
 
-def _build_mutate(args: argparse.Namespace):
-    scan = _scan(args)
+def _mutate_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
     pairs = [p.strip() for p in args.assignments.split(",") if p.strip()]
     expressions: dict[str, Expression] = {}
     for pair in pairs:
         name, expr_str = pair.split("=", 1)
         expressions[name.strip()] = parse(expr_str.strip())
-    op = MutateNode(child=scan, assignments=expressions)
-    return _sink(op, args)
+    return MutateNode(child=child, assignments=expressions)
 
 
-def _build_groupby(args: argparse.Namespace):
-    scan = _scan(args)
+def _groupby_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
     cols = [c.strip() for c in args.columns.split(",") if c.strip()]
-    op = GroupByNode(child=scan, keys=cols)
-    return _sink(op, args)
+    return GroupByNode(child=child, keys=cols)
 
 
-def _build_summary(args: argparse.Namespace):
-    scan = _scan(args)
+def _summary_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
     pairs = [p.strip() for p in args.aggregations.split(",") if p.strip()]
     aggregations: dict[str, str] = {}
     for pair in pairs:
@@ -106,51 +163,58 @@ def _build_summary(args: argparse.Namespace):
         aggregations[col.strip()] = agg.strip()
     # Summary reads grouped_by from metadata at execution time
     # Build as Aggregate with empty group_keys (engine will read from metadata)
-    op = Aggregate(child=scan, group_keys=[], aggregations=aggregations)
-    return _sink(op, args)
+    return Aggregate(child=child, group_keys=[], aggregations=aggregations)
 
 
-def _build_ungroup(args: argparse.Namespace):
-    scan = _scan(args)
-    op = UngroupNode(child=scan)
-    return _sink(op, args)
+def _ungroup_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
+    return UngroupNode(child=child)
 
 
-def _build_join(args: argparse.Namespace):
-    left_scan = _scan(args)
+def _join_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
     right_scan = Scan(
         path=args.right,
         format=getattr(args, "right_format", None),
         delimiter=getattr(args, "delimiter", None),
     )
-    op = JoinNode(
-        left=left_scan,
+    left_on = [c.strip() for c in args.left_on.split(",") if c.strip()]
+    right_on = [c.strip() for c in args.right_on.split(",") if c.strip()]
+    if not left_on or len(left_on) != len(right_on):
+        raise FrontendError(
+            f"Join keys do not pair up: {args.left_on!r} and {args.right_on!r}"
+        )
+    return JoinNode(
+        left=child,
         right=right_scan,
-        left_on=args.left_on,
-        right_on=args.right_on,
+        left_on=left_on,
+        right_on=right_on,
         join_type=args.join_type,
     )
-    return _sink(op, args)
 
 
-def _build_sort(args: argparse.Namespace):
-    scan = _scan(args)
+def _sort_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
     cols = [c.strip() for c in args.columns.split(",") if c.strip()]
     desc = []
     if hasattr(args, "desc") and args.desc:
         desc = [True] * len(cols)
-    op = SortNode(child=scan, keys=cols, descending=desc)
-    return _sink(op, args)
+    return SortNode(child=child, keys=cols, descending=desc)
 
 
-def _build_sql(args: argparse.Namespace):
-    scan = _scan(args)
-    op = SqlQuery(child=scan, query=args.query)
-    return _sink(op, args)
+def _limit_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
+    sort_by = getattr(args, "sort_by", None)
+    if sort_by:
+        # The optimizer fuses Limit(Sort) into a TopK selection.
+        child = _sort_op(
+            child,
+            argparse.Namespace(columns=sort_by, desc=getattr(args, "desc", False)),
+        )
+    return LimitNode(child=child, n=args.n)
 
 
-def _build_window(args: argparse.Namespace):
-    scan = _scan(args)
+def _sql_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
+    return SqlQuery(child=child, query=args.query)
+
+
+def _window_op(child: LogicalNode, args: argparse.Namespace) -> LogicalNode:
     by = None
     if hasattr(args, "by") and args.by:
         by = [c.strip() for c in args.by.split(",") if c.strip()]
@@ -162,8 +226,23 @@ def _build_window(args: argparse.Namespace):
     for pair in pairs:
         name, expr_str = pair.split("=", 1)
         expressions[name.strip()] = parse(expr_str.strip())
-    op = WindowNode(child=scan, by=by, order_by=order_by, assignments=expressions)
-    return _sink(op, args)
+    return WindowNode(child=child, by=by, order_by=order_by, assignments=expressions)
+
+
+_OPERATIONS = {
+    "filter": _filter_op,
+    "select": _select_op,
+    "mutate": _mutate_op,
+    "groupby": _groupby_op,
+    "summary": _summary_op,
+    "ungroup": _ungroup_op,
+    "join": _join_op,
+    "sort": _sort_op,
+    "limit": _limit_op,
+    "head": _limit_op,
+    "sql": _sql_op,
+    "window": _window_op,
+}
 
 
 def _build_view(args: argparse.Namespace):
@@ -172,7 +251,9 @@ def _build_view(args: argparse.Namespace):
         format=getattr(args, "input_format", None),
         delimiter=getattr(args, "delimiter", None),
     )
-    op = ViewNode(child=scan)
+    rows = getattr(args, "rows", None)
+    source = scan if rows is None else LimitNode(child=scan, n=rows)
+    op = ViewNode(child=source)
     # View always outputs CSV to STDOUT
     return Sink(
         child=op,
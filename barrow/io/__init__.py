@@ -4,7 +4,26 @@ This package provides helper functions to read and write tabular data
 using Apache Arrow.
 """
 
-from .reader import read_table
-from .writer import write_table
+from .options import WriteOptions
+from .reader import (
+    SourceStatistics,
+    read_batches,
+    read_column_names,
+    read_schema,
+    read_statistics,
+    read_table,
+)
+from .writer import write_batches, write_dataset, write_table
 
-__all__ = ["read_table", "write_table"]
+__all__ = [
+    "SourceStatistics",
+    "WriteOptions",
+    "read_table",
+    "read_batches",
+    "read_column_names",
+    "read_schema",
+    "read_statistics",
+    "write_table",
+    "write_batches",
+    "write_dataset",
+]
@@ -1,24 +1,164 @@
-"""I/O option dataclasses."""
+"""File writer options shared by the Parquet, Feather, ORC and Arrow sinks."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Any
 
+import pyarrow as pa
 
-@dataclass
-class ScanOptions:
-    """Options for reading a table."""
+from ..errors import BarrowIOError
 
-    path: str | None = None
-    format: str | None = None
-    delimiter: str | None = None
-    columns: list[str] | None = None
+#: Codec names accepted by :class:`WriteOptions`.
+COMPRESSIONS = ("zstd", "lz4", "snappy", "gzip", "brotli", "none")
 
+# Codecs the Arrow IPC formats (Feather and Arrow streams) can use.
+_IPC_CODECS = {"zstd": "zstd", "lz4": "lz4_frame"}
 
-@dataclass
-class SinkOptions:
-    """Options for writing a table."""
+# ORC names of the codecs it supports.
+_ORC_CODECS = {
+    "zstd": "zstd",
+    "lz4": "lz4",
+    "snappy": "snappy",
+    "gzip": "zlib",
+    "none": "uncompressed",
+}
 
-    path: str | None = None
-    format: str | None = None
-    delimiter: str | None = None
+
+@dataclass(frozen=True)
+class WriteOptions:
+    """How a sink encodes its files.
+
+    ``None`` and empty values keep the writer's defaults: Snappy-compressed
+    Parquet with dictionary encoding and statistics for every column, LZ4
+    Feather, uncompressed ORC and Arrow streams.  Options that do not apply
+    to the output format are ignored.
+
+    Attributes
+    ----------
+    compression:
+        One of :data:`COMPRESSIONS`.  Feather and Arrow streams support only
+        ``zstd``, ``lz4`` and ``none``; ORC has no ``brotli`` and writes
+        ``gzip`` as zlib.
+    compression_level:
+        Codec-specific level, e.g. 1-22 for ``zstd``.  Not used by ORC.
+    row_group_size:
+        Maximum rows per Parquet row group.  Streamed batches are buffered
+        until a row group is full.
+    page_size:
+        Target size in bytes of Parquet data pages.
+    dictionary_columns:
+        Parquet columns to dictionary-encode; an empty tuple disables
+        dictionary encoding.
+    write_statistics:
+        Whether Parquet column chunks record min/max statistics.
+    bloom_filter_columns:
+        Columns that get Parquet or ORC Bloom filters.
+    sorting_columns:
+        Columns, each optionally suffixed with ``:desc``, recorded as the
+        Parquet sort order.  The data is not sorted by the writer.
+    """
+
+    compression: str | None = None
+    compression_level: int | None = None
+    row_group_size: int | None = None
+    page_size: int | None = None
+    dictionary_columns: tuple[str, ...] | None = None
+    write_statistics: bool = True
+    bloom_filter_columns: tuple[str, ...] = ()
+    sorting_columns: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.compression is not None and self.compression not in COMPRESSIONS:
+            raise BarrowIOError(
+                f"Unknown compression {self.compression!r}; "
+                f"expected one of {', '.join(COMPRESSIONS)}"
+            )
+
+    def __str__(self) -> str:
+        changed = [
+            f"{f.name}={getattr(self, f.name)!r}"
+            for f in fields(self)
+            if getattr(self, f.name) != f.default
+        ]
+        return f"WriteOptions({', '.join(changed)})"
+
+    def parquet_kwargs(self, schema: pa.Schema) -> dict[str, Any]:
+        """Return keyword arguments for :class:`pyarrow.parquet.ParquetWriter`.
+
+        Raises :class:`BarrowIOError` if a sorting column is not in *schema*.
+        """
+        kwargs: dict[str, Any] = {}
+        if self.compression is not None:
+            kwargs["compression"] = self.compression
+        if self.compression_level is not None:
+            kwargs["compression_level"] = self.compression_level
+        if self.page_size is not None:
+            kwargs["data_page_size"] = self.page_size
+        if self.dictionary_columns is not None:
+            kwargs["use_dictionary"] = list(self.dictionary_columns) or False
+        if not self.write_statistics:
+            kwargs["write_statistics"] = False
+        if self.bloom_filter_columns:
+            kwargs["bloom_filter_options"] = {
+                column: True for column in self.bloom_filter_columns
+            }
+        if self.sorting_columns:
+            import pyarrow.parquet as pq
+
+            ordering = []
+            for column in self.sorting_columns:
+                name, _, order = column.partition(":")
+                if name not in schema.names:
+                    raise BarrowIOError(f"Unknown sorting column {name!r}")
+                descending = order.lower() in ("desc", "descending")
+                ordering.append((name, "descending" if descending else "ascending"))
+            kwargs["sorting_columns"] = pq.SortingColumn.from_ordering(schema, ordering)
+        return kwargs
+
+    def ipc_options(self, default: str | None = None) -> pa.ipc.IpcWriteOptions:
+        """Return Arrow IPC write options, using *default* as the codec
+        when no compression is configured."""
+        compression = self.compression if self.compression is not None else default
+        if compression is None or compression == "none":
+            return pa.ipc.IpcWriteOptions()
+        codec = _IPC_CODECS.get(compression)
+        if codec is None:
+            raise BarrowIOError(
+                f"Compression {compression!r} is not supported by Arrow IPC; "
+                "use zstd, lz4 or none"
+            )
+        return pa.ipc.IpcWriteOptions(
+            compression=pa.Codec(codec, self.compression_level)
+        )
+
+    def orc_kwargs(self, schema: pa.Schema) -> dict[str, Any]:
+        """Return keyword arguments for :class:`pyarrow.orc.ORCWriter`."""
+        kwargs: dict[str, Any] = {}
+        if self.compression is not None:
+            codec = _ORC_CODECS.get(self.compression)
+            if codec is None:
+                raise BarrowIOError(
+                    f"Compression {self.compression!r} is not supported by ORC"
+                )
+            kwargs["compression"] = codec
+        if self.bloom_filter_columns:
+            # ORC numbers the types of the schema tree in pre-order, with
+            # the root struct as 0.
+            ids, next_id = {}, 1
+            for field in schema:
+                ids[field.name] = next_id
+                next_id += _orc_type_count(field.type)
+            kwargs["bloom_filter_columns"] = [
+                ids[c] for c in self.bloom_filter_columns if c in ids
+            ]
+        return kwargs
+
+
+def _orc_type_count(data_type: pa.DataType) -> int:
+    return 1 + sum(
+        _orc_type_count(data_type.field(i).type) for i in range(data_type.num_fields)
+    )
+
+
+__all__ = ["COMPRESSIONS", "WriteOptions"]
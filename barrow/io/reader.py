@@ -1,12 +1,38 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+import io
+import mmap
+import os
 from pathlib import Path
+import stat
 import sys
+from typing import IO
 
 import csv as stdcsv
+import glob
 import pyarrow as pa
+import pyarrow.compute as pc
 
-from ..errors import UnsupportedFormatError
+from ..errors import BarrowIOError, CsvTypeError, UnsupportedFormatError
+
+#: Default number of rows per record batch produced by :func:`read_batches`.
+DEFAULT_BATCH_SIZE = 64 * 1024
+
+#: Number of leading ``STDIN`` bytes inspected for format detection, the
+#: ``grouped_by`` comment and delimiter sniffing.
+_PEEK_SIZE = 64 * 1024
+
+#: Number of bytes handed to :class:`csv.Sniffer`.
+_SNIFF_SIZE = 1024
+
+#: Number of bytes read at a time when buffering piped ``STDIN``.
+_STDIN_CHUNK_SIZE = 1 << 20
+
+_GROUPED_PREFIX = b"# grouped_by:"
+
+#: Continuation marker opening every message of an Arrow IPC stream.
+_IPC_CONTINUATION = b"\xff\xff\xff\xff"
 
 
 def _detect_format(path: str | None, data: bytes | None) -> str:
@@ -22,6 +48,8 @@ def _detect_format(path: str | None, data: bytes | None) -> str:
             return "feather"
         if ext == ".orc":
             return "orc"
+        if ext == ".arrows":
+            return "arrow"
         with open(path, "rb") as f:
             head = f.read(6)
     else:
@@ -32,9 +60,183 @@ def _detect_format(path: str | None, data: bytes | None) -> str:
         return "feather"
     if head.startswith(b"ORC"):
         return "orc"
+    if head.startswith(_IPC_CONTINUATION):
+        return "arrow"
     return "csv"
 
 
+class _PrefixedStream(io.RawIOBase):
+    """Binary stream returning already-consumed ``prefix`` bytes first.
+
+    ``STDIN`` cannot be rewound, so the bytes peeked for format detection
+    are replayed in front of the remaining stream instead of buffering the
+    whole payload.  Once closed, the stream reads as ended, which lets a
+    reader reading ahead on another thread finish (see :func:`_drain`).
+    """
+
+    def __init__(self, prefix: bytes, stream: IO[bytes]) -> None:
+        self._prefix = memoryview(prefix)
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        # ``pa.PythonFile`` takes a short read for the end of the data, so
+        # fill *buffer* completely unless the stream ends first.
+        if self.closed:
+            return 0
+        view = memoryview(buffer).cast("B")
+        filled = 0
+        if self._prefix:
+            filled = min(len(view), len(self._prefix))
+            view[:filled] = self._prefix[:filled]
+            self._prefix = self._prefix[filled:]
+        while filled < len(view):
+            data = self._stream.read(len(view) - filled)
+            if not data:
+                break
+            view[filled : filled + len(data)] = data
+            filled += len(data)
+        return filled
+
+
+def _peek_stdin() -> bytes:
+    """Consume and return the first bytes of ``STDIN``."""
+    return sys.stdin.buffer.read(_PEEK_SIZE)
+
+
+def _stdin_buffer(head: bytes | None) -> pa.Buffer:
+    """Return the full ``STDIN`` payload, including already peeked bytes.
+
+    When ``STDIN`` is redirected from a regular file the file is
+    memory-mapped, so only the pages a reader touches are loaded.  Pipes
+    are read into a single buffer without further copies.
+    """
+    head = head or b""
+    stdin = sys.stdin.buffer
+    try:
+        fd = stdin.fileno()
+        if stat.S_ISREG(os.fstat(fd).st_mode):
+            start = stdin.tell() - len(head)
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            return pa.py_buffer(mapped).slice(start)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        # Pipes, empty files and in-memory streams are read instead.
+        pass
+    data = bytearray(head)
+    while chunk := stdin.read(_STDIN_CHUNK_SIZE):
+        data += chunk
+    return pa.py_buffer(data)
+
+
+def _sniff_delimiter(sample: bytes) -> str:
+    try:
+        return stdcsv.Sniffer().sniff(sample.decode()).delimiter
+    except Exception:
+        return ","
+
+
+def _csv_block_size(block_size: int | None) -> int | None:
+    if block_size:
+        return block_size
+    env = os.environ.get("BARROW_CSV_BLOCK_SIZE")
+    return int(env) if env else None
+
+
+def _csv_source(
+    path: str | None,
+    head: bytes | None,
+    input_delimiter: str | None,
+) -> tuple[object, str, dict[bytes, bytes], list[str] | None]:
+    """Prepare a CSV input for parsing.
+
+    Returns the object to hand to :mod:`pyarrow.csv`, the field delimiter,
+    the schema metadata (``format`` plus ``grouped_by`` when the input starts
+    with a grouping comment) and the column names of the header line, or
+    ``None`` when it is not within the inspected prefix.  Only a small prefix
+    of the input is inspected.
+    """
+    metadata: dict[bytes, bytes] = {b"format": b"csv"}
+    source: object
+    if path:
+        f = open(path, "rb")
+        first = f.readline()
+        if first.startswith(_GROUPED_PREFIX):
+            metadata[b"grouped_by"] = first[len(_GROUPED_PREFIX) :].strip()
+            header = f.readline()
+            f.seek(len(first))
+            sample = f.read(_SNIFF_SIZE)
+            f.seek(len(first))
+            source = f
+        else:
+            header = first
+            sample = first + f.read(_SNIFF_SIZE)
+            f.close()
+            source = path
+    else:
+        if head is None:
+            head = _peek_stdin()
+        if head.startswith(_GROUPED_PREFIX):
+            newline = head.find(b"\n")
+            while newline == -1:
+                more = sys.stdin.buffer.read(_PEEK_SIZE)
+                if not more:
+                    break
+                head += more
+                newline = head.find(b"\n")
+            end = newline if newline != -1 else len(head)
+            metadata[b"grouped_by"] = head[len(_GROUPED_PREFIX) : end].strip()
+            head = head[end + 1 :]
+        newline = head.find(b"\n")
+        header = head[: newline + 1] if newline != -1 else b""
+        sample = head[:_SNIFF_SIZE]
+        source = pa.PythonFile(_PrefixedStream(head, sys.stdin.buffer), mode="r")
+    delimiter = input_delimiter or _sniff_delimiter(sample)
+    return source, delimiter, metadata, _csv_header(header, delimiter)
+
+
+def _csv_header(line: bytes, delimiter: str) -> list[str] | None:
+    """Return the column names in the CSV header *line*, if it is complete."""
+    if not line.endswith(b"\n"):
+        return None
+    try:
+        text = line.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    for row in stdcsv.reader([text], delimiter=delimiter):
+        return row
+    return None
+
+
+def _open_ipc_stream(path: str | None, head: bytes | None) -> pa.RecordBatchReader:
+    """Open an Arrow IPC stream from ``path`` or ``STDIN``.
+
+    Batches are decoded as they arrive, so an upstream process writing the
+    stream incrementally is consumed while it is still running.
+    """
+    if path:
+        return pa.ipc.open_stream(pa.memory_map(path))
+    stream = _PrefixedStream(head or b"", sys.stdin.buffer)
+    return pa.ipc.open_stream(pa.PythonFile(stream, mode="r"))
+
+
+def _ipc_stream_metadata(schema: pa.Schema) -> dict[bytes, bytes]:
+    """Return the metadata to attach to a schema read from an IPC stream.
+
+    The stream is a transport between barrow processes, so a ``format``
+    recorded by the upstream reader is kept and the final output defaults to
+    the original input format.
+    """
+    if schema.metadata and schema.metadata.get(b"format"):
+        return {}
+    return {b"format": b"arrow"}
+
+
+def _with_metadata(table: pa.Table, metadata: dict[bytes, bytes]) -> pa.Table:
+    return table.replace_schema_metadata(dict(table.schema.metadata or {}) | metadata)
+
+
 def read_table(
     path: str | None,
     format: str | None,
@@ -48,110 +250,663 @@ def read_table(
         Path to the input file. When ``None`` the data is read from ``STDIN``.
     format:
         The file format. Supported values are ``"csv"``, ``"parquet"``,
-        ``"feather"`` and ``"orc"``. If ``None``, the format is inferred from
-        ``path`` or the input data.
+        ``"feather"``, ``"orc"`` and ``"arrow"`` (the Arrow IPC stream
+        format). If ``None``, the format is inferred from ``path`` or the
+        input data.
     input_delimiter:
         Field delimiter for CSV inputs. When ``None`` the delimiter is guessed
         from the data using :class:`csv.Sniffer`.
+
+    A directory or a glob pattern such as ``"logs/**/*.parquet"`` is read as
+    one dataset; see :func:`read_batches`.
     """
 
-    data: bytes | None = None
     fmt = format.lower() if format else None
+    if path and is_dataset_path(path):
+        return read_batches(path, fmt, input_delimiter).read_all()
+    head: bytes | None = None
     if fmt is None:
         if path:
             fmt = _detect_format(path, None)
         else:
-            data = sys.stdin.buffer.read()
-            fmt = _detect_format(None, data)
+            head = _peek_stdin()
+            fmt = _detect_format(None, head)
+    return _read_table(path, fmt, input_delimiter, head, format)
 
+
+def is_dataset_path(path: str) -> bool:
+    """Return ``True`` if *path* names a directory or a glob of files."""
+    if os.path.isdir(path):
+        return True
+    return not os.path.exists(path) and glob.has_magic(path)
+
+
+def _read_table(
+    path: str | None,
+    fmt: str,
+    input_delimiter: str | None,
+    head: bytes | None,
+    format: str | None = None,
+) -> pa.Table:
     if fmt == "csv":
         import pyarrow.csv as csv
 
-        metadata: dict[bytes, bytes] = {b"format": fmt.encode()}
-        prefix = b"# grouped_by:"
-        delimiter = input_delimiter
-        if path:
-            with open(path, "rb") as f:
-                first = f.readline()
-                sample = f.read(1024)
-            if first.startswith(prefix):
-                sample_bytes = sample
-            else:
-                sample_bytes = first + sample
-            if delimiter is None:
-                try:
-                    delimiter = stdcsv.Sniffer().sniff(sample_bytes.decode()).delimiter
-                except Exception:
-                    delimiter = ","
-            parse_options = csv.ParseOptions(delimiter=delimiter)
-            with open(path, "rb") as f:
-                first = f.readline()
-                if first.startswith(prefix):
-                    metadata[b"grouped_by"] = first[len(prefix) :].strip()
-                else:
-                    f.seek(0)
-                table = csv.read_csv(f, parse_options=parse_options)
-        else:
-            if data is None:
-                data = sys.stdin.buffer.read()
-            if data.startswith(prefix):
-                newline = data.find(b"\n")
-                grouped = data[len(prefix) : newline].strip() if newline != -1 else b""
-                metadata[b"grouped_by"] = grouped
-                data = data[newline + 1 :] if newline != -1 else b""
-            if delimiter is None:
-                sample = data[:1024]
-                try:
-                    delimiter = stdcsv.Sniffer().sniff(sample.decode()).delimiter
-                except Exception:
-                    delimiter = ","
-            parse_options = csv.ParseOptions(delimiter=delimiter)
-            table = csv.read_csv(pa.BufferReader(data), parse_options=parse_options)
-        if metadata:
-            table = table.replace_schema_metadata(
-                dict(table.schema.metadata or {}) | metadata
-            )
-        return table
+        source, delimiter, metadata, _ = _csv_source(path, head, input_delimiter)
+        parse_options = csv.ParseOptions(delimiter=delimiter)
+        try:
+            table = csv.read_csv(source, parse_options=parse_options)
+        finally:
+            if hasattr(source, "close"):
+                source.close()
+        return _with_metadata(table, metadata)
+    if fmt == "arrow":
+        with _open_ipc_stream(path, head) as stream:
+            table = stream.read_all()
+        return _with_metadata(table, _ipc_stream_metadata(table.schema))
     if fmt == "feather":
         import pyarrow.feather as feather
 
         if path:
-            table = feather.read_table(path)
+            table = feather.read_table(path, memory_map=True)
         else:
-            if data is None:
-                data = sys.stdin.buffer.read()
-            table = feather.read_table(pa.BufferReader(data))
-        table = table.replace_schema_metadata(
-            dict(table.schema.metadata or {}) | {b"format": fmt.encode()}
-        )
-        return table
+            table = feather.read_table(pa.BufferReader(_stdin_buffer(head)))
+        return _with_metadata(table, {b"format": fmt.encode()})
     if fmt == "parquet":
         import pyarrow.parquet as pq
 
         if path:
             table = pq.read_table(path)
         else:
-            if data is None:
-                data = sys.stdin.buffer.read()
-            table = pq.read_table(pa.BufferReader(data))
-        table = table.replace_schema_metadata(
-            dict(table.schema.metadata or {}) | {b"format": fmt.encode()}
-        )
-        return table
+            table = pq.read_table(pa.BufferReader(_stdin_buffer(head)))
+        return _with_metadata(table, {b"format": fmt.encode()})
     if fmt == "orc":
         import pyarrow.orc as orc
 
         if path:
             table = orc.read_table(path)
         else:
-            if data is None:
-                data = sys.stdin.buffer.read()
-            table = orc.read_table(pa.BufferReader(data))
-        table = table.replace_schema_metadata(
-            dict(table.schema.metadata or {}) | {b"format": fmt.encode()}
+            table = orc.read_table(pa.BufferReader(_stdin_buffer(head)))
+        return _with_metadata(table, {b"format": fmt.encode()})
+    raise UnsupportedFormatError(f"Unsupported format: {format or fmt}")
+
+
+def read_batches(
+    path: str | None,
+    format: str | None,
+    input_delimiter: str | None = None,
+    columns: list[str] | None = None,
+    batch_size: int | None = None,
+    block_size: int | None = None,
+    predicate: pc.Expression | None = None,
+    limit: int | None = None,
+    whole_csv: bool = False,
+) -> pa.RecordBatchReader:
+    """Open ``path`` or ``STDIN`` as a stream of record batches.
+
+    CSV inputs are parsed incrementally with :func:`pyarrow.csv.open_csv`,
+    Arrow IPC streams with :func:`pyarrow.ipc.open_stream`, and Parquet,
+    Feather and ORC files are scanned with :mod:`pyarrow.dataset`, which
+    decodes only the requested columns, so callers holding one batch at a
+    time stay within bounded memory.  Other binary formats arriving on
+    ``STDIN`` are read whole and re-chunked.
+
+    Parameters
+    ----------
+    path, format, input_delimiter:
+        Same as for :func:`read_table`.
+    columns:
+        Optional list of columns to keep.  Names missing from the input are
+        ignored; an empty selection keeps every column.
+    batch_size:
+        Maximum number of rows per batch. Defaults to ``65536``.
+    block_size:
+        Number of bytes the CSV reader parses at a time, which bounds its
+        memory use. Defaults to ``BARROW_CSV_BLOCK_SIZE`` when set and to
+        Arrow's default (1 MiB) otherwise.  CSV column types are inferred
+        from the first block, so it must be large enough to be
+        representative; a later value that does not fit raises
+        :class:`~barrow.errors.CsvTypeError`.
+    predicate:
+        Optional filter applied by the Parquet, Feather and ORC file
+        scanners, which skip row groups whose statistics cannot match.  It
+        is a pruning hint: other inputs ignore it, and so do the scanners
+        when it does not apply to the file's schema.
+    limit:
+        Optional maximum number of rows.  The input is closed as soon as
+        enough rows have been produced, and a Parquet file without a
+        *predicate* reads only the row groups that hold them.
+    whole_csv:
+        Read a CSV file whole with :func:`pyarrow.csv.read_csv`, which
+        infers column types from every row, instead of block by block.
+        ``STDIN`` is still read block by block.
+
+    A directory or a glob pattern (``**`` matches nested directories) is
+    scanned as one :mod:`pyarrow.dataset` whose files are read in parallel.
+    ``key=value`` directory names are exposed as partition columns, and
+    *predicate* conditions on them skip whole directories without opening
+    their files.
+    """
+
+    batch_size = batch_size or DEFAULT_BATCH_SIZE
+    reader = _open_batches(
+        path,
+        format,
+        input_delimiter,
+        columns,
+        batch_size,
+        block_size,
+        predicate,
+        limit,
+        whole_csv,
+    )
+    if limit is None:
+        return reader
+    return pa.RecordBatchReader.from_batches(reader.schema, _head(reader, limit))
+
+
+def _open_batches(
+    path: str | None,
+    format: str | None,
+    input_delimiter: str | None,
+    columns: list[str] | None,
+    batch_size: int,
+    block_size: int | None,
+    predicate: pc.Expression | None,
+    limit: int | None,
+    whole_csv: bool = False,
+) -> pa.RecordBatchReader:
+    fmt = format.lower() if format else None
+    if path and is_dataset_path(path):
+        return _scan_dataset(path, fmt, columns, batch_size, predicate, input_delimiter)
+    head: bytes | None = None
+    if fmt is None:
+        if path:
+            fmt = _detect_format(path, None)
+        else:
+            head = _peek_stdin()
+            fmt = _detect_format(None, head)
+
+    if fmt == "csv" and not (whole_csv and path):
+        import pyarrow.csv as csv
+
+        source, delimiter, metadata, header = _csv_source(path, head, input_delimiter)
+        read_options = csv.ReadOptions()
+        size = _csv_block_size(block_size)
+        if size:
+            read_options.block_size = size
+        convert_options = csv.ConvertOptions()
+        if header is not None:
+            # Skip decoding the columns that are not needed.
+            include = _existing_columns(header, columns, metadata)
+            # Arrow reads every column for an empty ``include_columns``.
+            if include:
+                convert_options.include_columns = include
+        stream = csv.open_csv(
+            source,
+            read_options=read_options,
+            parse_options=csv.ParseOptions(delimiter=delimiter),
+            convert_options=convert_options,
         )
-        return table
-    raise UnsupportedFormatError(f"Unsupported format: {format}")
+        schema = stream.schema
+        cols = _existing_columns(schema.names, columns, metadata)
+        if cols is not None:
+            schema = _select_schema(schema, cols)
+
+        def _csv_batches():
+            try:
+                for batch in _csv_stream(stream, path):
+                    batch = batch.select(cols) if cols is not None else batch
+                    yield from _rechunk(batch, batch_size)
+            finally:
+                if hasattr(source, "close"):
+                    source.close()
+                    _drain(stream)
+                stream.close()
+
+        return _reader(schema, _csv_batches(), metadata)
+    if fmt == "arrow":
+        ipc_stream = _open_ipc_stream(path, head)
+        schema = ipc_stream.schema
+        metadata = _ipc_stream_metadata(schema)
+        cols = _existing_columns(schema.names, columns, schema.metadata)
+        if cols is not None:
+            schema = _select_schema(schema, cols)
+
+        def _stream_batches():
+            with ipc_stream:
+                for batch in ipc_stream:
+                    batch = batch.select(cols) if cols is not None else batch
+                    yield from _rechunk(batch, batch_size)
+
+        return _reader(schema, _stream_batches(), metadata)
+    if path and fmt == "parquet" and limit is not None and predicate is None:
+        return _parquet_head(path, columns, batch_size, limit)
+    if path and fmt in _DATASET_FORMATS:
+        return _scan_dataset(path, fmt, columns, batch_size, predicate)
+    table = _read_table(path, fmt, input_delimiter, head, format)
+    cols = _existing_columns(table.column_names, columns, table.schema.metadata)
+    if cols is not None:
+        table = table.select(cols)
+    return table.to_reader(max_chunksize=batch_size)
+
+
+_DATASET_FORMATS = {"parquet": "parquet", "feather": "ipc", "orc": "orc"}
+
+
+def read_column_names(
+    path: str,
+    format: str | None = None,
+    input_delimiter: str | None = None,
+) -> list[str]:
+    """Return the column names of the table stored at ``path``.
+
+    Only the file's metadata, or the header line of a CSV file, is read, so
+    planners can resolve column references without decoding any data.
+    """
+    fmt = format.lower() if format else None
+    if is_dataset_path(path):
+        dataset, _ = _open_dataset(path, fmt, input_delimiter)
+        return dataset.schema.names
+    fmt = fmt or _detect_format(path, None)
+    if fmt == "csv":
+        source, delimiter, _, header = _csv_source(path, None, input_delimiter)
+        if hasattr(source, "close"):
+            source.close()
+        if header is not None:
+            return header
+        return read_batches(path, fmt, delimiter).schema.names
+    if fmt == "arrow":
+        with pa.memory_map(path) as f:
+            return pa.ipc.open_stream(f).schema.names
+    if fmt in _DATASET_FORMATS:
+        return _dataset(path, fmt).schema.names
+    raise UnsupportedFormatError(f"Unsupported format: {format or fmt}")
+
+
+def read_schema(
+    path: str,
+    format: str | None = None,
+    input_delimiter: str | None = None,
+) -> pa.Schema:
+    """Return the Arrow schema of the table stored at ``path``.
+
+    Like :func:`read_column_names`, only metadata is read, except that the
+    column types of a CSV file are inferred from its first block, as when
+    the file is read.
+    """
+    fmt = format.lower() if format else None
+    if is_dataset_path(path):
+        dataset, _ = _open_dataset(path, fmt, input_delimiter)
+        return dataset.schema
+    fmt = fmt or _detect_format(path, None)
+    if fmt == "csv":
+        import pyarrow.csv as csv
+
+        source, delimiter, metadata, _ = _csv_source(path, None, input_delimiter)
+        read_options = csv.ReadOptions()
+        size = _csv_block_size(None)
+        if size:
+            read_options.block_size = size
+        stream = None
+        try:
+            stream = csv.open_csv(
+                source,
+                read_options=read_options,
+                parse_options=csv.ParseOptions(delimiter=delimiter),
+            )
+            schema = stream.schema
+        finally:
+            if hasattr(source, "close"):
+                source.close()
+            if stream is not None:
+                if hasattr(source, "close"):
+                    _drain(stream)
+                stream.close()
+        return schema.with_metadata(dict(schema.metadata or {}) | metadata)
+    if fmt == "arrow":
+        with pa.memory_map(path) as f:
+            return pa.ipc.open_stream(f).schema
+    if fmt in _DATASET_FORMATS:
+        return _dataset(path, fmt).schema
+    raise UnsupportedFormatError(f"Unsupported format: {format or fmt}")
+
+
+#: Files of a dataset whose statistics are read; the rest are extrapolated
+#: from their size.
+_STATISTICS_SAMPLE_FILES = 8
+
+
+@dataclass(frozen=True)
+class SourceStatistics:
+    """Size of a stored table, from file metadata or a sample of it.
+
+    ``num_bytes`` approximates the decoded in-memory size.  ``exact`` tells
+    whether ``num_rows`` comes from metadata rather than an extrapolation.
+    ``column_bytes`` holds per-column sizes where the format records them
+    (Parquet); otherwise the bytes are split evenly between the columns.
+    """
+
+    num_rows: int
+    num_bytes: int
+    columns: tuple[str, ...]
+    exact: bool = True
+    column_bytes: dict[str, int] | None = None
+
+    def bytes_for(self, columns: list[str] | None) -> int:
+        """Return the estimated bytes of *columns* (all when ``None``)."""
+        if columns is None or not self.columns:
+            return self.num_bytes
+        selected = [c for c in columns if c in self.columns]
+        if self.column_bytes is not None:
+            return sum(self.column_bytes.get(c, 0) for c in selected)
+        return self.num_bytes * len(selected) // len(self.columns)
+
+
+def read_statistics(
+    path: str,
+    format: str | None = None,
+    input_delimiter: str | None = None,
+) -> SourceStatistics:
+    """Return the row count and size of the table stored at ``path``.
+
+    Parquet and ORC row counts come from the file footer and Feather ones
+    from the batch headers.  CSV files and Arrow IPC streams are
+    extrapolated from their leading bytes.  Of a dataset, only the first
+    few files are inspected and the rest are scaled by file size.
+    """
+    fmt = format.lower() if format else None
+    if not is_dataset_path(path):
+        return _file_statistics(
+            path, fmt or _detect_format(path, None), input_delimiter
+        )
+    dataset, fmt = _open_dataset(path, fmt, input_delimiter)
+    files = dataset.files
+    sample = [
+        _file_statistics(f, fmt, input_delimiter)
+        for f in files[:_STATISTICS_SAMPLE_FILES]
+    ]
+    sampled_size = sum(os.path.getsize(f) for f in files[:_STATISTICS_SAMPLE_FILES])
+    scale = sum(os.path.getsize(f) for f in files) / max(sampled_size, 1)
+    return SourceStatistics(
+        num_rows=int(sum(s.num_rows for s in sample) * scale),
+        num_bytes=int(sum(s.num_bytes for s in sample) * scale),
+        columns=tuple(dataset.schema.names),
+        exact=len(sample) == len(files) and all(s.exact for s in sample),
+    )
+
+
+def _file_statistics(
+    path: str, fmt: str, input_delimiter: str | None
+) -> SourceStatistics:
+    size = os.path.getsize(path)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_metadata(path)
+        column_bytes: dict[str, int] = {}
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            for j in range(row_group.num_columns):
+                chunk = row_group.column(j)
+                name = chunk.path_in_schema.split(".")[0]
+                column_bytes[name] = (
+                    column_bytes.get(name, 0) + chunk.total_uncompressed_size
+                )
+        return SourceStatistics(
+            num_rows=metadata.num_rows,
+            num_bytes=sum(column_bytes.values()),
+            columns=tuple(metadata.schema.to_arrow_schema().names),
+            column_bytes=column_bytes,
+        )
+    if fmt == "orc":
+        import pyarrow.orc as orc
+
+        orc_file = orc.ORCFile(path)
+        return SourceStatistics(orc_file.nrows, size, tuple(orc_file.schema.names))
+    if fmt == "feather":
+        dataset = _dataset(path, fmt)
+        return SourceStatistics(dataset.count_rows(), size, tuple(dataset.schema.names))
+    if fmt == "arrow":
+        with pa.memory_map(path) as f:
+            reader = pa.ipc.open_stream(f)
+            names = tuple(reader.schema.names)
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                return SourceStatistics(0, 0, names)
+        width = batch.nbytes / max(batch.num_rows, 1)
+        return SourceStatistics(
+            int(size / max(width, 1)), size, names, exact=batch.nbytes >= size
+        )
+    if fmt == "csv":
+        source, _, metadata, header = _csv_source(path, None, input_delimiter)
+        if hasattr(source, "close"):
+            source.close()
+        with open(path, "rb") as f:
+            sample = f.read(_PEEK_SIZE)
+        lines = max(sample.count(b"\n"), 1)
+        if len(sample) < _PEEK_SIZE:
+            # The whole file was read: count the rows below the header.
+            skipped = (header is not None) + (b"grouped_by" in metadata)
+            rows = sample.count(b"\n") - skipped
+            return SourceStatistics(max(rows, 0), size, tuple(header or ()))
+        return SourceStatistics(
+            int(size * lines / len(sample)), size, tuple(header or ()), exact=False
+        )
+    raise UnsupportedFormatError(f"Unsupported format: {fmt}")
+
+
+def _scan_dataset(
+    path: str,
+    fmt: str | None,
+    columns: list[str] | None,
+    batch_size: int,
+    predicate: pc.Expression | None,
+    input_delimiter: str | None = None,
+) -> pa.RecordBatchReader:
+    """Scan files with :mod:`pyarrow.dataset`.
+
+    *path* is a single Parquet, Feather or ORC file, or a directory or glob
+    pattern of such files or of CSV files.
+    """
+    dataset, fmt = _open_dataset(path, fmt, input_delimiter)
+    schema = dataset.schema
+    cols = _existing_columns(schema.names, columns, schema.metadata)
+    if cols is not None:
+        schema = _select_schema(schema, cols)
+    try:
+        scanner = dataset.scanner(columns=cols, filter=predicate, batch_size=batch_size)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        # The predicate does not bind to this schema; the Filter above the
+        # scan reports any real error.
+        scanner = dataset.scanner(columns=cols, batch_size=batch_size)
+    return _reader(schema, scanner.to_batches(), {b"format": fmt.encode()})
+
+
+def _open_dataset(path: str, fmt: str | None, input_delimiter: str | None):
+    """Return a :class:`pyarrow.dataset.Dataset` over *path* and its format."""
+    if not is_dataset_path(path):
+        assert fmt is not None
+        return _dataset(path, fmt), fmt
+
+    if os.path.isdir(path):
+        files = sorted(
+            os.path.join(root, name)
+            for root, dirs, names in os.walk(path)
+            for name in names
+            if not name.startswith((".", "_"))
+        )
+        base = path
+    else:
+        files = sorted(glob.glob(path, recursive=True))
+        files = [f for f in files if os.path.isfile(f)]
+        base = _glob_base(path)
+    if not files:
+        raise BarrowIOError(f"No input files found for {path!r}")
+
+    fmt = fmt or _detect_format(files[0], None)
+    if fmt == "csv":
+        import pyarrow.csv as csv
+        import pyarrow.dataset as ds
+
+        if input_delimiter is None:
+            _, input_delimiter, _, _ = _csv_source(files[0], None, None)
+        file_format = ds.CsvFileFormat(
+            parse_options=csv.ParseOptions(delimiter=input_delimiter)
+        )
+    elif fmt in _DATASET_FORMATS:
+        file_format = _DATASET_FORMATS[fmt]
+    else:
+        raise UnsupportedFormatError(
+            f"Format {fmt!r} cannot be read from several files"
+        )
+    dataset = _dataset(
+        files, fmt, format=file_format, partitioning="hive", partition_base_dir=base
+    )
+    return dataset, fmt
+
+
+def _dataset(source, fmt: str, **kwargs):
+    """Open a :class:`pyarrow.dataset.Dataset` over *source*.
+
+    Feather files are memory-mapped: the buffers of an uncompressed file
+    are views of the page cache, so columns that are not selected are never
+    read and the resident size stays small regardless of the file size.
+    """
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    kwargs.setdefault("format", _DATASET_FORMATS.get(fmt))
+    if fmt == "feather":
+        kwargs["filesystem"] = fs.LocalFileSystem(use_mmap=True)
+    return ds.dataset(source, **kwargs)
+
+
+def _parquet_head(
+    path: str, columns: list[str] | None, batch_size: int, limit: int
+) -> pa.RecordBatchReader:
+    """Read the leading row groups of a Parquet file holding *limit* rows."""
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    schema = parquet_file.schema_arrow
+    cols = _existing_columns(schema.names, columns, schema.metadata)
+    if cols is not None:
+        schema = _select_schema(schema, cols)
+    row_groups, rows = [], 0
+    for i in range(parquet_file.num_row_groups):
+        if rows >= limit:
+            break
+        row_groups.append(i)
+        rows += parquet_file.metadata.row_group(i).num_rows
+    batches = parquet_file.iter_batches(
+        batch_size=batch_size, row_groups=row_groups, columns=cols
+    )
+    return _reader(schema, batches, {b"format": b"parquet"})
+
+
+def _csv_stream(stream: pa.RecordBatchReader, path: str | None):
+    """Yield the batches of a CSV *stream*, raising its errors as barrow's."""
+    name = path or "STDIN"
+    try:
+        yield from stream
+    except pa.ArrowInvalid as exc:
+        if "conversion error" in str(exc):
+            raise CsvTypeError(
+                f"{name}: {exc}. Column types are inferred from the first block "
+                "of a CSV input; set BARROW_CSV_BLOCK_SIZE to a larger size"
+            ) from exc
+        raise BarrowIOError(f"{name}: {exc}") from exc
+
+
+def _drain(stream: pa.RecordBatchReader) -> None:
+    """Read a CSV *stream* to its end after its Python source was closed.
+
+    The CSV reader reads ahead on an Arrow thread.  For a Python file, that
+    thread calls into the interpreter, so releasing the reader while it is
+    blocked in a read deadlocks, and exiting the interpreter crashes it.
+    Reads of the closed source end the stream, so consuming the blocks
+    already read ahead lets the thread finish first.
+    """
+    try:
+        for _ in stream:
+            pass
+    except (pa.ArrowException, OSError, ValueError):
+        pass
+
+
+def _head(reader: pa.RecordBatchReader, limit: int):
+    """Yield the first *limit* rows of *reader*, then close it."""
+    remaining = limit
+    try:
+        if remaining <= 0:
+            return
+        for batch in reader:
+            if batch.num_rows >= remaining:
+                yield batch.slice(0, remaining)
+                break
+            remaining -= batch.num_rows
+            yield batch
+    finally:
+        reader.close()
+
+
+def _glob_base(pattern: str) -> str:
+    """Return the directory above the first wildcard of *pattern*."""
+    parts = []
+    for part in Path(pattern).parts:
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return str(Path(*parts)) if parts else "."
+
+
+def _rechunk(batch: pa.RecordBatch, batch_size: int):
+    """Split *batch* into slices of at most *batch_size* rows."""
+    if batch.num_rows <= batch_size:
+        yield batch
+        return
+    for offset in range(0, batch.num_rows, batch_size):
+        yield batch.slice(offset, batch_size)
+
+
+def _existing_columns(
+    names: list[str],
+    columns: list[str] | None,
+    metadata: dict[bytes, bytes] | None = None,
+) -> list[str] | None:
+    """Return the requested columns present in *names*, or ``None`` for all.
+
+    The grouping keys recorded in *metadata* are always kept, so a pruned
+    grouped input can still be summarized.  If none of the requested
+    columns exist the selection is empty, and only the row count is read.
+    """
+    if not columns:
+        return None
+    grouped = (metadata or {}).get(b"grouped_by")
+    if grouped:
+        columns = [*columns, *grouped.decode().split(",")]
+    available = set(names)
+    return [c for c in dict.fromkeys(columns) if c in available]
+
+
+def _select_schema(schema: pa.Schema, columns: list[str]) -> pa.Schema:
+    fields = [schema.field(c) for c in columns]
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _reader(
+    schema: pa.Schema, batches, metadata: dict[bytes, bytes]
+) -> pa.RecordBatchReader:
+    """Wrap *batches* in a reader whose schema carries *metadata*."""
+    schema = schema.with_metadata(dict(schema.metadata or {}) | metadata)
+    return pa.RecordBatchReader.from_batches(schema, batches)
 
 
-__all__ = ["read_table"]
+__all__ = [
+    "SourceStatistics",
+    "read_table",
+    "read_batches",
+    "read_column_names",
+    "read_statistics",
+]
@@ -5,7 +5,36 @@ import sys
 
 import pyarrow as pa
 
-from ..errors import UnsupportedFormatError
+from ..errors import BarrowIOError, UnsupportedFormatError
+from .options import WriteOptions
+
+# Feather files are LZ4-compressed unless configured otherwise.
+_FEATHER_CODEC = "lz4" if pa.Codec.is_available("lz4_frame") else None
+
+
+def _resolve_format(path: str | None, format: str | None, schema: pa.Schema) -> str:
+    """Return the output format from *format*, *path* or schema metadata."""
+
+    fmt = format.lower() if format else None
+    if fmt is None and path:
+        ext = Path(path).suffix.lower()
+        if ext == ".csv":
+            fmt = "csv"
+        elif ext == ".parquet":
+            fmt = "parquet"
+        elif ext == ".feather":
+            fmt = "feather"
+        elif ext == ".orc":
+            fmt = "orc"
+        elif ext == ".arrows":
+            fmt = "arrow"
+    if fmt is None and schema.metadata:
+        fmt_meta = schema.metadata.get(b"format")
+        if fmt_meta:
+            fmt = fmt_meta.decode().lower()
+    if fmt is None:
+        fmt = "csv"
+    return fmt
 
 
 def write_table(
@@ -13,6 +42,7 @@ def write_table(
     path: str | None,
     format: str | None,
     output_delimiter: str | None = None,
+    options: WriteOptions | None = None,
 ) -> None:
     """Write ``table`` to ``path`` or ``STDOUT``.
 
@@ -24,29 +54,17 @@ def write_table(
         Destination path. When ``None`` the table is written to ``STDOUT``.
     format:
         The file format. Supported values are ``"csv"``, ``"parquet``,
-        ``"feather"`` and ``"orc"``. If ``None``, the format is inferred from
-        ``path`` when available and otherwise defaults to CSV.
+        ``"feather"``, ``"orc"`` and ``"arrow"`` (the Arrow IPC stream
+        format). If ``None``, the format is inferred from ``path`` when
+        available and otherwise defaults to CSV.
     output_delimiter:
         Field delimiter for CSV outputs. When ``None`` a comma is used.
+    options:
+        Compression and encoding settings for binary formats.
     """
 
-    fmt = format.lower() if format else None
-    if fmt is None and path:
-        ext = Path(path).suffix.lower()
-        if ext == ".csv":
-            fmt = "csv"
-        elif ext == ".parquet":
-            fmt = "parquet"
-        elif ext == ".feather":
-            fmt = "feather"
-        elif ext == ".orc":
-            fmt = "orc"
-    if fmt is None and table.schema.metadata:
-        fmt_meta = table.schema.metadata.get(b"format")
-        if fmt_meta:
-            fmt = fmt_meta.decode().lower()
-    if fmt is None:
-        fmt = "csv"
+    options = options or WriteOptions()
+    fmt = _resolve_format(path, format, table.schema)
 
     if fmt == "csv":
         import pyarrow.csv as csv
@@ -72,28 +90,228 @@ def write_table(
     if fmt == "parquet":
         import pyarrow.parquet as pq
 
-        if path:
-            pq.write_table(table, path)
-        else:
-            pq.write_table(table, sys.stdout.buffer)
+        pq.write_table(
+            table,
+            path or sys.stdout.buffer,
+            row_group_size=options.row_group_size,
+            **options.parquet_kwargs(table.schema),
+        )
         return
     if fmt == "feather":
-        import pyarrow.feather as feather
-
-        if path:
-            feather.write_feather(table, path)
-        else:
-            feather.write_feather(table, sys.stdout.buffer)
+        sink = path if path else sys.stdout.buffer
+        ipc_options = options.ipc_options(_FEATHER_CODEC)
+        with pa.ipc.new_file(sink, table.schema, options=ipc_options) as writer:
+            writer.write_table(table)
         return
     if fmt == "orc":
         import pyarrow.orc as orc
 
-        if path:
-            orc.write_table(table, path)
-        else:
-            orc.write_table(table, sys.stdout.buffer)
+        orc.write_table(
+            table, path or sys.stdout.buffer, **options.orc_kwargs(table.schema)
+        )
+        return
+    if fmt == "arrow":
+        sink = path if path else sys.stdout.buffer
+        with pa.ipc.new_stream(
+            sink, table.schema, options=options.ipc_options()
+        ) as writer:
+            writer.write_table(table)
         return
     raise UnsupportedFormatError(f"Unsupported format: {format}")
 
 
-__all__ = ["write_table"]
+def write_batches(
+    reader: pa.RecordBatchReader,
+    path: str | None,
+    format: str | None,
+    output_delimiter: str | None = None,
+    options: WriteOptions | None = None,
+) -> int:
+    """Write the batches of ``reader`` to ``path`` or ``STDOUT`` incrementally.
+
+    Parameters mirror :func:`write_table`; the format is inferred from the
+    reader's schema metadata when neither ``format`` nor ``path`` decide it.
+    Only one batch is held in memory at a time; with the ``"arrow"`` stream
+    format each batch reaches the consumer as soon as it is written.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+
+    options = options or WriteOptions()
+    schema = reader.schema
+    fmt = _resolve_format(path, format, schema)
+    if fmt not in ("csv", "parquet", "feather", "orc", "arrow"):
+        raise UnsupportedFormatError(f"Unsupported format: {format}")
+
+    # Resolve the options first so invalid ones fail before the output file
+    # is truncated.
+    if fmt == "parquet":
+        parquet_kwargs = options.parquet_kwargs(schema)
+    elif fmt in ("feather", "arrow"):
+        ipc_options = options.ipc_options(_FEATHER_CODEC if fmt == "feather" else None)
+    elif fmt == "orc":
+        orc_kwargs = options.orc_kwargs(schema)
+
+    rows = 0
+    sink = open(path, "wb") if path else sys.stdout.buffer
+    try:
+        if fmt == "csv":
+            import pyarrow.csv as csv
+
+            grouped = schema.metadata.get(b"grouped_by") if schema.metadata else None
+            if grouped:
+                sink.write(b"# grouped_by: " + grouped + b"\n")
+            write_options = csv.WriteOptions(delimiter=output_delimiter or ",")
+            with csv.CSVWriter(sink, schema, write_options=write_options) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    rows += batch.num_rows
+        elif fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            group_size = options.row_group_size
+            pending: list[pa.RecordBatch] = []
+            pending_rows = 0
+            with pq.ParquetWriter(sink, schema, **parquet_kwargs) as writer:
+                for batch in reader:
+                    rows += batch.num_rows
+                    if group_size is None:
+                        writer.write_batch(batch)
+                        continue
+                    # Buffer batches so row groups reach the requested size.
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    if pending_rows >= group_size:
+                        table = pa.Table.from_batches(pending, schema=schema)
+                        full = pending_rows - pending_rows % group_size
+                        writer.write_table(table.slice(0, full), group_size)
+                        pending = table.slice(full).to_batches()
+                        pending_rows -= full
+                if pending_rows:
+                    writer.write_table(
+                        pa.Table.from_batches(pending, schema=schema), group_size
+                    )
+        elif fmt == "feather":
+            with pa.ipc.new_file(sink, schema, options=ipc_options) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    rows += batch.num_rows
+        elif fmt == "arrow":
+            with pa.ipc.new_stream(sink, schema, options=ipc_options) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    rows += batch.num_rows
+        else:
+            import pyarrow.orc as orc
+
+            writer = orc.ORCWriter(sink, **orc_kwargs)
+            try:
+                wrote = False
+                for batch in reader:
+                    writer.write(pa.Table.from_batches([batch], schema=schema))
+                    rows += batch.num_rows
+                    wrote = True
+                if not wrote:
+                    writer.write(schema.empty_table())
+            finally:
+                writer.close()
+    finally:
+        if path:
+            sink.close()
+        else:
+            sink.flush()
+    return rows
+
+
+# File formats :func:`write_dataset` can produce, with their extensions.
+_DATASET_FORMATS = {
+    "parquet": ("parquet", "parquet"),
+    "feather": ("ipc", "feather"),
+    "csv": ("csv", "csv"),
+}
+
+
+def write_dataset(
+    reader: pa.RecordBatchReader,
+    path: str | None,
+    format: str | None,
+    output_delimiter: str | None = None,
+    partition_by: list[str] | None = None,
+    max_rows_per_file: int | None = None,
+    options: WriteOptions | None = None,
+) -> int:
+    """Write the batches of ``reader`` as a dataset of files under ``path``.
+
+    Rows are split into Hive-style ``column=value`` directories for the
+    *partition_by* columns, which are not repeated inside the files, and no
+    file receives more than *max_rows_per_file* rows.  Batches are written
+    as they arrive.  Files are named ``part-N.<ext>``; existing files with
+    the same names are replaced and others are left alone.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    import pyarrow.dataset as ds
+
+    options = options or WriteOptions()
+    if not path:
+        raise BarrowIOError("Partitioned or sharded output requires --output")
+    schema = reader.schema
+    fmt = _resolve_format(None, format, schema)
+    if fmt not in _DATASET_FORMATS:
+        raise UnsupportedFormatError(
+            f"Format {fmt!r} cannot be written as a partitioned dataset"
+        )
+    missing = [c for c in partition_by or [] if c not in schema.names]
+    if missing:
+        raise BarrowIOError(f"Unknown partition columns: {', '.join(missing)}")
+    ds_format, extension = _DATASET_FORMATS[fmt]
+    if fmt == "csv":
+        file_options = ds.CsvFileFormat().make_write_options(
+            delimiter=output_delimiter or ","
+        )
+    elif fmt == "parquet":
+        file_options = ds.ParquetFileFormat().make_write_options(
+            **options.parquet_kwargs(schema)
+        )
+    else:
+        file_options = ds.IpcFileFormat().make_write_options()
+        file_options.write_options = options.ipc_options(_FEATHER_CODEC)
+
+    rows = 0
+
+    def _counted():
+        nonlocal rows
+        for batch in reader:
+            rows += batch.num_rows
+            yield batch
+
+    limits = {}
+    group_size = options.row_group_size or 1024 * 1024
+    if max_rows_per_file:
+        limits["max_rows_per_file"] = max_rows_per_file
+        group_size = min(max_rows_per_file, group_size)
+    if max_rows_per_file or options.row_group_size:
+        limits["max_rows_per_group"] = group_size
+    if options.row_group_size:
+        limits["min_rows_per_group"] = group_size
+    ds.write_dataset(
+        pa.RecordBatchReader.from_batches(schema, _counted()),
+        path,
+        format=ds_format,
+        file_options=file_options,
+        partitioning=partition_by or None,
+        partitioning_flavor="hive" if partition_by else None,
+        basename_template=f"part-{{i}}.{extension}",
+        existing_data_behavior="overwrite_or_ignore",
+        **limits,
+    )
+    return rows
+
+
+__all__ = ["write_table", "write_batches", "write_dataset"]
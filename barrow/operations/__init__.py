@@ -11,10 +11,10 @@ from .mutate import mutate
 from .groupby import groupby
 from .summary import summary
 from .ungroup import ungroup
-from .join import join
+from .join import join, join_batches
 from .window import window
 from .sql import sql
-from .sort import sort
+from .sort import sort, top_k
 
 __all__ = [
     "select",
@@ -24,7 +24,9 @@ __all__ = [
     "summary",
     "ungroup",
     "join",
+    "join_batches",
     "window",
     "sql",
     "sort",
+    "top_k",
 ]
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from typing import Any, Mapping
 
-from ..expr import Expression
+import pyarrow as pa
+
+from ..expr import Expression, compile_expression, evaluate_arrow
+from ._env import build_env
+
+# Errors raised by Arrow kernels that do not support the operand types.
+_ARROW_TYPE_ERRORS = (pa.ArrowNotImplementedError, pa.ArrowTypeError, pa.ArrowInvalid)
 
 
 def evaluate_expression(expression: Expression, env: Mapping[str, Any]) -> Any:
@@ -28,11 +34,43 @@ def evaluate_expression(expression: Expression, env: Mapping[str, Any]) -> Any:
     NameError
         If a referenced name is not found in ``env``.
     """
+    evaluator = compile_expression(expression)
     try:
-        return expression.evaluate(env)
+        return evaluator(env)
     except (KeyError, NameError) as exc:  # pragma: no cover - exercised in tests
         # ``KeyError`` occurs for missing variables while a ``NameError``
         # can be raised for missing functions.  Include the missing name
         # in the error message for clarity.
         missing = exc.args[0]
         raise NameError(f"name '{missing}' is not defined") from None
+
+
+def evaluate_table_expression(expression: Expression, table: pa.Table) -> Any:
+    """Evaluate *expression* against the columns of *table*.
+
+    The expression runs on the Arrow buffers through
+    :func:`~barrow.expr.evaluate_arrow`.  Sub-expressions without an Arrow
+    kernel are evaluated with the NumPy environment from
+    :func:`~barrow.operations._env.build_env`, and so is the whole expression
+    when a kernel rejects the column types.  Columns are converted to NumPy
+    only when the fallback needs them.
+
+    Raises
+    ------
+    NameError
+        If a referenced name is neither a column nor a NumPy attribute.
+    """
+    env: Mapping[str, Any] | None = None
+
+    def _numpy_env() -> Mapping[str, Any]:
+        nonlocal env
+        if env is None:
+            env = build_env(table, columns=set())
+        return env
+
+    try:
+        return evaluate_arrow(
+            expression, table, lambda sub: evaluate_expression(sub, _numpy_env())
+        )
+    except _ARROW_TYPE_ERRORS:
+        return evaluate_expression(expression, _numpy_env())
@@ -3,31 +3,96 @@
 from __future__ import annotations
 
 import logging
-import pyarrow as pa
+from typing import Any
 
-from ..expr import Expression
-from ..expr.analyzer import referenced_names
-from ._env import build_env
-from ._expr_eval import evaluate_expression
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ..expr import BinaryExpression, Expression, referenced_names
+from ..expr.compiler_arrow import is_elementwise
+from ._expr_eval import evaluate_table_expression
 
 logger = logging.getLogger(__name__)
 
+#: Largest fraction of rows for which a later conjunct is evaluated on the
+#: remaining rows only; above it, evaluating the whole table is cheaper.
+_SELECTIVE_FRACTION = 0.25
+
 
 def filter(table: pa.Table, expression: Expression) -> pa.Table:
     """Filter ``table`` by evaluating ``expression``.
 
-    The expression is evaluated with a namespace containing the table's
-    columns and functions from :mod:`numpy` provided by
-    :func:`~barrow.operations._env.build_env`.
+    The expression is evaluated on the table's columns with Arrow compute
+    kernels, falling back to functions from :mod:`numpy` provided by
+    :func:`~barrow.operations._env.build_env` where no kernel exists.  Rows
+    where the expression is null are dropped.
+
+    The conjuncts of an ``and`` are evaluated in order, each element-wise
+    one only on the rows every earlier one kept, so cheap selective
+    conditions written first spare later ones most of the work.
     """
     logger.debug("Filtering with expression %s", expression)
-    env = build_env(table, columns=referenced_names(expression))
-    mask = evaluate_expression(expression, env)
-    logger.debug("Filter mask length %d", len(mask))
-    result = table.filter(pa.array(mask))
+    conjuncts = _conjuncts(expression)
+    if len(conjuncts) > 1:
+        result = _filter_selective(table, conjuncts)
+    else:
+        mask = _mask(evaluate_table_expression(expression, table), table.num_rows)
+        logger.debug("Filter mask length %d", len(mask))
+        result = table.filter(mask)
     logger.debug("Result has %d rows", result.num_rows)
     return result
 
 
+def _filter_selective(table: pa.Table, conjuncts: list[Expression]) -> pa.Table:
+    """Filter *table* by the conjunction of *conjuncts*, one at a time.
+
+    Once few enough rows remain, an element-wise conjunct is evaluated on
+    just those rows and the columns it references, and its result is
+    scattered back into the mask.  Other conjuncts, such as ``x > mean(x)``,
+    and all conjuncts while many rows remain run on the whole table.
+    """
+    num_rows = table.num_rows
+    keep: pa.Array | None = None
+    for conjunct in conjuncts:
+        if keep is None:
+            mask = evaluate_table_expression(conjunct, table)
+            keep = _filled(_mask(mask, num_rows))
+            continue
+        kept = pc.sum(keep).as_py() or 0
+        if kept > num_rows * _SELECTIVE_FRACTION or not is_elementwise(conjunct):
+            mask = _filled(_mask(evaluate_table_expression(conjunct, table), num_rows))
+            keep = pc.and_(keep, mask)
+            continue
+        names = referenced_names(conjunct)
+        rows = table.select([c for c in table.column_names if c in names])
+        mask = evaluate_table_expression(conjunct, rows.filter(keep))
+        keep = pc.replace_with_mask(keep, keep, _filled(_mask(mask, kept)))
+    assert keep is not None
+    return table.filter(keep)
+
+
+def _filled(mask: pa.Array | pa.ChunkedArray) -> pa.Array:
+    """Return *mask* as one array with nulls as ``False``."""
+    if isinstance(mask, pa.ChunkedArray):
+        mask = mask.combine_chunks()
+    return pc.fill_null(mask, False)
+
+
+def _mask(value: Any, num_rows: int) -> pa.Array | pa.ChunkedArray:
+    """Return *value* as a mask; a scalar keeps all *num_rows* rows or none."""
+    if isinstance(value, (pa.Array, pa.ChunkedArray)):
+        return value
+    if np.ndim(value) == 0:
+        keep = value is not None and bool(value)
+        return pa.array(np.full(num_rows, keep))
+    return pa.array(value)
+
+
+def _conjuncts(expression: Expression) -> list[Expression]:
+    if isinstance(expression, BinaryExpression) and expression.op == "and":
+        return _conjuncts(expression.left) + _conjuncts(expression.right)
+    return [expression]
+
+
 __all__ = ["filter"]
@@ -4,12 +4,55 @@ from __future__ import annotations
 
 import pyarrow as pa
 
+from ..errors import BarrowError
+
+# Join type names accepted on the command line and their Arrow equivalents.
+JOIN_TYPES = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+    "semi": "left semi",
+    "anti": "left anti",
+}
+
+# Join types that output only the left table's columns.
+_LEFT_ONLY = {"left semi", "left anti"}
+
+# Join types whose left side may be streamed against the right table, and
+# those whose right side may be streamed against the left table.
+_PROBE_LEFT = {"inner", "left outer", "left semi", "left anti"}
+_PROBE_RIGHT = {"inner"}
+
+
+def arrow_join_type(join_type: str) -> str:
+    """Return the Arrow name of *join_type*.
+
+    Both the short names of :data:`JOIN_TYPES` (``"left"``, ``"semi"``, ...)
+    and Arrow's own names (``"left outer"``, ``"left semi"``, ...) are
+    accepted.
+    """
+    name = join_type.strip().lower()
+    if name in JOIN_TYPES:
+        return JOIN_TYPES[name]
+    if name in JOIN_TYPES.values():
+        return name
+    raise BarrowError(
+        f"Unknown join type {join_type!r}; expected one of {', '.join(JOIN_TYPES)}"
+    )
+
+
+def can_stream(join_type: str, build_side: str = "right") -> bool:
+    """Return ``True`` if :func:`join_batches` supports this combination."""
+    probe_types = _PROBE_RIGHT if build_side == "left" else _PROBE_LEFT
+    return arrow_join_type(join_type) in probe_types
+
 
 def join(
     left: pa.Table,
     right: pa.Table,
-    left_on: str,
-    right_on: str,
+    left_on: str | list[str],
+    right_on: str | list[str],
     join_type: str = "inner",
 ) -> pa.Table:
     """Join ``left`` and ``right`` on the specified keys.
@@ -21,26 +64,134 @@ def join(
     right:
         Right table.
     left_on:
-        Join key in ``left``.
+        Join key, or list of keys, in ``left``.
     right_on:
-        Join key in ``right``.
+        Join key, or list of keys, in ``right``; paired with ``left_on``.
     join_type:
-        Type of join to perform. Defaults to ``"inner"``.
+        Type of join to perform: ``"inner"`` (the default), ``"left"``,
+        ``"right"``, ``"outer"``, ``"semi"`` or ``"anti"``, or the
+        equivalent Arrow name.
     """
-    if left_on not in left.column_names:
-        raise KeyError(left_on)
-    if right_on not in right.column_names:
-        raise KeyError(right_on)
-    overlap = (set(left.column_names) & set(right.column_names)) - {left_on, right_on}
-    if overlap:
+    left_keys, right_keys = _keys(left, right, left_on, right_on)
+    arrow_type = arrow_join_type(join_type)
+    overlap = (set(left.column_names) & set(right.column_names)) - {
+        *left_keys,
+        *right_keys,
+    }
+    if overlap and arrow_type not in _LEFT_ONLY:
         return left.join(
             right,
-            keys=left_on,
-            right_keys=right_on,
-            join_type=join_type,
+            keys=left_keys,
+            right_keys=right_keys,
+            join_type=arrow_type,
             right_suffix="_right",
         )
-    return left.join(right, keys=left_on, right_keys=right_on, join_type=join_type)
+    return left.join(right, keys=left_keys, right_keys=right_keys, join_type=arrow_type)
+
+
+def join_batches(
+    probe: pa.RecordBatchReader,
+    build: pa.Table,
+    left_on: str | list[str],
+    right_on: str | list[str],
+    join_type: str = "inner",
+    build_side: str = "right",
+) -> pa.RecordBatchReader:
+    """Stream ``probe`` through a hash table built on ``build``.
+
+    ``build`` is the right table of the join and ``probe`` the left one,
+    unless ``build_side`` is ``"left"``.  Only the build table is held in
+    memory; probe batches are joined as they arrive, and the result has the
+    same columns as :func:`join`, in no particular row order.  Inner joins
+    may build either side; left outer, semi and anti joins build the right
+    side (see :func:`can_stream`).
+    """
+    from pyarrow import acero
+
+    arrow_type = arrow_join_type(join_type)
+    if not can_stream(arrow_type, build_side):
+        raise BarrowError(
+            f"A {arrow_type} join cannot stream its "
+            f"{'right' if build_side == 'left' else 'left'} side"
+        )
+    if build_side == "left":
+        left_names, right_names = build.column_names, probe.schema.names
+    else:
+        left_names, right_names = probe.schema.names, build.column_names
+    left_keys, right_keys = _key_lists(left_on, right_on)
+    _check_keys(left_names, left_keys)
+    _check_keys(right_names, right_keys)
+    # Like Table.join, keep one copy of the keys and suffix the right-hand
+    # columns whose names collide.
+    right_output = [c for c in right_names if c not in right_keys]
+    if arrow_type in _LEFT_ONLY:
+        right_output = []
+    output = left_names + [f"{c}_right" if c in left_names else c for c in right_output]
+
+    probe_source = acero.Declaration(
+        "record_batch_reader_source", acero.RecordBatchReaderSourceNodeOptions(probe)
+    )
+    build_source = acero.Declaration(
+        "table_source", acero.TableSourceNodeOptions(build)
+    )
+    if build_side == "left":
+        options = acero.HashJoinNodeOptions(
+            arrow_type,
+            right_keys,
+            left_keys,
+            left_output=right_output,
+            right_output=left_names,
+            output_suffix_for_left="_right",
+        )
+    else:
+        options = acero.HashJoinNodeOptions(
+            arrow_type,
+            left_keys,
+            right_keys,
+            left_output=left_names,
+            right_output=right_output,
+            output_suffix_for_right="_right",
+        )
+    declaration = acero.Declaration(
+        "hashjoin", options, inputs=[probe_source, build_source]
+    )
+    if build_side == "left":
+        import pyarrow.compute as pc
+
+        declaration = acero.Declaration(
+            "project",
+            acero.ProjectNodeOptions([pc.field(c) for c in output], output),
+            inputs=[declaration],
+        )
+    return declaration.to_reader()
+
+
+def _keys(
+    left: pa.Table,
+    right: pa.Table,
+    left_on: str | list[str],
+    right_on: str | list[str],
+) -> tuple[list[str], list[str]]:
+    left_keys, right_keys = _key_lists(left_on, right_on)
+    _check_keys(left.column_names, left_keys)
+    _check_keys(right.column_names, right_keys)
+    return left_keys, right_keys
+
+
+def _key_lists(
+    left_on: str | list[str], right_on: str | list[str]
+) -> tuple[list[str], list[str]]:
+    left_keys = [left_on] if isinstance(left_on, str) else list(left_on)
+    right_keys = [right_on] if isinstance(right_on, str) else list(right_on)
+    if len(left_keys) != len(right_keys):
+        raise BarrowError(f"Join keys do not pair up: {left_keys} and {right_keys}")
+    return left_keys, right_keys
+
+
+def _check_keys(names: list[str], keys: list[str]) -> None:
+    for key in keys:
+        if key not in names:
+            raise KeyError(key)
 
 
-__all__ = ["join"]
+__all__ = ["JOIN_TYPES", "arrow_join_type", "can_stream", "join", "join_batches"]
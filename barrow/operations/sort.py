@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
 
@@ -23,6 +24,36 @@ def sort(
         Per-key sort direction.  ``True`` means descending.  Defaults to
         ascending for all keys when ``None`` or empty.
     """
+    indices = pc.sort_indices(table, sort_keys=_sort_keys(keys, descending))
+    return table.take(indices)
+
+
+def top_k(
+    table: pa.Table,
+    n: int,
+    keys: list[str],
+    descending: list[bool] | None = None,
+) -> pa.Table:
+    """Return the first *n* rows of *table* in the order :func:`sort` gives.
+
+    Uses a partial selection (:func:`pyarrow.compute.select_k_unstable`)
+    instead of sorting every row.  The row position breaks ties, so rows
+    with equal keys keep their input order as with :func:`sort`.
+    """
+    if n <= 0:
+        return table.slice(0, 0)
+    if table.num_rows <= n:
+        return sort(table, keys, descending)
+    position = _unique_name(table, "__barrow_position")
+    ranked = table.append_column(
+        position, pa.array(np.arange(table.num_rows, dtype=np.int64))
+    )
+    sort_keys = _sort_keys(keys, descending) + [(position, "ascending")]
+    indices = pc.select_k_unstable(ranked, k=n, sort_keys=sort_keys)
+    return table.take(indices)
+
+
+def _sort_keys(keys: list[str], descending: list[bool] | None) -> list[tuple[str, str]]:
     sort_keys: list[tuple[str, str]] = []
     for i, key in enumerate(keys):
         order = (
@@ -31,8 +62,13 @@ def sort(
             else "ascending"
         )
         sort_keys.append((key, order))
-    indices = pc.sort_indices(table, sort_keys=sort_keys)
-    return table.take(indices)
+    return sort_keys
+
+
+def _unique_name(table: pa.Table, name: str) -> str:
+    while name in table.column_names:
+        name = f"_{name}"
+    return name
 
 
-__all__ = ["sort"]
+__all__ = ["sort", "top_k"]
@@ -17,17 +17,52 @@ def _get_connection() -> duckdb.DuckDBPyConnection:
     return _connection
 
 
-def sql(table: pa.Table, query: str) -> pa.Table:
+def sql(table: pa.Table | None, query: str) -> pa.Table:
     """Return the result of *query* executed against *table*.
 
     The input table is registered as a view named ``tbl`` and the query is
     evaluated using DuckDB, returning the result as a new :class:`pa.Table`.
+    Without a *table*, the query reads its own inputs, e.g. with
+    ``read_parquet``.
     """
     con = _get_connection()
     con.unregister("tbl")
-    con.register("tbl", table)
+    if table is not None:
+        con.register("tbl", table)
     result = con.execute(query)
     return result.to_arrow_table()
 
 
-__all__ = ["sql"]
+def sql_batches(
+    batches: pa.RecordBatchReader | None,
+    query: str,
+    memory_limit: int | None = None,
+    temp_directory: str | None = None,
+) -> pa.RecordBatchReader:
+    """Return the result of *query* executed against *batches* as a stream.
+
+    DuckDB reads the input as the query runs, on a connection of its own.
+    With *memory_limit* (in bytes), its sorts, aggregations and joins spill
+    to *temp_directory* once they reach the limit.  As with :func:`sql`,
+    *batches* may be ``None`` for queries that read their own inputs.
+    """
+    config: dict[str, str | bool | int | float | list[str]] = {}
+    if memory_limit is not None:
+        config["memory_limit"] = f"{memory_limit}B"
+    if temp_directory is not None:
+        config["temp_directory"] = temp_directory
+    con = duckdb.connect(config=config)
+    if batches is not None:
+        con.register("tbl", batches)
+    result = con.execute(query).to_arrow_reader()
+
+    def _batches():
+        try:
+            yield from result
+        finally:
+            con.close()
+
+    return pa.RecordBatchReader.from_batches(result.schema, _batches())
+
+
+__all__ = ["sql", "sql_batches"]
@@ -1,5 +1,16 @@
 """Plan optimization for barrow."""
 
+from .cost import CostModel, OperatorCost, describe_costs
 from .optimizer import optimize
+from .properties import derive_properties
+from .schema import derive_schema, validate_plan
 
-__all__ = ["optimize"]
+__all__ = [
+    "CostModel",
+    "OperatorCost",
+    "derive_properties",
+    "derive_schema",
+    "describe_costs",
+    "optimize",
+    "validate_plan",
+]
@@ -0,0 +1,142 @@
+"""Cost model for choosing the backend that executes a node.
+
+A cost is an estimate in milliseconds: a fixed overhead plus a cost per
+input row, per operator and backend.  The defaults were fitted to timings
+of barrow's Arrow and DuckDB backends on 10K to 5M rows.  DuckDB pays about
+2 ms per query to register its input and convert the result, which
+dominates small inputs; it is faster for partitioned window functions
+from a few tens of thousands of rows, and slower than Arrow's hash
+aggregation at every size measured.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from barrow.core.nodes import Join, LogicalNode, SqlQuery
+
+from .properties import derive_properties
+
+#: Backends a node may be assigned to.
+BACKENDS = ("arrow", "duckdb")
+
+
+@dataclass(frozen=True)
+class OperatorCost:
+    """Linear cost of one operator on one backend, in milliseconds."""
+
+    fixed: float
+    per_row: float
+
+    def __call__(self, rows: int) -> float:
+        return self.fixed + self.per_row * rows
+
+
+#: Default costs, keyed by node type name and backend.
+DEFAULT_COSTS: dict[tuple[str, str], OperatorCost] = {
+    ("Filter", "arrow"): OperatorCost(0.3, 8.5e-6),
+    ("Mutate", "arrow"): OperatorCost(0.2, 2.2e-6),
+    ("Project", "arrow"): OperatorCost(0.05, 0.0),
+    ("Sort", "arrow"): OperatorCost(0.5, 1.9e-4),
+    ("TopK", "arrow"): OperatorCost(0.3, 1.0e-5),
+    ("Join", "arrow"): OperatorCost(0.5, 4.0e-5),
+    ("Aggregate", "arrow"): OperatorCost(0.15, 1.5e-5),
+    ("Aggregate", "duckdb"): OperatorCost(2.0, 3.0e-5),
+    ("Window", "arrow"): OperatorCost(0.5, 3.5e-4),
+    ("Window", "duckdb"): OperatorCost(3.0, 2.6e-4),
+    ("SqlQuery", "duckdb"): OperatorCost(2.0, 3.0e-5),
+}
+
+
+class CostModel:
+    """Estimate what executing a node on a backend costs.
+
+    The estimates come from a table of :class:`OperatorCost` entries, by
+    default :data:`DEFAULT_COSTS`.  Pass another table, or override
+    :meth:`cost`, to plug in other estimates.
+    """
+
+    def __init__(
+        self, costs: dict[tuple[str, str], OperatorCost] | None = None
+    ) -> None:
+        self.costs = dict(DEFAULT_COSTS if costs is None else costs)
+
+    def cost(self, node: LogicalNode, backend: str, rows: int) -> float | None:
+        """Return the cost of *node* on *backend* for *rows* input rows.
+
+        ``None`` means the model has no estimate, e.g. because the backend
+        cannot execute the node.
+        """
+        entry = self.costs.get((type(node).__name__, backend))
+        return None if entry is None else entry(rows)
+
+    def choose(self, node: LogicalNode, rows: int) -> tuple[str, float] | None:
+        """Return the cheapest backend for *node* and its cost."""
+        costs = [
+            (cost, backend)
+            for backend in BACKENDS
+            if (cost := self.cost(node, backend, rows)) is not None
+        ]
+        if not costs:
+            return None
+        cost, backend = min(costs)
+        return backend, cost
+
+
+def input_rows(node: LogicalNode) -> int | None:
+    """Return the estimated number of rows *node* reads, or ``None``."""
+    if isinstance(node, Join):
+        left = derive_properties(node.left).estimated_rows
+        right = derive_properties(node.right).estimated_rows
+        return None if left is None or right is None else left + right
+    child = getattr(node, "child", None)
+    if not isinstance(child, LogicalNode) or type(child) is LogicalNode:
+        return None
+    return derive_properties(child).estimated_rows
+
+
+def describe_costs(
+    cost_model: CostModel | None = None,
+) -> Callable[[LogicalNode], str]:
+    """Return a :func:`~barrow.core.plan.format_plan` annotation of estimates.
+
+    Every node is annotated with its estimated output rows and, when the
+    model prices it, the backend that runs it and the estimated cost.
+    """
+    model = cost_model or CostModel()
+
+    def annotate(node: LogicalNode) -> str:
+        parts = []
+        backend = "duckdb" if isinstance(node, SqlQuery) else "arrow"
+        rows = input_rows(node)
+        if rows is not None:
+            cost = model.cost(node, backend, rows)
+            if cost is not None:
+                parts.append(f"backend={backend}")
+                parts.append(f"cost≈{cost:.2f}ms")
+        props = derive_properties(node)
+        if props.estimated_rows is not None:
+            parts.append(f"rows≈{_count(props.estimated_rows)}")
+        if props.estimated_bytes is not None:
+            parts.append(f"bytes≈{_count(props.estimated_bytes)}")
+        return ", ".join(parts)
+
+    return annotate
+
+
+def _count(value: int) -> str:
+    for unit, size in (("G", 10**9), ("M", 10**6), ("K", 10**3)):
+        if value >= size:
+            return f"{value / size:.1f}{unit}"
+    return str(value)
+
+
+__all__ = [
+    "BACKENDS",
+    "CostModel",
+    "DEFAULT_COSTS",
+    "OperatorCost",
+    "describe_costs",
+    "input_rows",
+]
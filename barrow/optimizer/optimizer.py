@@ -4,21 +4,34 @@ from __future__ import annotations
 
 from barrow.core.plan import LogicalPlan
 
+from .cost import CostModel
 from .rules.backend_selection import select_backends
 from .rules.filter_pushdown import push_filters_down
 from .rules.fusion import fuse
+from .rules.join_selection import choose_build_sides
+from .rules.limit_pushdown import push_limits_down
 from .rules.projection_pushdown import push_projections_down
 from .rules.simplify import simplify
+from .schema import validate_plan
 
 
-def optimize(plan: LogicalPlan) -> LogicalPlan:
-    """Apply optimization rules to *plan* and return the optimized plan."""
+def optimize(plan: LogicalPlan, cost_model: CostModel | None = None) -> LogicalPlan:
+    """Apply optimization rules to *plan* and return the optimized plan.
+
+    *cost_model* prices the backends considered by backend selection; the
+    default is :class:`~barrow.optimizer.cost.CostModel`.  Plans that cannot
+    execute on the schemas of their inputs raise
+    :class:`~barrow.core.errors.PlanningError` before any data is read.
+    """
     root = plan.root
+    validate_plan(root)
     root = simplify(root)
     root = fuse(root)
+    root = push_limits_down(root)
     root = push_filters_down(root)
     root = push_projections_down(root)
-    root = select_backends(root)
+    root = choose_build_sides(root)
+    root = select_backends(root, cost_model)
     return LogicalPlan(root)
 
 
@@ -0,0 +1,245 @@
+"""Property derivation: estimate the size of every node's output.
+
+Scans take their row counts and sizes from the files they read
+(:func:`barrow.io.read_statistics`: Parquet and ORC footers, Feather batch
+headers, a sample of CSV files and Arrow streams), cached per file
+version.  Other nodes scale their input's estimates with fixed
+selectivities.  Inputs of unknown size, such as ``STDIN`` and SQL query
+results, propagate ``None``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import lru_cache
+import os
+
+from barrow.core.errors import BarrowError
+from barrow.core.nodes import (
+    Aggregate,
+    Filter,
+    GroupBy,
+    Join,
+    Limit,
+    LogicalNode,
+    Mutate,
+    Project,
+    Scan,
+    SqlQuery,
+    TopK,
+    Ungroup,
+    Window,
+)
+from barrow.core.properties import LogicalProperties
+from barrow.expr import BinaryExpression, Expression, UnaryExpression
+
+# Fraction of rows kept by a filter, by the kind of its condition.
+_EQUALITY_SELECTIVITY = 0.1
+_RANGE_SELECTIVITY = 1 / 3
+_DEFAULT_SELECTIVITY = 0.5
+
+#: Groups produced per input row by a grouped aggregation.
+_GROUP_FRACTION = 0.1
+
+#: Fraction of left rows kept by a semi or anti join.
+_SEMI_FRACTION = 0.5
+
+#: Bytes per row of a computed column.
+_VALUE_BYTES = 8
+
+
+def derive_properties(node: LogicalNode) -> LogicalProperties:
+    """Return the estimated rows, bytes and columns produced by *node*."""
+    if isinstance(node, Scan):
+        return _scan_properties(node)
+    if isinstance(node, Join):
+        return _join_properties(node)
+    child = getattr(node, "child", None)
+    if not isinstance(child, LogicalNode) or type(child) is LogicalNode:
+        return LogicalProperties()
+    props = derive_properties(child)
+
+    if isinstance(node, SqlQuery):
+        return LogicalProperties()
+
+    if isinstance(node, Filter):
+        return _scaled(props, _selectivity(node.expression))
+
+    if isinstance(node, (Limit, TopK)):
+        rows = props.estimated_rows
+        if rows is not None and rows > node.n:
+            return _scaled(props, node.n / rows)
+        return props
+
+    if isinstance(node, Project):
+        columns = props.columns
+        fraction = len(node.columns) / len(columns) if columns else 1.0
+        props = _scaled(props, min(fraction, 1.0), rows=False)
+        return replace(props, columns=list(node.columns))
+
+    if isinstance(node, (Mutate, Window)):
+        return _with_columns(props, list(node.assignments))
+
+    if isinstance(node, GroupBy):
+        return replace(props, group_keys=list(node.keys))
+
+    if isinstance(node, Ungroup):
+        return replace(props, group_keys=[])
+
+    if isinstance(node, Aggregate):
+        keys = node.group_keys or props.group_keys
+        rows = props.estimated_rows
+        if rows is not None:
+            rows = max(1, int(rows * _GROUP_FRACTION)) if keys else 1
+        columns = list(keys) + [
+            f"{column}_{func}" for column, func in node.aggregations.items()
+        ]
+        return LogicalProperties(
+            estimated_rows=rows,
+            estimated_bytes=(
+                None if rows is None else rows * _VALUE_BYTES * len(columns)
+            ),
+            columns=columns,
+            source_format=props.source_format,
+        )
+
+    return props
+
+
+def _scan_properties(node: Scan) -> LogicalProperties:
+    props = LogicalProperties(source_format=node.format)
+    if not node.path:
+        return props
+    stats = _source_statistics(node.path, node.format, node.delimiter)
+    if stats is None:
+        return props
+    rows = stats.num_rows
+    if node.limit is not None:
+        rows = min(rows, node.limit)
+    nbytes = stats.bytes_for(node.columns)
+    if stats.num_rows:
+        nbytes = nbytes * rows // stats.num_rows
+    columns = list(stats.columns)
+    if node.columns:
+        columns = [c for c in columns if c in node.columns]
+    return replace(props, estimated_rows=rows, estimated_bytes=nbytes, columns=columns)
+
+
+def _join_properties(node: Join) -> LogicalProperties:
+    from barrow.operations.join import arrow_join_type
+
+    left = derive_properties(node.left)
+    right = derive_properties(node.right)
+    join_type = arrow_join_type(node.join_type)
+    left_rows, right_rows = left.estimated_rows, right.estimated_rows
+    left_only = join_type in ("left semi", "left anti")
+
+    columns = None
+    if left.columns is not None and (left_only or right.columns is not None):
+        columns = list(left.columns)
+        if not left_only:
+            columns += [c for c in right.columns or [] if c not in node.right_on]
+
+    if join_type == "inner":
+        rows = _max(left_rows, right_rows)
+    elif join_type == "left outer":
+        rows = left_rows
+    elif join_type == "right outer":
+        rows = right_rows
+    elif join_type == "full outer":
+        rows = (
+            None if left_rows is None or right_rows is None else left_rows + right_rows
+        )
+    else:
+        rows = None if left_rows is None else int(left_rows * _SEMI_FRACTION)
+    if rows is None:
+        return LogicalProperties(columns=columns)
+
+    width = _row_width(left)
+    if not left_only:
+        right_width = _row_width(right)
+        width = None if width is None or right_width is None else width + right_width
+    return LogicalProperties(
+        estimated_rows=rows,
+        estimated_bytes=None if width is None else int(rows * width),
+        columns=columns,
+    )
+
+
+def _selectivity(expression: Expression | None) -> float:
+    """Return the estimated fraction of rows for which *expression* holds."""
+    if isinstance(expression, UnaryExpression) and expression.op == "not":
+        return 1.0 - _selectivity(expression.operand)
+    if isinstance(expression, BinaryExpression):
+        if expression.op == "and":
+            return _selectivity(expression.left) * _selectivity(expression.right)
+        if expression.op == "or":
+            left = _selectivity(expression.left)
+            right = _selectivity(expression.right)
+            return left + right - left * right
+        if expression.op == "==":
+            return _EQUALITY_SELECTIVITY
+        if expression.op in ("<", "<=", ">", ">="):
+            return _RANGE_SELECTIVITY
+    return _DEFAULT_SELECTIVITY
+
+
+def _scaled(
+    props: LogicalProperties, fraction: float, rows: bool = True
+) -> LogicalProperties:
+    """Scale the bytes, and unless *rows* is false the rows, of *props*."""
+    estimated_rows = props.estimated_rows
+    if rows and estimated_rows is not None:
+        estimated_rows = int(round(estimated_rows * fraction))
+    estimated_bytes = props.estimated_bytes
+    if estimated_bytes is not None:
+        estimated_bytes = int(estimated_bytes * fraction)
+    return replace(
+        props, estimated_rows=estimated_rows, estimated_bytes=estimated_bytes
+    )
+
+
+def _with_columns(props: LogicalProperties, names: list[str]) -> LogicalProperties:
+    """Add the computed columns *names* to *props*."""
+    columns = props.columns
+    if columns is not None:
+        columns = columns + [n for n in names if n not in columns]
+    nbytes = props.estimated_bytes
+    if nbytes is not None and props.estimated_rows is not None:
+        nbytes += props.estimated_rows * _VALUE_BYTES * len(names)
+    return replace(props, columns=columns, estimated_bytes=nbytes)
+
+
+def _row_width(props: LogicalProperties) -> float | None:
+    if props.estimated_bytes is None or props.estimated_rows is None:
+        return None
+    return props.estimated_bytes / max(props.estimated_rows, 1)
+
+
+def _max(left: int | None, right: int | None) -> int | None:
+    if left is None or right is None:
+        return None
+    return max(left, right)
+
+
+def _source_statistics(path: str, format: str | None, delimiter: str | None):
+    try:
+        version = os.stat(path).st_mtime_ns
+    except OSError:
+        version = None
+    return _cached_statistics(path, format, delimiter, version)
+
+
+@lru_cache(maxsize=128)
+def _cached_statistics(
+    path: str, format: str | None, delimiter: str | None, version: int | None
+):
+    from barrow.io import read_statistics
+
+    try:
+        return read_statistics(path, format, delimiter)
+    except (BarrowError, OSError, ValueError):
+        return None
+
+
+__all__ = ["derive_properties"]
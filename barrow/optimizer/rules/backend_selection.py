@@ -1,14 +1,26 @@
 """Backend selection: rewrite plan nodes to use the most efficient backend.
 
-Based on benchmark data (621 measurements, 200K rows), the heuristic applies
-static rules derived from measured performance differences:
-
-- **Window** with ``by`` and ``order_by`` → rewrite as SQL (32% faster).
-- **Aggregate** → rewrite as SQL (33% faster for summary).
-- **Project**, **Sort**, **Filter** → keep Arrow (Direct is 18-28% faster).
+**Window** nodes with ``by`` and ``order_by`` and **Aggregate** nodes with
+explicit group keys can be rewritten as SQL for DuckDB.  The rewrite is made
+when the cost model (:mod:`barrow.optimizer.cost`) estimates DuckDB to be
+cheaper for the input size derived from file metadata
+(:mod:`barrow.optimizer.properties`).  Small inputs thus stay in Arrow and
+do not pay DuckDB's registration overhead.
+
+When the input size is unknown, e.g. for ``STDIN``, static rules from
+benchmark data (621 measurements, 200K rows) apply: both Window and
+Aggregate are rewritten as SQL.  Sort always stays in Arrow.
+
+Each such node (a *seed*), and each SQL query, is grown into the largest fragment of
+DuckDB-compatible nodes around it, which is compiled into a single query
+(:mod:`barrow.optimizer.rules.fragments`): the nodes above and below a
+seed then run in the same DuckDB query, and Parquet inputs are read by
+DuckDB directly, instead of handing tables back and forth between the
+engines.
 
 The rule follows the same recursive traversal pattern used by *simplify* and
-*fusion*: process children first, then transform the current node.
+*fusion*, except that a fragment is searched for before the children are
+processed, so it covers as many nodes as possible.
 """
 
 from __future__ import annotations
@@ -21,36 +33,69 @@ from barrow.core.nodes import (
     SqlQuery,
     Window,
 )
-from barrow.expr.compiler import to_sql
+
+from ..cost import CostModel, input_rows
+from .fragments import aggregate_to_sql, can_offload, compile_fragment, window_to_sql
 
 
-def select_backends(node: LogicalNode) -> LogicalNode:
+def select_backends(
+    node: LogicalNode, cost_model: CostModel | None = None
+) -> LogicalNode:
     """Rewrite plan nodes to use the most efficient execution backend."""
-    return _select(node)
+    return _select(node, cost_model or CostModel())
+
 
+def _select(node: LogicalNode, model: CostModel) -> LogicalNode:
+    if can_offload(node) and _has_seed(node, model):
+        fragment = compile_fragment(
+            node,
+            lambda n: _is_seed(n, model),
+            lambda n: _select(n, model),
+        )
+        if fragment is not None:
+            return fragment
+    return _select_children(node, model)
 
-def _select(node: LogicalNode) -> LogicalNode:
-    node = _select_children(node)
 
-    # Window with partitioning → SQL (32% benchmark advantage)
+def _is_seed(node: LogicalNode, model: CostModel) -> bool:
+    """Return ``True`` if *node* should run on DuckDB by itself."""
     if isinstance(node, Window) and node.by and node.order_by and node.assignments:
-        query = _window_to_sql(node)
-        if query is not None:
-            return SqlQuery(child=node.child, query=query)
+        return window_to_sql(node) is not None and _prefers_sql(node, model)
 
-    # Aggregate → SQL (33% benchmark advantage)
     # Only rewrite when group_keys are explicitly set in the plan.
     # When group_keys is empty, the engine reads them from table metadata
     # at runtime (from a prior groupby command), so we cannot build SQL here.
     if isinstance(node, Aggregate) and node.aggregations and node.group_keys:
-        query = _aggregate_to_sql(node)
-        if query is not None:
-            return SqlQuery(child=node.child, query=query)
+        return aggregate_to_sql(node) is not None and _prefers_sql(node, model)
 
-    return node
+    return False
+
+
+def _has_seed(node: LogicalNode, model: CostModel) -> bool:
+    """Return ``True`` if a fragment rooted at *node* may reach a seed."""
+    if isinstance(node, SqlQuery) or _is_seed(node, model):
+        return True
+    if not can_offload(node):
+        return False
+    return any(
+        _has_seed(child, model)
+        for attr in ("child", "left", "right")
+        if isinstance(child := getattr(node, attr, None), LogicalNode)
+        and type(child) is not LogicalNode
+    )
 
 
-def _select_children(node: LogicalNode) -> LogicalNode:
+def _prefers_sql(node: LogicalNode, model: CostModel) -> bool:
+    """Return ``True`` if *node* should run on DuckDB."""
+    rows = input_rows(node)
+    if rows is None:
+        # Unknown input size: keep the benchmark rule (SQL is ~33% faster).
+        return True
+    choice = model.choose(node, rows)
+    return choice is not None and choice[0] == "duckdb"
+
+
+def _select_children(node: LogicalNode, model: CostModel) -> LogicalNode:
     updates: dict[str, LogicalNode] = {}
     for attr in ("child", "left", "right"):
         child = getattr(node, attr, None)
@@ -59,65 +104,7 @@ def _select_children(node: LogicalNode) -> LogicalNode:
             and isinstance(child, LogicalNode)
             and type(child) is not LogicalNode
         ):
-            updates[attr] = _select(child)
+            updates[attr] = _select(child, model)
     if updates:
         return replace(node, **updates)
     return node
-
-
-# ---- Node-to-SQL helpers ------------------------------------------------
-
-# Supported aggregation functions that can be translated to SQL.
-_AGG_MAP: dict[str, str] = {
-    "sum": "SUM",
-    "mean": "AVG",
-    "avg": "AVG",
-    "min": "MIN",
-    "max": "MAX",
-    "count": "COUNT",
-    "std": "STDDEV_SAMP",
-    "var": "VAR_SAMP",
-}
-
-
-def _window_to_sql(node: Window) -> str | None:
-    """Convert a Window node to a SQL query string, or ``None`` on failure."""
-    assert node.by and node.order_by
-
-    partition = ", ".join(f'"{col}"' for col in node.by)
-    order = ", ".join(f'"{col}"' for col in node.order_by)
-    window_clause = f"PARTITION BY {partition} ORDER BY {order}"
-
-    projections: list[str] = []
-    for name, expr in node.assignments.items():
-        sql_expr = to_sql(expr)
-        # Wrap the expression with the OVER clause
-        projections.append(f'{sql_expr} OVER ({window_clause}) AS "{name}"')
-
-    if not projections:
-        return None
-
-    cols = ", ".join(projections)
-    return f"SELECT *, {cols} FROM tbl"
-
-
-def _aggregate_to_sql(node: Aggregate) -> str | None:
-    """Convert an Aggregate node to a SQL query string, or ``None`` on failure."""
-    agg_parts: list[str] = []
-    for col_name, agg_func in node.aggregations.items():
-        sql_func = _AGG_MAP.get(agg_func.lower())
-        if sql_func is None:
-            # Unknown aggregation — fall back to Arrow backend.
-            return None
-        agg_parts.append(f'{sql_func}("{col_name}") AS "{agg_func}_{col_name}"')
-
-    if not agg_parts:
-        return None
-
-    aggs = ", ".join(agg_parts)
-
-    if node.group_keys:
-        keys = ", ".join(f'"{k}"' for k in node.group_keys)
-        return f"SELECT {keys}, {aggs} FROM tbl GROUP BY {keys}"
-
-    return f"SELECT {aggs} FROM tbl"
@@ -4,27 +4,286 @@ from __future__ import annotations
 
 from dataclasses import replace
 
-from barrow.core.nodes import Filter, LogicalNode, Sort
+from barrow.core.errors import BarrowError
+from barrow.core.nodes import (
+    Aggregate,
+    Filter,
+    GroupBy,
+    Join,
+    Limit,
+    LogicalNode,
+    Mutate,
+    Project,
+    Scan,
+    Sort,
+    TopK,
+    Ungroup,
+    View,
+    Window,
+)
+from barrow.expr import BinaryExpression, Expression, Literal, Name
+from barrow.expr.analyzer import referenced_names
+from barrow.expr.compiler_arrow import is_elementwise
+
+# Comparisons whose Arrow and NumPy results agree, nulls included, so a
+# scan may drop the rows they reject.
+_PRUNING_COMPARISONS = {"==", "<", "<=", ">", ">="}
+_PRUNING_ARITHMETIC = {"+", "-", "*", "/"}
+
+# Operators matching a column against a literal with the same kernels in
+# scans and filters.
+_PRUNING_MATCHES = {"in", "not in", "like"}
+
+# Join types whose output is a subset of the left rows.
+_LEFT_ONLY = {"left semi", "left anti"}
 
 
 def push_filters_down(node: LogicalNode) -> LogicalNode:
-    """Push filter operations closer to scan nodes."""
+    """Push filter operations closer to scan nodes.
+
+    The conjuncts of a filter's ``and`` expression move independently: below
+    ``Sort``, ``GroupBy``, ``Ungroup`` and ``View`` always, below ``Mutate``
+    and ``Window`` when they do not read a computed column (and, for
+    ``Window``, only read partition keys), below ``Project`` when they read
+    projected columns, into the side of an inner ``Join`` that provides
+    their columns, and into the left side of semi and anti joins.
+    Conjuncts that reach a ``Scan`` are also recorded as its pruning
+    predicate.
+
+    A filter with a conjunct that is not element-wise, e.g. ``x > mean(x)``
+    or ``row_number() < 10``, depends on every row of its input and their
+    order.  It only moves below ``GroupBy``, ``Ungroup`` and ``View``, and
+    none of its conjuncts move on their own, since that would change the
+    rows the others see.
+    """
     return _push(node)
 
 
 def _push(node: LogicalNode) -> LogicalNode:
     node = _push_children(node)
+    if isinstance(node, Filter) and node.expression is not None:
+        return _push_filter(node)
+    return node
+
+
+def _push_filter(node: Filter) -> LogicalNode:
+    assert node.expression is not None
+    child = node.child
+
+    # Operators that only tag metadata keep the rows and their order.
+    if isinstance(child, (GroupBy, Ungroup, View)):
+        return replace(child, child=_push(replace(node, child=child.child)))
+
+    if not is_elementwise(node.expression):
+        return node
 
     # Filter(Sort(child)) -> Sort(Filter(child))
-    if isinstance(node, Filter) and isinstance(node.child, Sort):
-        return replace(
-            node.child,
-            child=replace(node, child=node.child.child),
-        )
+    if isinstance(child, Sort):
+        return replace(child, child=_push(replace(node, child=child.child)))
+
+    # Filter(Scan) -> Filter(Scan(predicate=...)); the Filter stays in place.
+    if isinstance(child, Scan):
+        predicate = _add_predicate(child.predicate, node.expression)
+        if predicate is not child.predicate:
+            return replace(node, child=replace(child, predicate=predicate))
+        return node
+
+    if isinstance(child, (Mutate, Project, Window)):
+        below: list[Expression] = []
+        above: list[Expression] = []
+        for conjunct in _conjuncts(node.expression):
+            target = below if _passes(child, conjunct) else above
+            target.append(conjunct)
+        if not below:
+            return node
+        pushed = Filter(child=child.child, expression=_and(below))
+        new_child = replace(child, child=_push(pushed))
+        if above:
+            return replace(node, child=new_child, expression=_and(above))
+        return new_child
+
+    if isinstance(child, Join) and _join_type(child) == "inner":
+        return _push_into_join(node, child)
+
+    # Semi and anti joins output left rows unchanged.
+    if isinstance(child, Join) and _join_type(child) in _LEFT_ONLY:
+        return replace(child, left=_push(replace(node, child=child.left)))
 
     return node
 
 
+def _join_type(join: Join) -> str:
+    from barrow.operations.join import arrow_join_type
+
+    return arrow_join_type(join.join_type)
+
+
+def _passes(node: LogicalNode, conjunct: Expression) -> bool:
+    """Return ``True`` if *conjunct* can be evaluated below *node*."""
+    names = referenced_names(conjunct)
+    if isinstance(node, Project):
+        return names <= set(node.columns)
+    if isinstance(node, Mutate):
+        return not names & set(node.assignments)
+    if isinstance(node, Window):
+        return (
+            bool(node.by)
+            and names <= set(node.by or [])
+            and not names & set(node.assignments)
+        )
+    return False
+
+
+def _push_into_join(node: Filter, join: Join) -> LogicalNode:
+    """Move the conjuncts of *node* into the sides of an inner *join*."""
+    assert node.expression is not None
+    left_columns = _output_columns(join.left)
+    right_columns = _output_columns(join.right)
+    if left_columns is None or right_columns is None:
+        return node
+    left_only = left_columns - right_columns
+    right_only = right_columns - left_columns - set(join.right_on)
+    shared_key = {
+        left for left, right in zip(join.left_on, join.right_on) if left == right
+    }
+
+    left: list[Expression] = []
+    right: list[Expression] = []
+    above: list[Expression] = []
+    for conjunct in _conjuncts(node.expression):
+        names = referenced_names(conjunct)
+        if names and names <= shared_key:
+            # Both sides of an equi-join agree on the key's value.
+            left.append(conjunct)
+            right.append(conjunct)
+        elif names and names <= left_only:
+            left.append(conjunct)
+        elif names and names <= right_only:
+            right.append(conjunct)
+        else:
+            above.append(conjunct)
+    if not left and not right:
+        return node
+
+    new_join = replace(
+        join,
+        left=(
+            _push(Filter(child=join.left, expression=_and(left))) if left else join.left
+        ),
+        right=(
+            _push(Filter(child=join.right, expression=_and(right)))
+            if right
+            else join.right
+        ),
+    )
+    if above:
+        return replace(node, child=new_join, expression=_and(above))
+    return new_join
+
+
+def _output_columns(node: LogicalNode) -> set[str] | None:
+    """Return the columns *node* produces, or ``None`` when unknown."""
+    if isinstance(node, Scan):
+        if not node.path:
+            return None
+        from barrow.io import read_column_names
+
+        try:
+            names = set(read_column_names(node.path, node.format, node.delimiter))
+        except (BarrowError, OSError, ValueError):
+            return None
+        return names & set(node.columns) if node.columns else names
+
+    if isinstance(node, Project):
+        return set(node.columns)
+
+    if isinstance(node, (Filter, Sort, TopK, Limit, GroupBy, Ungroup, View)):
+        return _output_columns(node.child)
+
+    if isinstance(node, (Mutate, Window)):
+        columns = _output_columns(node.child)
+        if columns is None:
+            return None
+        return columns | set(node.assignments)
+
+    if isinstance(node, Aggregate) and node.group_keys:
+        return set(node.group_keys) | {
+            f"{column}_{func}" for column, func in node.aggregations.items()
+        }
+
+    if isinstance(node, Join):
+        left = _output_columns(node.left)
+        if _join_type(node) in _LEFT_ONLY:
+            return left
+        right = _output_columns(node.right)
+        if left is None or right is None:
+            return None
+        right = right - set(node.right_on)
+        overlap = left & right
+        return left | (right - overlap) | {f"{c}_right" for c in overlap}
+
+    return None
+
+
+def _and(conjuncts: list[Expression]) -> Expression:
+    expression = conjuncts[0]
+    for conjunct in conjuncts[1:]:
+        expression = BinaryExpression(expression, "and", conjunct)
+    return expression
+
+
+def _add_predicate(
+    predicate: Expression | None, expression: Expression
+) -> Expression | None:
+    """Return *predicate* extended with the prunable conjuncts of *expression*."""
+    existing = _conjuncts(predicate) if predicate is not None else []
+    for conjunct in _conjuncts(expression):
+        if conjunct in existing or not _prunable(conjunct):
+            continue
+        existing.append(conjunct)
+        if predicate is None:
+            predicate = conjunct
+        else:
+            predicate = BinaryExpression(predicate, "and", conjunct)
+    return predicate
+
+
+def _conjuncts(expr: Expression) -> list[Expression]:
+    if isinstance(expr, BinaryExpression) and expr.op == "and":
+        return _conjuncts(expr.left) + _conjuncts(expr.right)
+    return [expr]
+
+
+def _prunable(expr: Expression) -> bool:
+    """Return ``True`` if a scan can evaluate *expr* without losing rows."""
+    if isinstance(expr, BinaryExpression):
+        if expr.op in ("and", "or"):
+            return _prunable(expr.left) and _prunable(expr.right)
+        if expr.op in _PRUNING_COMPARISONS:
+            return _operand(expr.left) and _operand(expr.right)
+        if expr.op in _PRUNING_MATCHES:
+            return isinstance(expr.left, Name) and _match_operand(expr)
+    return False
+
+
+def _match_operand(expr: BinaryExpression) -> bool:
+    if not isinstance(expr.right, Literal):
+        return False
+    if expr.op == "like":
+        return isinstance(expr.right.value, str)
+    return isinstance(expr.right.value, (list, tuple, set, frozenset))
+
+
+def _operand(expr: Expression) -> bool:
+    if isinstance(expr, Name):
+        return True
+    if isinstance(expr, Literal):
+        return isinstance(expr.value, (bool, int, float, str))
+    if isinstance(expr, BinaryExpression) and expr.op in _PRUNING_ARITHMETIC:
+        return _operand(expr.left) and _operand(expr.right)
+    return False
+
+
 def _push_children(node: LogicalNode) -> LogicalNode:
     updates: dict[str, LogicalNode] = {}
     for attr in ("child", "left", "right"):
@@ -0,0 +1,476 @@
+"""Fragment compilation: run a whole plan subtree as one DuckDB query.
+
+A fragment is a contiguous subtree of nodes DuckDB can execute: Filter,
+Mutate, Project, Join, Aggregate with explicit group keys, Window with
+``by`` and ``order_by``, and SQL queries.  Every node becomes a common
+table expression over the one below it, so the subtree costs a single
+engine hand-off instead of one per node.  Parquet files are scanned by
+DuckDB itself with ``read_parquet``; any other input, at most one per
+fragment, is registered as the table ``tbl``.
+
+A node stops the fragment, and becomes its input, when the engines could
+disagree on its result:
+
+* Sort and Limit, whose ties keep their input order in Arrow only;
+* expressions using ``%``, ``**``, ``in``, ``like`` or functions whose
+  SQL counterpart differs, and names that may resolve to NumPy
+  attributes rather than columns;
+* Mutate and Join nodes whose input columns cannot be derived;
+* CSV and other inputs, whose type inference differs between the engines.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+import math
+import os
+
+from barrow.core.nodes import (
+    Aggregate,
+    Filter,
+    Join,
+    LogicalNode,
+    Mutate,
+    Project,
+    Scan,
+    SqlQuery,
+    Window,
+)
+from barrow.expr import (
+    BinaryExpression,
+    Expression,
+    FunctionCall,
+    Literal,
+    Name,
+    UnaryExpression,
+    referenced_names,
+)
+from barrow.expr.compiler import quote_identifier, quote_string, to_sql
+
+from ..properties import derive_properties
+
+#: Name of the registered input table in queries.
+INPUT_TABLE = "tbl"
+
+# Supported aggregation functions that can be translated to SQL.
+_AGG_MAP: dict[str, str] = {
+    "sum": "SUM",
+    "mean": "AVG",
+    "avg": "AVG",
+    "min": "MIN",
+    "max": "MAX",
+    "count": "COUNT",
+    "std": "STDDEV_SAMP",
+    "var": "VAR_SAMP",
+}
+
+# Operators and functions with the same meaning in expressions and DuckDB.
+_SQL_BINARY = frozenset(
+    {"+", "-", "*", "/", "==", "!=", "<", "<=", ">", ">=", "and", "or"}
+)
+_SQL_UNARY = frozenset({"+", "-", "not"})
+_SQL_FUNCTIONS = frozenset({"abs", "sqrt", "exp", "sin", "cos", "tan"})
+
+_SQL_JOINS: dict[str, str] = {
+    "inner": "JOIN",
+    "left outer": "LEFT JOIN",
+    "right outer": "RIGHT JOIN",
+    "full outer": "FULL JOIN",
+    "left semi": "SEMI JOIN",
+    "left anti": "ANTI JOIN",
+}
+
+
+def can_offload(node: LogicalNode) -> bool:
+    """Return ``True`` if *node* is of a type a fragment may contain."""
+    return isinstance(
+        node, (Filter, Mutate, Project, Join, Aggregate, Window, SqlQuery)
+    )
+
+
+def compile_fragment(
+    node: LogicalNode,
+    is_seed: Callable[[LogicalNode], bool],
+    rewrite_input: Callable[[LogicalNode], LogicalNode],
+) -> SqlQuery | None:
+    """Compile the largest fragment rooted at *node* into a :class:`SqlQuery`.
+
+    A fragment is only worth a hand-off to DuckDB when it holds a node
+    that should run there: ``None`` is returned unless the fragment
+    contains a SQL query or a node for which *is_seed* holds, or when
+    *node* itself cannot be compiled.  *rewrite_input* is applied to the
+    node that becomes the fragment's registered input.
+    """
+    fragment = _Fragment(is_seed, rewrite_input)
+    relation = fragment.compile_node(node)
+    if relation is None or not fragment.seeded:
+        return None
+    return SqlQuery(child=fragment.input or LogicalNode(), query=fragment.query())
+
+
+def window_to_sql(node: Window, source: str = INPUT_TABLE) -> str | None:
+    """Convert a Window node to a SQL query string, or ``None`` on failure."""
+    assert node.by and node.order_by
+
+    partition = ", ".join(f'"{col}"' for col in node.by)
+    order = ", ".join(f'"{col}"' for col in node.order_by)
+    window_clause = f"PARTITION BY {partition} ORDER BY {order}"
+
+    projections: list[str] = []
+    for name, expr in node.assignments.items():
+        sql_expr = to_sql(expr)
+        # Wrap the expression with the OVER clause
+        projections.append(f'{sql_expr} OVER ({window_clause}) AS "{name}"')
+
+    if not projections:
+        return None
+
+    cols = ", ".join(projections)
+    return f"SELECT *, {cols} FROM {source}"
+
+
+def aggregate_to_sql(node: Aggregate, source: str = INPUT_TABLE) -> str | None:
+    """Convert an Aggregate node to a SQL query string, or ``None`` on failure."""
+    agg_parts: list[str] = []
+    for col_name, agg_func in node.aggregations.items():
+        sql_func = _AGG_MAP.get(agg_func.lower())
+        if sql_func is None:
+            # Unknown aggregation — fall back to Arrow backend.
+            return None
+        # Name the output like the Arrow backend does.
+        agg_parts.append(f'{sql_func}("{col_name}") AS "{col_name}_{agg_func}"')
+
+    if not agg_parts:
+        return None
+
+    aggs = ", ".join(agg_parts)
+
+    if node.group_keys:
+        keys = ", ".join(f'"{k}"' for k in node.group_keys)
+        return f"SELECT {keys}, {aggs} FROM {source} GROUP BY {keys}"
+
+    return f"SELECT {aggs} FROM {source}"
+
+
+def expression_to_sql(expression: Expression, columns: list[str] | None) -> str | None:
+    """Compile *expression* to SQL if DuckDB evaluates it like Arrow does.
+
+    Names must be among *columns*; when the columns are unknown, names
+    that NumPy defines (such as ``pi``) are rejected since the expression
+    evaluator would resolve them to NumPy values.
+    """
+    if not _translatable(expression, columns):
+        return None
+    return to_sql(expression)
+
+
+# ---- Compiler ---------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Relation:
+    """A table expression of a fragment: ``tbl`` or a CTE name."""
+
+    name: str
+    columns: list[str] | None
+
+
+class _Fragment:
+    """Compile plan nodes into a list of named SELECT statements."""
+
+    def __init__(
+        self,
+        is_seed: Callable[[LogicalNode], bool],
+        rewrite_input: Callable[[LogicalNode], LogicalNode],
+    ) -> None:
+        self.is_seed = is_seed
+        self.rewrite_input = rewrite_input
+        self.input: LogicalNode | None = None
+        self.statements: list[tuple[str, str]] = []
+        self.seeded = False
+
+    def query(self) -> str:
+        """Return the statements as one query selecting the last of them."""
+        *ctes, (name, final) = self.statements
+        if not ctes:
+            return final
+        if _starts_with_with(final):
+            ctes.append((name, final))
+            final = f"SELECT * FROM {name}"
+        definitions = ", ".join(f"{name} AS ({body})" for name, body in ctes)
+        return f"WITH {definitions} {final}"
+
+    def compile(self, node: LogicalNode) -> _Relation | None:
+        """Compile *node*, or read it as an input if it cannot be compiled."""
+        state = (self.input, len(self.statements), self.seeded)
+        if can_offload(node):
+            relation = self.compile_node(node)
+            if relation is not None:
+                return relation
+            self.input, count, self.seeded = state
+            del self.statements[count:]
+        return self._source(node)
+
+    def compile_node(self, node: LogicalNode) -> _Relation | None:
+        """Compile *node* itself, or return ``None`` if it cannot be."""
+        if not can_offload(node):
+            return None
+        if isinstance(node, SqlQuery):
+            return self._sql(node)
+        if isinstance(node, Join):
+            return self._join(node)
+
+        if isinstance(node, Aggregate) and not (node.group_keys and node.aggregations):
+            return None
+        if isinstance(node, Window) and not (
+            node.by and node.order_by and node.assignments
+        ):
+            return None
+
+        source = self.compile(node.child)  # type: ignore[attr-defined]
+        if source is None:
+            return None
+        if self.is_seed(node):
+            self.seeded = True
+
+        if isinstance(node, Filter):
+            assert node.expression is not None
+            condition = expression_to_sql(node.expression, source.columns)
+            if condition is None:
+                return None
+            return self._add(
+                f"SELECT * FROM {source.name} WHERE {condition}", source.columns
+            )
+
+        if isinstance(node, Project):
+            if source.columns is not None and not set(node.columns) <= set(
+                source.columns
+            ):
+                return None
+            selected = ", ".join(quote_identifier(c) for c in node.columns)
+            return self._add(f"SELECT {selected} FROM {source.name}", node.columns)
+
+        if isinstance(node, Mutate):
+            return self._mutate(node, source)
+
+        if isinstance(node, Aggregate):
+            query = aggregate_to_sql(node, source.name)
+            if query is None:
+                return None
+            columns = list(node.group_keys) + [
+                f"{column}_{func}" for column, func in node.aggregations.items()
+            ]
+            return self._add(query, columns)
+
+        if isinstance(node, Window):
+            known = source.columns
+            if known is not None:
+                if set(node.assignments) & set(known):
+                    return None
+                known = known + list(node.assignments)
+            query = window_to_sql(node, source.name)
+            return None if query is None else self._add(query, known)
+
+        return None
+
+    def _source(self, node: LogicalNode) -> _Relation | None:
+        """Read *node* with ``read_parquet`` or register it as the input."""
+        if isinstance(node, Scan) and _reads_parquet_file(node):
+            columns = derive_properties(replace(node, columns=None)).columns
+            return self._add(
+                f"SELECT * FROM read_parquet({quote_string(node.path or '')})",
+                columns,
+            )
+        if self.input is not None:
+            return None
+        self.input = self.rewrite_input(node)
+        return _Relation(INPUT_TABLE, derive_properties(node).columns)
+
+    def _sql(self, node: SqlQuery) -> _Relation | None:
+        self.seeded = True
+        query = node.query.strip().rstrip(";").strip()
+        if type(node.child) is LogicalNode:
+            # Already a fragment that reads its own files.
+            return self._add(query, None)
+        source = self.compile(node.child)
+        if source is None:
+            return None
+        if source.name != INPUT_TABLE:
+            if _starts_with_with(query):
+                query = f"SELECT * FROM ({query})"
+            query = f"WITH {INPUT_TABLE} AS (SELECT * FROM {source.name}) {query}"
+        return self._add(query, None)
+
+    def _mutate(self, node: Mutate, source: _Relation) -> _Relation | None:
+        # Later assignments see earlier ones; start a new SELECT whenever an
+        # expression refers to a column assigned in the current one.
+        if source.columns is None:
+            return None
+        relation = source
+        step: dict[str, str] = {}
+        for name, expr in node.assignments.items():
+            if referenced_names(expr) & step.keys():
+                relation = self._assign(relation, step)
+                step = {}
+            columns = (relation.columns or []) + list(step)
+            value = expression_to_sql(expr, columns)
+            if value is None:
+                return None
+            step[name] = value
+        return self._assign(relation, step)
+
+    def _assign(self, source: _Relation, values: dict[str, str]) -> _Relation:
+        columns = list(source.columns or [])
+        replaced = [
+            f"{value} AS {quote_identifier(name)}"
+            for name, value in values.items()
+            if name in columns
+        ]
+        added = [
+            f"{value} AS {quote_identifier(name)}"
+            for name, value in values.items()
+            if name not in columns
+        ]
+        star = f"* REPLACE ({', '.join(replaced)})" if replaced else "*"
+        selected = ", ".join([star, *added])
+        columns += [name for name in values if name not in columns]
+        return self._add(f"SELECT {selected} FROM {source.name}", columns)
+
+    def _join(self, node: Join) -> _Relation | None:
+        from barrow.operations.join import arrow_join_type
+
+        sql_join = _SQL_JOINS.get(arrow_join_type(node.join_type))
+        if sql_join is None or len(node.left_on) != len(node.right_on):
+            return None
+        left = self.compile(node.left)
+        right = self.compile(node.right) if left is not None else None
+        if left is None or right is None:
+            return None
+        if self.is_seed(node):
+            self.seeded = True
+
+        condition = " AND ".join(
+            f"l.{quote_identifier(a)} = r.{quote_identifier(b)}"
+            for a, b in zip(node.left_on, node.right_on)
+        )
+        source = f"{left.name} AS l {sql_join} {right.name} AS r ON {condition}"
+        if sql_join in ("SEMI JOIN", "ANTI JOIN"):
+            return self._add(f"SELECT l.* FROM {source}", left.columns)
+
+        selected = _join_columns(node, sql_join, left.columns, right.columns)
+        if selected is None:
+            return None
+        query = "SELECT " + ", ".join(s for s, _ in selected) + f" FROM {source}"
+        return self._add(query, [name for _, name in selected])
+
+    def _add(self, query: str, columns: list[str] | None) -> _Relation:
+        name = f"_q{len(self.statements) + 1}"
+        self.statements.append((name, query))
+        return _Relation(name, columns)
+
+
+def _join_columns(
+    node: Join,
+    sql_join: str,
+    left: list[str] | None,
+    right: list[str] | None,
+) -> list[tuple[str, str]] | None:
+    """Return the select list of a join as (expression, name) pairs.
+
+    The columns match :func:`barrow.operations.join`: left columns, with
+    keys coalesced across both sides for full joins, then the right
+    non-key columns, suffixed with ``_right`` where they collide with a
+    left column.  Right joins keep the right keys after the left non-key
+    columns instead.
+    """
+    if left is None or right is None:
+        return None
+    left_keys, right_keys = list(node.left_on), list(node.right_on)
+    left_rest = [c for c in left if c not in left_keys]
+    right_rest = [c for c in right if c not in right_keys]
+    if set(left_rest) & set(right_keys) or set(right_rest) & set(left_keys):
+        return None
+    overlap = set(left_rest) & set(right_rest)
+
+    def right_column(column: str) -> tuple[str, str]:
+        name = f"{column}_right" if column in overlap else column
+        return f"r.{quote_identifier(column)} AS {quote_identifier(name)}", name
+
+    if sql_join == "RIGHT JOIN":
+        columns = [(f"l.{quote_identifier(c)}", c) for c in left_rest]
+        columns += [
+            right_column(c) if c not in right_keys else (f"r.{quote_identifier(c)}", c)
+            for c in right
+        ]
+        return columns
+
+    columns = []
+    for column in left:
+        quoted = quote_identifier(column)
+        if sql_join == "FULL JOIN" and column in left_keys:
+            other = quote_identifier(right_keys[left_keys.index(column)])
+            columns.append((f"COALESCE(l.{quoted}, r.{other}) AS {quoted}", column))
+        else:
+            columns.append((f"l.{quoted}", column))
+    return columns + [right_column(c) for c in right_rest]
+
+
+def _translatable(expression: Expression, columns: list[str] | None) -> bool:
+    if isinstance(expression, Name):
+        if columns is not None:
+            return expression.identifier in columns
+        import numpy as np
+
+        return not hasattr(np, expression.identifier)
+    if isinstance(expression, Literal):
+        value = expression.value
+        if isinstance(value, float):
+            return math.isfinite(value)
+        return value is None or isinstance(value, (bool, int, str))
+    if isinstance(expression, UnaryExpression):
+        return expression.op in _SQL_UNARY and _translatable(
+            expression.operand, columns
+        )
+    if isinstance(expression, BinaryExpression):
+        return (
+            expression.op in _SQL_BINARY
+            and _translatable(expression.left, columns)
+            and _translatable(expression.right, columns)
+        )
+    if isinstance(expression, FunctionCall):
+        return (
+            expression.name in _SQL_FUNCTIONS
+            and len(expression.args) == 1
+            and _translatable(expression.args[0], columns)
+        )
+    return False
+
+
+def _reads_parquet_file(node: Scan) -> bool:
+    """Return ``True`` if DuckDB can read *node* with ``read_parquet``."""
+    path = node.path
+    if not path or node.limit is not None or any(c in path for c in "*?[{"):
+        return False
+    if node.format is not None:
+        if node.format.lower() != "parquet":
+            return False
+    elif not path.lower().endswith(".parquet"):
+        return False
+    return os.path.isfile(path)
+
+
+def _starts_with_with(query: str) -> bool:
+    return query[:4].upper() == "WITH" and not (
+        query[4:5].isalnum() or query[4:5] == "_"
+    )
+
+
+__all__ = [
+    "INPUT_TABLE",
+    "aggregate_to_sql",
+    "can_offload",
+    "compile_fragment",
+    "expression_to_sql",
+    "window_to_sql",
+]
@@ -1,10 +1,24 @@
-"""Fusion rule: merge adjacent compatible operations."""
+"""Fusion rule: merge adjacent compatible operations.
+
+The assignments of every ``Mutate``, merged or not, are simplified and share
+repeated subexpressions (:mod:`barrow.expr.rewrite`).  Each assignment is
+simplified against the schema it is evaluated on, when that is known.
+"""
 
 from __future__ import annotations
 
 from dataclasses import replace
 
-from barrow.core.nodes import LogicalNode, Mutate, Project
+import pyarrow as pa
+
+from barrow.core.errors import PlanningError
+from barrow.core.nodes import Limit, LogicalNode, Mutate, Project, Sort, TopK
+from barrow.expr import (
+    Expression,
+    eliminate_common_subexpressions,
+    simplify_expression,
+)
+from barrow.optimizer.schema import _assign, _known_schema
 
 
 def fuse(node: LogicalNode) -> LogicalNode:
@@ -15,19 +29,60 @@ def fuse(node: LogicalNode) -> LogicalNode:
 def _fuse(node: LogicalNode) -> LogicalNode:
     node = _fuse_children(node)
 
-    # Fuse Mutate(Mutate(...)) into single Mutate
-    if isinstance(node, Mutate) and isinstance(node.child, Mutate):
+    # Fuse Mutate(Mutate(...)) into single Mutate.  Assignments run in
+    # order, so the outer ones may only be appended when they do not
+    # reassign a column of the inner node.
+    if (
+        isinstance(node, Mutate)
+        and isinstance(node.child, Mutate)
+        and not set(node.assignments) & set(node.child.assignments)
+    ):
         merged = dict(node.child.assignments)
         merged.update(node.assignments)
-        return replace(node, child=node.child.child, assignments=merged)
+        child = node.child.child
+        return replace(
+            node,
+            child=child,
+            assignments=_rewrite_assignments(merged, _known_schema(child)),
+        )
+
+    if isinstance(node, Mutate):
+        assignments = _rewrite_assignments(node.assignments, _known_schema(node.child))
+        return replace(node, assignments=assignments)
 
     # Fuse Project(Project(...)) — outer columns win
     if isinstance(node, Project) and isinstance(node.child, Project):
         return replace(node, child=node.child.child)
 
+    # Fuse Limit(Sort(...)) into a TopK partial selection
+    if isinstance(node, Limit) and isinstance(node.child, Sort):
+        sort = node.child
+        return TopK(
+            child=sort.child, keys=sort.keys, descending=sort.descending, n=node.n
+        )
+
+    # Fuse Limit(TopK(...)) — the smaller limit wins
+    if isinstance(node, Limit) and isinstance(node.child, TopK):
+        return replace(node.child, n=min(node.n, node.child.n))
+
     return node
 
 
+def _rewrite_assignments(
+    assignments: dict[str, Expression], schema: pa.Schema | None
+) -> dict[str, Expression]:
+    simplified: dict[str, Expression] = {}
+    for name, expr in assignments.items():
+        simplified[name] = simplify_expression(expr, schema)
+        if schema is not None:
+            # Later assignments see the columns of earlier ones.
+            try:
+                schema = _assign(schema, name, simplified[name])
+            except PlanningError:
+                schema = None
+    return eliminate_common_subexpressions(simplified)
+
+
 def _fuse_children(node: LogicalNode) -> LogicalNode:
     updates: dict[str, LogicalNode] = {}
     for attr in ("child", "left", "right"):
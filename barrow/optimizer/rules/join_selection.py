@@ -0,0 +1,52 @@
+"""Join side selection: build hash tables on the smaller input."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from barrow.core.nodes import Join, LogicalNode
+
+from ..properties import derive_properties
+
+
+def choose_build_sides(node: LogicalNode) -> LogicalNode:
+    """Set the ``build_side`` of inner joins to the smaller input.
+
+    Inputs are compared by their estimated size in bytes (see
+    :func:`~barrow.optimizer.properties.derive_properties`), which accounts
+    for the columns read and the rows filtered out.  An input whose size is
+    unknown, such as ``STDIN``, is assumed to be the larger one and is
+    streamed.  Outer, semi and anti joins keep their required build side.
+    """
+    return _choose(node)
+
+
+def _choose(node: LogicalNode) -> LogicalNode:
+    node = _choose_children(node)
+    if isinstance(node, Join) and _is_inner(node):
+        left = derive_properties(node.left).estimated_bytes
+        right = derive_properties(node.right).estimated_bytes
+        if left is not None and (right is None or left < right):
+            return replace(node, build_side="left")
+    return node
+
+
+def _is_inner(join: Join) -> bool:
+    from barrow.operations.join import arrow_join_type
+
+    return arrow_join_type(join.join_type) == "inner"
+
+
+def _choose_children(node: LogicalNode) -> LogicalNode:
+    updates: dict[str, LogicalNode] = {}
+    for attr in ("child", "left", "right"):
+        child = getattr(node, attr, None)
+        if (
+            child is not None
+            and isinstance(child, LogicalNode)
+            and type(child) is not LogicalNode
+        ):
+            updates[attr] = _choose(child)
+    if updates:
+        return replace(node, **updates)
+    return node
@@ -0,0 +1,61 @@
+"""Limit pushdown: stop reading scans once enough rows are produced."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from barrow.core.nodes import (
+    GroupBy,
+    Limit,
+    LogicalNode,
+    Mutate,
+    Project,
+    Scan,
+    Ungroup,
+    View,
+)
+
+# Operators that emit exactly one row per input row, in input order.
+_ROW_PRESERVING = (Project, Mutate, GroupBy, Ungroup, View)
+
+
+def push_limits_down(node: LogicalNode) -> LogicalNode:
+    """Record a :class:`Limit` on the scan feeding it.
+
+    The limit reaches the scan through operators that neither drop, add nor
+    reorder rows, and through nested limits.  The :class:`Limit` node stays
+    in the plan; the scan's ``limit`` only lets the reader stop early.
+    """
+    return _push_limit(node)
+
+
+def _push_limit(node: LogicalNode) -> LogicalNode:
+    node = _push_limit_children(node)
+    if isinstance(node, Limit):
+        return replace(node, child=_limit_scan(node.child, node.n))
+    return node
+
+
+def _limit_scan(node: LogicalNode, n: int) -> LogicalNode:
+    if isinstance(node, Scan):
+        if node.limit is None or n < node.limit:
+            return replace(node, limit=n)
+        return node
+    if isinstance(node, (*_ROW_PRESERVING, Limit)):
+        return replace(node, child=_limit_scan(node.child, n))
+    return node
+
+
+def _push_limit_children(node: LogicalNode) -> LogicalNode:
+    updates: dict[str, LogicalNode] = {}
+    for attr in ("child", "left", "right"):
+        child = getattr(node, attr, None)
+        if (
+            child is not None
+            and isinstance(child, LogicalNode)
+            and type(child) is not LogicalNode
+        ):
+            updates[attr] = _push_limit(child)
+    if updates:
+        return replace(node, **updates)
+    return node
@@ -3,37 +3,141 @@
 from __future__ import annotations
 
 from dataclasses import replace
+from typing import Any, cast
 
-from barrow.core.nodes import LogicalNode, Project, Scan
+from barrow.core.nodes import (
+    Aggregate,
+    Filter,
+    GroupBy,
+    Join,
+    Limit,
+    LogicalNode,
+    Mutate,
+    Project,
+    Scan,
+    Sink,
+    Sort,
+    TopK,
+    Ungroup,
+    View,
+    Window,
+)
+from barrow.expr import Expression
+from barrow.expr.analyzer import referenced_names
+
+# Suffix the join operation gives right-hand columns whose names collide.
+_JOIN_SUFFIX = "_right"
 
 
 def push_projections_down(node: LogicalNode) -> LogicalNode:
-    """Push column pruning toward scan nodes."""
-    return _push_proj(node)
-
-
-def _push_proj(node: LogicalNode) -> LogicalNode:
-    node = _push_proj_children(node)
-
-    # Project(Scan(...)) -> Scan(columns=...)
-    if isinstance(node, Project) and isinstance(node.child, Scan):
-        scan = node.child
-        if scan.columns is None:
-            return replace(node, child=replace(scan, columns=list(node.columns)))
-
-    return node
-
-
-def _push_proj_children(node: LogicalNode) -> LogicalNode:
-    updates: dict[str, LogicalNode] = {}
-    for attr in ("child", "left", "right"):
-        child = getattr(node, attr, None)
-        if (
-            child is not None
-            and isinstance(child, LogicalNode)
-            and type(child) is not LogicalNode
-        ):
-            updates[attr] = _push_proj(child)
-    if updates:
-        return replace(node, **updates)
-    return node
+    """Push column pruning toward scan nodes.
+
+    The plan is walked top-down with the list of columns each node's parent
+    needs (``None`` meaning every column).  Every node adds the columns it
+    reads itself (filter and expression references, sort, group and join
+    keys, aggregation inputs) and drops the ones it creates, and each
+    :class:`Scan` without preset columns reads only what is left.  Names
+    that turn out not to be columns of the input are ignored by the reader.
+    """
+    return _push_proj(node, None)
+
+
+def _push_proj(node: LogicalNode, required: list[str] | None) -> LogicalNode:
+    if isinstance(node, Scan):
+        if required and node.columns is None:
+            return replace(node, columns=list(required))
+        return node
+
+    if isinstance(node, Join):
+        from barrow.operations.join import arrow_join_type
+
+        if arrow_join_type(node.join_type) in ("left semi", "left anti"):
+            # Only the keys of the right side are read.
+            right_required: list[str] | None = list(node.right_on)
+        else:
+            right_required = _join_side(required, node.right_on)
+        return replace(
+            node,
+            left=_push_proj(node.left, _join_side(required, node.left_on)),
+            right=_push_proj(node.right, right_required),
+        )
+
+    child = getattr(node, "child", None)
+    if child is None or not isinstance(child, LogicalNode):
+        return node
+    if type(child) is LogicalNode:
+        return node
+    # Any remaining node with a ``child`` field is one of the unary nodes.
+    unary = cast(Any, node)
+    return replace(unary, child=_push_proj(child, _child_required(node, required)))
+
+
+def _child_required(node: LogicalNode, required: list[str] | None) -> list[str] | None:
+    """Return the columns the child of *node* must produce."""
+    if isinstance(node, Project):
+        return list(node.columns)
+
+    if isinstance(node, Aggregate):
+        # Without explicit keys the grouping comes from the input's metadata;
+        # GroupBy nodes below and the reader keep those key columns.
+        return _union(list(node.group_keys), list(node.aggregations))
+
+    if isinstance(node, (Sink, View, Limit, Ungroup)):
+        return required
+
+    if isinstance(node, Filter):
+        if node.expression is None:
+            return required
+        return _union(required, referenced_names(node.expression))
+
+    if isinstance(node, (Sort, TopK, GroupBy)):
+        return _union(required, node.keys)
+
+    if isinstance(node, Mutate):
+        return _assignments_required(required, node.assignments)
+
+    if isinstance(node, Window):
+        keys = list(node.by or []) + list(node.order_by or [])
+        return _union(_assignments_required(required, node.assignments), keys)
+
+    # Unknown operators (e.g. SQL queries) may read any column.
+    return None
+
+
+def _assignments_required(
+    required: list[str] | None, assignments: dict[str, Expression]
+) -> list[str] | None:
+    """Columns needed below a node evaluating *assignments* in order."""
+    if required is None:
+        return None
+    needed: set[str] = set()
+    assigned: set[str] = set()
+    for name, expr in assignments.items():
+        # Earlier assignments are visible to later ones.
+        needed |= referenced_names(expr) - assigned
+        assigned.add(name)
+    kept = [c for c in required if c not in assigned]
+    return _union(kept, needed)
+
+
+def _join_side(required: list[str] | None, keys: list[str]) -> list[str] | None:
+    """Columns one side of a join must produce.
+
+    Both sides receive the same names so that columns present on both keep
+    colliding, and therefore keep their suffixed names.
+    """
+    if required is None:
+        return None
+    names = [
+        c[: -len(_JOIN_SUFFIX)] if c.endswith(_JOIN_SUFFIX) else c for c in required
+    ]
+    return _union(_union(names, required), keys)
+
+
+def _union(required: list[str] | None, names) -> list[str] | None:
+    """Return *required* extended with the sorted *names* it lacks."""
+    if required is None:
+        return None
+    result = list(dict.fromkeys(required))
+    result.extend(sorted(set(names) - set(result)))
+    return result
@@ -1,10 +1,17 @@
-"""Simplify rule: remove redundant plan nodes."""
+"""Simplify rule: remove redundant plan nodes.
+
+Filter conditions are simplified with
+:func:`~barrow.expr.simplify_expression`, e.g. ``a > 5 and a > 3`` becomes
+``a > 5``, using the schema of their input where it is known.
+"""
 
 from __future__ import annotations
 
 from dataclasses import replace
 
-from barrow.core.nodes import LogicalNode
+from barrow.core.nodes import Filter, LogicalNode
+from barrow.expr import simplify_expression
+from barrow.optimizer.schema import _known_schema
 
 
 def simplify(node: LogicalNode) -> LogicalNode:
@@ -14,6 +21,9 @@ def simplify(node: LogicalNode) -> LogicalNode:
 
 def _simplify(node: LogicalNode) -> LogicalNode:
     node = _simplify_children(node)
+    if isinstance(node, Filter) and node.expression is not None:
+        schema = _known_schema(node.child)
+        return replace(node, expression=simplify_expression(node.expression, schema))
     return node
 
 
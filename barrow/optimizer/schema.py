@@ -0,0 +1,249 @@
+"""Schema derivation: the Arrow schema every plan node produces.
+
+Scans take their schema from the files they read
+(:func:`barrow.io.read_schema`: file metadata, or the first block of a CSV
+file), cached per file version.  ``Mutate`` types its columns with
+:func:`~barrow.expr.types.infer_type`; aggregations, joins and windows run
+their operation on an empty table of the input schema, so their output
+matches execution without reading any data.  Inputs of unknown schema,
+such as ``STDIN`` and SQL query results, propagate ``None``.
+
+A column whose type cannot be inferred statically, such as a window
+function that is only typed by the partitions it runs on, has the ``null``
+type.  Plans that cannot execute, e.g. because they reference missing
+columns, raise :class:`~barrow.core.errors.PlanningError`, which lets
+:func:`validate_plan` reject them before any input is read.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import os
+
+import pyarrow as pa
+
+from barrow.core.errors import BarrowError, PlanningError
+from barrow.core.nodes import (
+    Aggregate,
+    Filter,
+    GroupBy,
+    Join,
+    LogicalNode,
+    Mutate,
+    Project,
+    Scan,
+    Sort,
+    SqlQuery,
+    TopK,
+    Ungroup,
+    Window,
+)
+from barrow.expr import Expression
+from barrow.expr.types import ExpressionType, infer_type
+
+# Errors raised by operations whose input types do not fit.
+_OPERATION_ERRORS = (BarrowError, KeyError, pa.ArrowException)
+
+
+def derive_schema(node: LogicalNode) -> pa.Schema | None:
+    """Return the schema *node* produces, or ``None`` if it is unknown.
+
+    Raises
+    ------
+    PlanningError
+        If *node* or a node below it cannot execute on its input schema.
+    """
+    if isinstance(node, Scan):
+        return _scan_schema(node)
+    if isinstance(node, Join):
+        return _join_schema(node)
+    child = getattr(node, "child", None)
+    if not isinstance(child, LogicalNode) or type(child) is LogicalNode:
+        return None
+    schema = derive_schema(child)
+    if schema is None or isinstance(node, SqlQuery):
+        return None
+
+    if isinstance(node, Filter):
+        if node.expression is not None:
+            _infer(node.expression, schema, "filter")
+        return schema
+
+    if isinstance(node, Project):
+        _require(schema, node.columns, "select")
+        return pa.schema(
+            [schema.field(c) for c in node.columns], metadata=schema.metadata
+        )
+
+    if isinstance(node, Mutate):
+        for name, expr in node.assignments.items():
+            schema = _assign(schema, name, expr)
+        return schema
+
+    if isinstance(node, (Sort, TopK)):
+        _require(schema, node.keys, "sort")
+        return schema
+
+    if isinstance(node, GroupBy):
+        from barrow.operations import groupby
+
+        _require(schema, node.keys, "groupby")
+        return groupby(schema.empty_table(), node.keys).schema
+
+    if isinstance(node, Ungroup):
+        from barrow.operations import ungroup
+
+        return ungroup(schema.empty_table()).schema
+
+    if isinstance(node, Aggregate):
+        return _aggregate_schema(node, schema)
+
+    if isinstance(node, Window):
+        return _window_schema(node, schema)
+
+    return schema
+
+
+def validate_plan(node: LogicalNode) -> None:
+    """Raise :class:`PlanningError` if *node* cannot execute.
+
+    Only the schemas of the inputs are read, so invalid plans fail before
+    any data is scanned.  Parts of the plan whose input schema is unknown
+    are not checked.
+    """
+    derive_schema(node)
+
+
+def _known_schema(node: LogicalNode) -> pa.Schema | None:
+    """Return the schema of *node*, or ``None`` if it is unknown or invalid."""
+    try:
+        return derive_schema(node)
+    except PlanningError:
+        return None
+
+
+def _assign(schema: pa.Schema, name: str, expr: Expression) -> pa.Schema:
+    """Return *schema* after ``mutate`` assigns *expr* to column *name*."""
+    expr_type = _infer(expr, schema, "mutate")
+    field = pa.field(name, expr_type.type, expr_type.nullable)
+    index = schema.get_field_index(name)
+    if index >= 0:
+        return schema.set(index, field)
+    return schema.append(field)
+
+
+def _infer(expr: Expression, schema: pa.Schema, command: str) -> ExpressionType:
+    try:
+        return infer_type(expr, schema)
+    except BarrowError as exc:
+        raise _planning_error(command, exc) from exc
+
+
+def _require(schema: pa.Schema, columns: list[str], command: str) -> None:
+    available = schema.names
+    missing = [c for c in columns if c not in available]
+    if missing:
+        raise PlanningError(
+            f"{command}: columns not found: {missing}. Available: {sorted(available)}"
+        )
+
+
+def _planning_error(command: str, exc: Exception) -> PlanningError:
+    """Wrap *exc*, prefixing its message with *command* unless it names it."""
+    message = str(exc)
+    if not message.startswith(command):
+        message = f"{command}: {message}"
+    return PlanningError(message)
+
+
+def _scan_schema(node: Scan) -> pa.Schema | None:
+    if not node.path:
+        return None
+    schema = _source_schema(node.path, node.format, node.delimiter)
+    if schema is None or not node.columns:
+        return schema
+    from barrow.io.reader import _existing_columns
+
+    columns = _existing_columns(schema.names, node.columns, schema.metadata)
+    if columns is None:
+        return schema
+    return pa.schema([schema.field(c) for c in columns], metadata=schema.metadata)
+
+
+def _join_schema(node: Join) -> pa.Schema | None:
+    from barrow.operations import join
+
+    left = derive_schema(node.left)
+    right = derive_schema(node.right)
+    if left is None or right is None:
+        return None
+    _require(left, node.left_on, "join")
+    _require(right, node.right_on, "join")
+    try:
+        result = join(
+            left.empty_table(),
+            right.empty_table(),
+            list(node.left_on),
+            list(node.right_on),
+            node.join_type,
+        )
+    except _OPERATION_ERRORS as exc:
+        raise _planning_error("join", exc) from exc
+    return result.schema
+
+
+def _aggregate_schema(node: Aggregate, schema: pa.Schema) -> pa.Schema:
+    from barrow.operations import groupby, summary
+
+    table = schema.empty_table()
+    if node.group_keys:
+        _require(schema, node.group_keys, "summary")
+        table = groupby(table, node.group_keys)
+    _require(schema, list(node.aggregations), "summary")
+    try:
+        return summary(table, node.aggregations).schema
+    except _OPERATION_ERRORS as exc:
+        raise _planning_error("summary", exc) from exc
+
+
+def _window_schema(node: Window, schema: pa.Schema) -> pa.Schema:
+    from barrow.operations import window
+
+    _require(schema, [*(node.by or []), *(node.order_by or [])], "window")
+    try:
+        return window(
+            schema.empty_table(), node.by, node.order_by, **node.assignments
+        ).schema
+    except NameError as exc:
+        raise _planning_error("window", exc) from exc
+    except _OPERATION_ERRORS:
+        # Window functions may reject empty partitions; keep the names.
+        for name in node.assignments:
+            if name not in schema.names:
+                schema = schema.append(pa.field(name, pa.null()))
+        return schema
+
+
+def _source_schema(
+    path: str, format: str | None, delimiter: str | None
+) -> pa.Schema | None:
+    try:
+        version = os.stat(path).st_mtime_ns
+    except OSError:
+        version = None
+    return _cached_schema(path, format, delimiter, version)
+
+
+@lru_cache(maxsize=128)
+def _cached_schema(
+    path: str, format: str | None, delimiter: str | None, version: int | None
+) -> pa.Schema | None:
+    from barrow.io import read_schema
+
+    try:
+        return read_schema(path, format, delimiter)
+    except (BarrowError, OSError, ValueError):
+        return None
+
+
+__all__ = ["derive_schema", "validate_plan"]
@@ -0,0 +1,183 @@
+"""Long-lived ``barrow serve`` daemon answering :mod:`barrow.client` requests.
+
+The server imports the CLI, the execution engine and their dependencies
+once and then forks a child per request, so every command starts with warm
+modules instead of a fresh interpreter.  Each child adopts the client's
+working directory, ``BARROW_*`` environment variables and standard file
+descriptors, runs :func:`barrow.cli.main` and reports the exit status.
+The server's own ``BARROW_*`` variables are dropped first, but other
+variables such as ``TMPDIR`` keep the server's values, so a served command
+may behave differently from one run locally.
+Forking isolates the global ``sys.std*`` streams and lets piped commands
+served by the same daemon run concurrently.  Per-process state that is not
+fork-safe, such as the DuckDB connection, is created in the child.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+
+from .client import _HEADER, _STATUS, default_socket_path, is_private_dir
+
+_MAX_FDS = 3
+
+
+def serve(path: str | None = None) -> int:
+    """Listen on the Unix socket *path* and run requests until interrupted."""
+    path = path or default_socket_path()
+    _warm_up()
+    sock = _bind(path)
+    print(f"barrow: serving on {path}", file=sys.stderr)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        while True:
+            conn, _ = sock.accept()
+            try:
+                if os.fork() == 0:
+                    sock.close()
+                    os._exit(_run_child(conn))
+            finally:
+                conn.close()
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        sock.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def _warm_up() -> None:
+    """Import the modules every command needs."""
+    import duckdb  # noqa: F401
+    import numpy  # noqa: F401
+    import pyarrow.compute  # noqa: F401
+    import pyarrow.csv  # noqa: F401
+    import pyarrow.dataset  # noqa: F401
+    import pyarrow.parquet  # noqa: F401
+
+    from . import cli, operations  # noqa: F401
+
+
+def _bind(path: str) -> socket.socket:
+    """Bind a listening socket, replacing a stale one left by a dead server.
+
+    The socket's directory is created with mode ``0700`` if it is missing;
+    an existing directory must already be private to the current user.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    if not is_private_dir(directory):
+        raise OSError(
+            f"{directory} must be owned by the current user and not be "
+            "accessible to others"
+        )
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+        else:
+            raise OSError(f"A barrow server is already listening on {path}")
+        finally:
+            probe.close()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(path)
+    finally:
+        os.umask(old_umask)
+    sock.listen()
+    return sock
+
+
+def _run_child(conn: socket.socket) -> int:
+    """Handle one request in a forked child and return its exit status."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    try:
+        request, fds = _receive(conn)
+    except (OSError, ValueError):
+        return 1
+    status = 1
+    try:
+        os.chdir(request["cwd"])
+        for key in [k for k in os.environ if k.startswith("BARROW_")]:
+            del os.environ[key]
+        os.environ.update(request["env"])
+        # The client's descriptors become this process's standard streams.
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = io.TextIOWrapper(io.BufferedReader(io.FileIO(0, "rb", False)))
+        sys.stdout = io.TextIOWrapper(io.BufferedWriter(io.FileIO(1, "wb", False)))
+        sys.stderr = io.TextIOWrapper(
+            io.BufferedWriter(io.FileIO(2, "wb", False)), write_through=True
+        )
+        status = _run(request["argv"])
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:  # pragma: no cover - broken pipe
+                pass
+        try:
+            conn.sendall(_STATUS.pack(status))
+        except OSError:  # pragma: no cover - client went away
+            pass
+        conn.close()
+    return status
+
+
+def _run(argv: list[str]) -> int:
+    from .cli import main
+
+    sys.argv = ["barrow", *argv]
+    try:
+        return main(argv)
+    except SystemExit as exc:
+        code = exc.code
+        if code is None:
+            return 0
+        if isinstance(code, int):
+            return code
+        print(code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+def _receive(conn: socket.socket) -> tuple[dict, list[int]]:
+    """Read a request header and the client's file descriptors."""
+    data, fds, _, _ = socket.recv_fds(conn, 64 * 1024, _MAX_FDS)
+    if len(fds) != _MAX_FDS:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError("Request must carry STDIN, STDOUT and STDERR")
+    while len(data) < _HEADER.size:
+        chunk = conn.recv(64 * 1024)
+        if not chunk:
+            raise ValueError("Truncated request")
+        data += chunk
+    (size,) = _HEADER.unpack_from(data)
+    payload = data[_HEADER.size :]
+    while len(payload) < size:
+        chunk = conn.recv(size - len(payload))
+        if not chunk:
+            raise ValueError("Truncated request")
+        payload += chunk
+    return json.loads(payload), fds
+
+
+__all__ = ["serve"]
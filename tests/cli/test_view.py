@@ -29,3 +29,20 @@ def test_view_reads_binary_and_writes_csv(fixture, fmt, request, sample_table) -
     assert result.returncode == 0, result.stderr
     out = csv.read_csv(io.BytesIO(result.stdout))
     assert out.to_pydict() == sample_table.to_pydict()
+
+
+def test_view_rows(sample_parquet, sample_table) -> None:
+    cmd = [
+        sys.executable,
+        "-m",
+        "barrow.cli",
+        "view",
+        "--input",
+        sample_parquet,
+        "--rows",
+        "2",
+    ]
+    result = subprocess.run(cmd, capture_output=True)
+    assert result.returncode == 0, result.stderr
+    out = csv.read_csv(io.BytesIO(result.stdout))
+    assert out.to_pydict() == sample_table.slice(0, 2).to_pydict()
@@ -51,8 +51,8 @@ def test_mutate_assignments():
 def test_join_nodes():
     left = Scan(path="left.csv")
     right = Scan(path="right.csv")
-    j = Join(left=left, right=right, left_on="id", right_on="id", join_type="inner")
-    assert j.left_on == "id"
+    j = Join(left=left, right=right, left_on=["id"], right_on=["id"], join_type="inner")
+    assert j.left_on == ["id"]
     assert j.join_type == "inner"
 
 
@@ -1,5 +1,8 @@
 """Tests for ExecutionResult."""
 
+import pytest
+
+from barrow.core.errors import ExecutionError
 from barrow.core.result import ExecutionResult
 from barrow.core.properties import LogicalProperties
 
@@ -29,3 +32,32 @@ def test_result_repr(sample_table):
 def test_result_schema(sample_table):
     result = ExecutionResult(sample_table)
     assert result.schema == sample_table.schema
+
+
+def test_streaming_result(sample_table):
+    result = ExecutionResult.from_batches(
+        sample_table.schema, sample_table.to_batches(max_chunksize=1)
+    )
+    assert result.is_streaming
+    assert result.column_names == ["a", "b", "grp"]
+    assert sum(b.num_rows for b in result.to_batches()) == 3
+    # The drained stream still reports how many rows flowed through it.
+    assert result.num_rows == 3
+
+
+def test_streaming_result_to_table(sample_table):
+    result = ExecutionResult.from_batches(
+        sample_table.schema, sample_table.to_batches(max_chunksize=1)
+    )
+    assert result.to_table().equals(sample_table)
+    assert not result.is_streaming
+    assert len(list(result.to_batches())) == 3
+
+
+def test_streaming_result_consumed_once(sample_table):
+    result = ExecutionResult.from_batches(
+        sample_table.schema, sample_table.to_batches()
+    )
+    list(result.to_batches())
+    with pytest.raises(ExecutionError):
+        result.to_batches()
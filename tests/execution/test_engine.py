@@ -1,6 +1,16 @@
 """Tests for the execution engine."""
 
-from barrow.core.nodes import Scan, Project, Filter, Sort, Sink, SqlQuery
+from barrow.core.nodes import (
+    Scan,
+    Project,
+    Filter,
+    Limit,
+    Sort,
+    Sink,
+    SqlQuery,
+    TopK,
+)
+from barrow.execution import ExecutionStats
 from barrow.execution.engine import execute
 from barrow.expr import parse
 
@@ -40,6 +50,12 @@ def test_execute_sql(sample_csv):
     assert set(result.table["a"].to_pylist()) == {2, 3}
 
 
+def test_execute_sql_reading_its_own_input(sample_parquet):
+    query = f"SELECT a FROM read_parquet('{sample_parquet}') WHERE a > 1"
+    result = execute(SqlQuery(query=query))
+    assert sorted(result.table["a"].to_pylist()) == [2, 3]
+
+
 def test_execute_sink(sample_csv, tmp_path):
     dst = tmp_path / "out.csv"
     scan = Scan(path=sample_csv, format="csv")
@@ -48,3 +64,46 @@ def test_execute_sink(sample_csv, tmp_path):
     result = execute(sink)
     assert result.num_rows == 3
     assert dst.exists()
+
+
+def test_execute_streams_stateless_pipeline(sample_parquet):
+    scan = Scan(path=sample_parquet, format="parquet")
+    filt = Filter(child=scan, expression=parse("a > 1"))
+    proj = Project(child=filt, columns=["a"])
+    result = execute(proj)
+    assert result.is_streaming
+    assert result.table["a"].to_pylist() == [2, 3]
+
+
+def test_execute_limit(sample_csv):
+    scan = Scan(path=sample_csv, format="csv")
+    result = execute(Limit(child=scan, n=2))
+    assert result.table["a"].to_pylist() == [1, 2]
+
+
+def test_execute_records_stats(sample_csv, tmp_path):
+    scan = Scan(path=sample_csv, format="csv")
+    filt = Filter(child=scan, expression=parse("a > 1"))
+    sort = Sort(child=filt, keys=["a"], descending=[False])
+    sink = Sink(child=sort, path=str(tmp_path / "out.csv"), format="csv")
+    stats = ExecutionStats()
+    execute(sink, stats)
+    assert stats.get(scan).rows == 3
+    assert stats.get(filt).rows == 2
+    assert stats.get(filt).backend == "arrow"
+    assert stats.get(sort).backend == "arrow"
+    assert stats.get(sort).batches >= 1
+    assert stats.get(sink).rows == 2
+    assert "rows_in=3 rows_out=2" in stats.describe(filt)
+
+
+def test_execute_top_k_across_batches(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "data.parquet"
+    table = pa.table({"a": [5, 1, 4, 1, 3, 9, 2, 9]})
+    pq.write_table(table, path, row_group_size=3)
+    scan = Scan(path=str(path), format="parquet")
+    result = execute(TopK(child=scan, keys=["a"], descending=[True], n=3))
+    assert result.table["a"].to_pylist() == [9, 9, 5]
@@ -0,0 +1,171 @@
+"""Tests for spilling pipeline breakers under a memory budget."""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+from barrow.core.errors import ExecutionError
+from barrow.core.nodes import Aggregate, Join, Scan, Sort, SqlQuery
+from barrow.core.result import ExecutionResult
+from barrow.execution import execute, memory_limit, parse_memory_limit, set_memory_limit
+from barrow.execution import spill
+from barrow.operations import groupby, join, sort, summary
+
+
+@pytest.fixture
+def table():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    keys = pa.array(rng.integers(0, 300, n))
+    keys = pc.if_else(pa.array(np.arange(n) % 9 == 0), None, keys)
+    return pa.table(
+        {
+            "k": keys,
+            "s": pa.array([f"v{x}" for x in rng.integers(0, 50, n)]),
+            "x": rng.random(n),
+            "i": np.arange(n),
+        }
+    )
+
+
+@pytest.fixture
+def no_memory_limit(monkeypatch):
+    monkeypatch.delenv("BARROW_MEMORY_LIMIT", raising=False)
+    yield
+    set_memory_limit(None)
+
+
+def _stream(table, rows=1000):
+    return ExecutionResult.from_batches(
+        table.schema, iter(table.to_batches(max_chunksize=rows))
+    )
+
+
+def _sorted(table):
+    return table.sort_by([(c, "ascending") for c in table.column_names])
+
+
+@pytest.mark.parametrize(
+    "keys, descending",
+    [(["k"], None), (["s", "k"], [True, False]), (["x"], [True])],
+)
+def test_spilled_sort_matches_in_memory_sort(table, keys, descending):
+    result = spill.sort(_stream(table), keys, descending, 64 * 1024)
+    assert result.is_streaming
+    assert result.table.equals(sort(table, keys, descending))
+
+
+def test_spilled_aggregate_uses_grouping_metadata(table):
+    def aggregate(t):
+        return summary(t, {"x": "sum", "i": "count"})
+
+    grouped = groupby(table, ["s", "k"])
+    result = spill.aggregate(_stream(grouped), [], aggregate, 64 * 1024).table
+    expected = aggregate(grouped)
+    assert result.num_rows == expected.num_rows
+    assert _sorted(result.select(["s", "k", "i_count"])).equals(
+        _sorted(expected.select(["s", "k", "i_count"]))
+    )
+
+
+@pytest.mark.parametrize(
+    "join_type, build_side",
+    [
+        ("inner", "right"),
+        ("inner", "left"),
+        ("left", "right"),
+        ("right", "right"),
+        ("outer", "right"),
+        ("semi", "right"),
+        ("anti", "right"),
+    ],
+)
+def test_grace_join_matches_in_memory_join(table, join_type, build_side):
+    right = pa.table(
+        {
+            "k": pa.array(np.arange(0, 300, 3)),
+            "s": pa.array([f"v{x % 50}" for x in range(0, 300, 3)]),
+            "y": np.arange(100),
+        }
+    )
+    build, probe = (table, right) if build_side == "left" else (right, table)
+    buffered = spill.buffer(_stream(build, 10), 256)
+    assert not buffered.fits
+    result = spill.join(
+        buffered,
+        _stream(probe),
+        ["k", "s"],
+        ["k", "s"],
+        join_type,
+        build_side,
+        16 * 1024,
+    ).table
+    expected = join(table, right, ["k", "s"], ["k", "s"], join_type)
+    assert result.column_names == expected.column_names
+    assert _sorted(result).equals(_sorted(expected).cast(result.schema))
+
+
+def test_row_hash_is_consistent_across_types_and_slices():
+    ints = pa.record_batch({"a": pa.array([1, 2, None], pa.int32())})
+    longs = pa.record_batch({"a": pa.array([1, 2, None], pa.int64())})
+    assert (spill._hash_rows(ints, ["a"]) == spill._hash_rows(longs, ["a"])).all()
+
+    zeros = pa.record_batch({"a": pa.array([0.0, -0.0])})
+    hashes = spill._hash_rows(zeros, ["a"])
+    assert hashes[0] == hashes[1]
+
+    strings = pa.record_batch({"a": ["x", "yz", "", "yz", "x"]})
+    hashes = spill._hash_rows(strings, ["a"])
+    sliced = spill._hash_rows(strings.slice(3), ["a"])
+    assert hashes[1] == hashes[3] == sliced[0]
+    assert hashes[0] == hashes[4] == sliced[1]
+    assert len(set(hashes[:3].tolist())) == 3
+
+
+def test_parse_memory_limit():
+    assert parse_memory_limit("1024") == 1024
+    assert parse_memory_limit("512M") == 512 << 20
+    assert parse_memory_limit("1.5GiB") == 3 << 29
+    with pytest.raises(ValueError):
+        parse_memory_limit("lots")
+
+
+def test_memory_limit_from_environment(monkeypatch, no_memory_limit):
+    monkeypatch.setenv("BARROW_MEMORY_LIMIT", "2k")
+    assert memory_limit() == 2048
+    set_memory_limit(4096)
+    assert memory_limit() == 4096
+    set_memory_limit(None)
+    monkeypatch.setenv("BARROW_MEMORY_LIMIT", "huge")
+    with pytest.raises(ExecutionError):
+        memory_limit()
+
+
+def test_engine_spills_under_memory_limit(tmp_path, table, no_memory_limit):
+    path = tmp_path / "t.parquet"
+    pq.write_table(table, path, row_group_size=1000)
+    scan = Scan(path=str(path), format="parquet")
+    set_memory_limit(64 * 1024)
+
+    result = execute(Sort(child=scan, keys=["s", "i"]))
+    assert result.is_streaming
+    assert result.table.equals(sort(table, ["s", "i"]))
+
+    result = execute(
+        Aggregate(child=scan, group_keys=["s"], aggregations={"x": "count"})
+    )
+    assert sorted(result.table["x_count"].to_pylist()) == sorted(
+        summary(groupby(table, ["s"]), {"x": "count"})["x_count"].to_pylist()
+    )
+
+    result = execute(
+        Join(left=scan, right=scan, left_on=["i"], right_on=["i"], join_type="outer")
+    )
+    assert result.table.num_rows == table.num_rows
+
+    result = execute(
+        SqlQuery(child=scan, query="SELECT s, count(*) AS n FROM tbl GROUP BY s")
+    )
+    assert sum(result.table["n"].to_pylist()) == table.num_rows
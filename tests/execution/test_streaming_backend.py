@@ -0,0 +1,62 @@
+"""Tests for the batch-at-a-time streaming backend."""
+
+import pyarrow as pa
+
+from barrow.core.result import ExecutionResult
+from barrow.execution.backends.streaming_backend import StreamingBackend
+from barrow.expr import parse
+
+
+def _stream(table: pa.Table, chunk: int = 1) -> ExecutionResult:
+    return ExecutionResult.from_batches(
+        table.schema, table.to_batches(max_chunksize=chunk)
+    )
+
+
+def test_filter_streams_batches(sample_table):
+    result = StreamingBackend().execute_filter(_stream(sample_table), parse("a > 1"))
+    assert result.is_streaming
+    assert result.table["a"].to_pylist() == [2, 3]
+
+
+def test_mutate_streams_batches(sample_table):
+    result = StreamingBackend().execute_mutate(
+        _stream(sample_table), {"c": parse("a + b")}
+    )
+    assert result.column_names == ["a", "b", "grp", "c"]
+    assert result.table["c"].to_pylist() == [5, 7, 9]
+
+
+def test_project_empty_input(sample_table):
+    empty = ExecutionResult.from_batches(sample_table.schema, [])
+    result = StreamingBackend().execute_project(empty, ["grp"])
+    assert result.column_names == ["grp"]
+    assert result.num_rows == 0
+
+
+def test_groupby_metadata_survives_streaming(sample_table):
+    result = StreamingBackend().execute_groupby(_stream(sample_table), ["grp"])
+    assert result.schema.metadata[b"grouped_by"] == b"grp"
+    assert result.table.schema.metadata[b"grouped_by"] == b"grp"
+
+
+def test_limit_stops_pulling(sample_table):
+    pulled = []
+
+    def batches():
+        for batch in sample_table.to_batches(max_chunksize=1):
+            pulled.append(batch)
+            yield batch
+
+    source = ExecutionResult.from_batches(sample_table.schema, batches())
+    result = StreamingBackend().execute_limit(source, 2)
+    assert result.table["a"].to_pylist() == [1, 2]
+    assert len(pulled) == 2
+
+
+def test_whole_column_functions_materialize(sample_table):
+    backend = StreamingBackend()
+    result = backend.execute_mutate(_stream(sample_table), {"c": parse("cumsum(a)")})
+    assert result.table["c"].to_pylist() == [1, 3, 6]
+    result = backend.execute_filter(_stream(sample_table), parse("a < max(a)"))
+    assert result.table["a"].to_pylist() == [1, 2]
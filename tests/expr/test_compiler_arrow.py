@@ -0,0 +1,62 @@
+"""Tests for compiling expressions to Arrow."""
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from barrow.errors import InvalidExpressionError
+from barrow.expr import evaluate_arrow, parse, to_arrow
+
+
+def _no_fallback(expr):
+    raise AssertionError(f"unexpected fallback for {expr!r}")
+
+
+def test_to_arrow_filters_table():
+    table = pa.table({"a": [1, 2, 3, 4], "region": ["EU", "US", "EU", "EU"]})
+    expr = to_arrow(parse('region == "EU" and a / 2 > 1'))
+    assert table.filter(expr).to_pydict() == {"a": [3, 4], "region": ["EU", "EU"]}
+
+
+def test_to_arrow_matches_sequences_and_patterns():
+    table = pa.table({"a": [1, 2, None], "s": ["xa", "ya", None]})
+    expr = to_arrow(parse('a not in [2] and s like "x%"'))
+    assert table.filter(expr).to_pydict() == {"a": [1], "s": ["xa"]}
+
+
+def test_to_arrow_rejects_unsupported_expression():
+    with pytest.raises(InvalidExpressionError):
+        to_arrow(parse("sqrt(a) > 1"))
+
+
+def test_evaluate_arrow_uses_kernels():
+    table = pa.table({"a": [1, None, 3], "s": ["x", "y", None]})
+    result = evaluate_arrow(parse("sqrt(a / 2) + 1 > 1.8"), table, _no_fallback)
+    assert result.to_pylist() == [False, None, True]
+    result = evaluate_arrow(parse('s + "!"'), table, _no_fallback)
+    assert result.to_pylist() == ["x!", "y!", None]
+
+
+def test_evaluate_arrow_matches_with_kernels():
+    table = pa.table({"a": [1, None, 3], "s": ["Jo", "Bo", None]})
+    result = evaluate_arrow(parse("a in [3, None]"), table, _no_fallback)
+    assert result.to_pylist() == [False, True, True]
+    result = evaluate_arrow(parse("a not in (1,)"), table, _no_fallback)
+    assert result.to_pylist() == [False, True, True]
+    result = evaluate_arrow(parse('s like "J_"'), table, _no_fallback)
+    assert result.to_pylist() == [True, False, None]
+
+
+def test_evaluate_arrow_falls_back_per_node():
+    table = pa.table({"a": [1, 2, 3]})
+    seen = []
+
+    def fallback(expr):
+        seen.append(expr)
+        return np.array([10, 20, 30]) if expr == parse("a % 2") else np.pi
+
+    result = evaluate_arrow(parse("a % 2 + a * pi"), table, fallback)
+    assert seen == [parse("a % 2"), parse("pi")]
+    assert result.to_pylist() == pytest.approx(
+        [10 + np.pi, 20 + 2 * np.pi, 30 + 3 * np.pi]
+    )
@@ -0,0 +1,40 @@
+import math
+
+import numpy as np
+import pytest
+
+from barrow.expr import compile_expression, parse
+
+
+def test_compiled_expression_matches_evaluate():
+    expr = parse("sqrt(a) + b * 2 > 3 and not flag")
+    env = {"a": 4.0, "b": 1, "flag": False}
+    assert compile_expression(expr)(env) is True
+    assert expr.evaluate(env) is True
+    assert compile_expression(expr)({**env, "flag": True}) is False
+
+
+def test_compiled_expression_is_cached_by_text():
+    first = compile_expression(parse("a + 1"))
+    assert compile_expression(parse("a + 1")) is first
+    assert compile_expression(parse("a + 2")) is not first
+
+
+def test_environment_overrides_default_functions():
+    evaluator = compile_expression(parse("sqrt(a)"))
+    assert evaluator({"a": 9}) == math.sqrt(9)
+    result = evaluator({"a": np.array([4.0, 9.0]), "sqrt": np.sqrt})
+    assert result.tolist() == [2.0, 3.0]
+
+
+def test_compiled_logical_operators_on_arrays():
+    evaluator = compile_expression(parse("a > 1 or not b"))
+    result = evaluator({"a": np.array([0, 2, 0]), "b": np.array([True, True, False])})
+    assert result.tolist() == [False, True, True]
+
+
+def test_missing_names_raise():
+    with pytest.raises(KeyError):
+        compile_expression(parse("missing + 1"))({})
+    with pytest.raises(NameError):
+        compile_expression(parse("nofunc(1)"))({})
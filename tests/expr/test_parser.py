@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from barrow.errors import InvalidExpressionError
@@ -69,3 +70,18 @@ def test_like_operator():
     assert expr == expected
     assert expr.evaluate({"name": "John"}) is True
     assert expr.evaluate({"name": "Bob"}) is False
+
+
+def test_membership_and_like_on_arrays():
+    env = {"a": np.array([1, 2, 3]), "s": np.array(["John", "Bob", None], object)}
+    assert parse("a in (1, 3)").evaluate(env).tolist() == [True, False, True]
+    assert parse("a not in {1, 3}").evaluate(env).tolist() == [False, True, False]
+    assert parse("s like 'Jo%'").evaluate(env).tolist() == [True, False, None]
+
+
+def test_boolean_operators_use_kleene_logic_on_arrays():
+    env = {"a": np.array([1, 2, 3]), "b": np.array([True, None, False], object)}
+    assert parse("a > 1 and b").evaluate(env).tolist() == [False, None, False]
+    assert parse("b or a == 1").evaluate(env).tolist() == [True, None, False]
+    assert parse("not b").evaluate(env).tolist() == [False, None, True]
+    assert parse("not (a > 1)").evaluate(env).tolist() == [True, False, False]
@@ -0,0 +1,87 @@
+import pyarrow as pa
+
+from barrow.expr import (
+    BinaryExpression,
+    Literal,
+    Name,
+    eliminate_common_subexpressions,
+    parse,
+    simplify_expression,
+)
+from barrow.operations import mutate
+
+
+def test_folds_literal_subtrees():
+    assert simplify_expression(parse("-5 + 2 * 3")) == Literal(1)
+    assert simplify_expression(parse("a * (4 - 2)")) == parse("a * 2")
+
+
+def test_keeps_failing_and_oversized_constants():
+    assert simplify_expression(parse("1 / 0")) == parse("1 / 0")
+    assert simplify_expression(parse("2 ** 70")) == parse("2 ** 70")
+
+
+def test_removes_identities():
+    schema = pa.schema([("a", pa.int64()), ("x", pa.float64())])
+    assert simplify_expression(parse("a * 1 + 0"), schema) == Name("a")
+    assert simplify_expression(parse("1 * (0 + a) - 0"), schema) == Name("a")
+    assert simplify_expression(parse("x * 1"), schema) == Name("x")
+    # Float identities would change the type of integer columns.
+    assert simplify_expression(parse("a + 0.0"), schema) == parse("a + 0.0")
+
+
+def test_keeps_identities_that_change_types():
+    schema = pa.schema(
+        [("flag", pa.bool_()), ("small", pa.int32()), ("s", pa.string())]
+    )
+    for text in ("flag + 0", "small * 1", "s * 1", "missing + 0"):
+        assert simplify_expression(parse(text), schema) == parse(text)
+    # Without a schema the types of columns are unknown.
+    assert simplify_expression(parse("a * 1")) == parse("a * 1")
+
+
+def test_removes_double_negation_of_conditions():
+    assert simplify_expression(parse("not not (a > 1)")) == parse("a > 1")
+    assert simplify_expression(parse("not not a")) == parse("not not a")
+
+
+def test_merges_ranges_within_conjunctions():
+    assert simplify_expression(parse("a > 5 and a > 3")) == parse("a > 5")
+    assert simplify_expression(parse("a >= 5 and 5 < a")) == parse("5 < a")
+    assert simplify_expression(parse("a < 3 and b == 1 and a <= 2 and a > 0")) == (
+        parse("b == 1 and a <= 2 and a > 0")
+    )
+    assert simplify_expression(parse("a > 5 or a > 3")) == parse("a > 5 or a > 3")
+
+
+def test_reuses_earlier_assignments():
+    result = eliminate_common_subexpressions(
+        {"c": parse("a + b"), "d": parse("(a + b) * 2"), "e": parse("sqrt(a + b)")}
+    )
+    assert result == {
+        "c": parse("a + b"),
+        "d": BinaryExpression(Name("c"), "*", Literal(2)),
+        "e": parse("sqrt(c)"),
+    }
+
+
+def test_does_not_reuse_reassigned_columns():
+    assignments = {
+        "c": parse("a + b"),
+        "d": parse("a * 2"),
+        "a": parse("a * 2"),
+        "e": parse("a + b"),
+        "f": parse("a * 2"),
+    }
+    result = eliminate_common_subexpressions(assignments)
+    assert result["a"] == Name("d")
+    assert result["e"] == parse("a + b")
+    assert result["f"] == parse("a * 2")
+
+
+def test_shared_subexpressions_give_the_same_columns():
+    table = pa.table({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]})
+    assignments = {"c": parse("a * b"), "d": parse("a * b + 1"), "a": parse("a * b")}
+    rewritten = eliminate_common_subexpressions(assignments)
+    assert rewritten["d"] == parse("c + 1")
+    assert mutate(table, **rewritten).equals(mutate(table, **assignments))
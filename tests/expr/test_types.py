@@ -0,0 +1,60 @@
+import pyarrow as pa
+import pytest
+
+from barrow.errors import InvalidExpressionError
+from barrow.expr import ExpressionType, infer_type, parse
+
+SCHEMA = pa.schema(
+    [
+        pa.field("a", pa.int32()),
+        pa.field("b", pa.float64()),
+        pa.field("s", pa.string(), nullable=False),
+    ]
+)
+
+
+def _type(text: str) -> ExpressionType:
+    return infer_type(parse(text), SCHEMA)
+
+
+def test_arithmetic_follows_the_kernels():
+    assert _type("a + 1") == ExpressionType(pa.int64())
+    assert _type("a / 2").type == pa.float64()
+    assert _type("-a").type == pa.int32()
+    assert _type("a * b").type == pa.float64()
+    assert _type("a % 2").type == pa.int32()
+
+
+def test_functions_and_numpy_names():
+    assert _type("sqrt(a)").type == pa.float64()
+    assert _type("where(a > 1, a, 0)").type == pa.int32()
+    assert _type("pi * 2") == ExpressionType(pa.float64(), nullable=False)
+
+
+def test_predicates_are_boolean():
+    assert _type("a > 1 and not b < 2") == ExpressionType(pa.bool_())
+    assert _type("s like 'x%'") == ExpressionType(pa.bool_(), nullable=False)
+    assert _type("a in [1, 2]") == ExpressionType(pa.bool_(), nullable=False)
+
+
+def test_strings_follow_python_semantics():
+    assert _type("s + s") == ExpressionType(pa.string(), nullable=False)
+    assert _type("s * 2").type == pa.string()
+    with pytest.raises(InvalidExpressionError):
+        _type("s - 1")
+    with pytest.raises(InvalidExpressionError):
+        _type("s < 1")
+    with pytest.raises(InvalidExpressionError):
+        _type("sqrt(s)")
+
+
+def test_unknown_names_raise():
+    with pytest.raises(InvalidExpressionError, match="'missing'"):
+        _type("missing + 1")
+    with pytest.raises(InvalidExpressionError, match="'nofunc'"):
+        _type("nofunc(a)")
+
+
+def test_unknown_types_are_null():
+    result = _type("max(a, b)")
+    assert not result.known
@@ -1,8 +1,12 @@
 """Tests for CLI to plan conversion."""
 
 import argparse
-from barrow.core.nodes import Sink, Sort, SqlQuery
-from barrow.frontend.cli_to_plan import cli_to_plan
+
+import pytest
+
+from barrow.core.nodes import Filter, Mutate, Project, Scan, Sink, Sort, SqlQuery
+from barrow.errors import FrontendError
+from barrow.frontend.cli_to_plan import cli_to_plan, pipeline_to_plan, split_pipeline
 
 
 def _make_args(**kwargs):
@@ -65,3 +69,23 @@ def test_view_plan():
     sink_nodes = [n for n in nodes if isinstance(n, Sink)]
     assert sink_nodes[0].format == "csv"
     assert sink_nodes[0].path is None
+
+
+def test_split_pipeline_keeps_quoted_pipes():
+    stages = split_pipeline("filter 'a > 1' | sql 'SELECT a || b FROM tbl'")
+    assert stages == [["filter", "a > 1"], ["sql", "SELECT a || b FROM tbl"]]
+    with pytest.raises(FrontendError):
+        split_pipeline("filter 'a > 1' |")
+
+
+def test_pipeline_plan_chains_stages():
+    stages = [
+        ("filter", argparse.Namespace(expression="a > 1")),
+        ("mutate", argparse.Namespace(assignments="c=a*2")),
+        ("select", argparse.Namespace(columns="c")),
+    ]
+    plan = pipeline_to_plan(stages, _make_args())
+    types = [type(n) for n in plan.walk()]
+    assert types == [Scan, Filter, Mutate, Project, Sink]
+    with pytest.raises(FrontendError):
+        pipeline_to_plan([("view", argparse.Namespace())], _make_args())
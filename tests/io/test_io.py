@@ -5,12 +5,22 @@ import io
 import sys
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import pyarrow.orc as orc
 import pytest
 
-from barrow.errors import UnsupportedFormatError
-from barrow.io import read_table, write_table
+from barrow.errors import BarrowIOError, UnsupportedFormatError
+from barrow.io import (
+    WriteOptions,
+    read_batches,
+    read_column_names,
+    read_statistics,
+    read_table,
+    write_batches,
+    write_dataset,
+    write_table,
+)
 
 
 def test_read_table_infers_format_from_extension(tmp_path: Path) -> None:
@@ -150,3 +160,279 @@ def test_write_table_unsupported_format() -> None:
     table = pa.table({"a": [1]})
     with pytest.raises(UnsupportedFormatError):
         write_table(table, "dummy", "json")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet", "feather", "orc", "arrow"])
+def test_read_write_batches_round_trip(tmp_path: Path, fmt: str) -> None:
+    table = pa.table({"a": list(range(10)), "b": [f"x{i}" for i in range(10)]})
+    src = tmp_path / f"input.{fmt}"
+    write_table(table, str(src), fmt)
+
+    reader = read_batches(str(src), None, batch_size=4, columns=["b", "missing"])
+    assert reader.schema.names == ["b"]
+    assert reader.schema.metadata[b"format"] == fmt.encode()
+
+    dst = tmp_path / f"output.{fmt}"
+    rows = write_batches(reader, str(dst), None)
+    assert rows == 10
+    assert read_table(str(dst), fmt).column("b").to_pylist() == table["b"].to_pylist()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet", "feather", "orc", "arrow"])
+def test_read_batches_without_existing_columns_reads_none(
+    tmp_path: Path, fmt: str
+) -> None:
+    src = tmp_path / f"input.{fmt}"
+    write_table(pa.table({"a": [1, 2, 3]}), str(src), fmt)
+    table = read_batches(str(src), None, columns=["missing"]).read_all()
+    assert table.column_names == []
+    assert table.num_rows == 3
+
+
+def test_write_batches_csv_keeps_grouping_comment(tmp_path: Path) -> None:
+    table = pa.table({"a": [1]}).replace_schema_metadata({b"grouped_by": b"a"})
+    dst = tmp_path / "out.csv"
+    write_batches(table.to_reader(), str(dst), "csv")
+    assert dst.read_text().startswith("# grouped_by: a\n")
+
+
+def test_read_batches_streams_csv_from_stdin(monkeypatch) -> None:
+    rows = "\n".join(f"{i};x{i}" for i in range(1000))
+    data = f"# grouped_by: b\na;b\n{rows}\n".encode()
+
+    class Dummy:
+        def __init__(self, d: bytes) -> None:
+            self.buffer = io.BytesIO(d)
+
+    monkeypatch.setattr(sys, "stdin", Dummy(data))
+    reader = read_batches(None, None, block_size=1024)
+    assert reader.schema.names == ["a", "b"]
+    assert reader.schema.metadata[b"grouped_by"] == b"b"
+    batches = list(reader)
+    assert len(batches) > 1
+    assert sum(b.num_rows for b in batches) == 1000
+
+
+def test_read_table_csv_grouping_comment_from_file(tmp_path: Path) -> None:
+    path = tmp_path / "grouped.csv"
+    path.write_text("# grouped_by: grp\na\tgrp\n1\tx\n")
+    table = read_table(str(path), None)
+    assert table.to_pydict() == {"a": [1], "grp": ["x"]}
+    assert table.schema.metadata[b"grouped_by"] == b"grp"
+
+
+def test_read_batches_csv_decodes_selected_and_grouping_columns(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "grouped.csv"
+    path.write_text('# grouped_by: grp\na,"b,c",grp\n1,x,g\n')
+    reader = read_batches(str(path), None, columns=["b,c", "missing"])
+    assert reader.read_all().to_pydict() == {"b,c": ["x"], "grp": ["g"]}
+
+
+def test_read_batches_streams_arrow_from_stdin(monkeypatch) -> None:
+    table = pa.table({"a": list(range(10))}).replace_schema_metadata(
+        {b"format": b"csv", b"grouped_by": b"a"}
+    )
+    buf = io.BytesIO()
+    with pa.ipc.new_stream(buf, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=3):
+            writer.write_batch(batch)
+
+    class Dummy:
+        def __init__(self, d: bytes) -> None:
+            self.buffer = io.BytesIO(d)
+
+    monkeypatch.setattr(sys, "stdin", Dummy(buf.getvalue()))
+    reader = read_batches(None, None)
+    assert reader.schema.metadata[b"format"] == b"csv"
+    assert reader.schema.metadata[b"grouped_by"] == b"a"
+    batches = list(reader)
+    assert [b.num_rows for b in batches] == [3, 3, 3, 1]
+
+
+def test_read_batches_parquet_applies_predicate(tmp_path: Path) -> None:
+    table = pa.table({"a": list(range(100)), "region": ["EU", "US"] * 50})
+    path = tmp_path / "data.parquet"
+    pq.write_table(table, path, row_group_size=10)
+
+    reader = read_batches(
+        str(path), None, columns=["a"], predicate=pc.field("region") == "EU"
+    )
+    assert reader.schema.names == ["a"]
+    assert reader.read_all().column("a").to_pylist() == list(range(0, 100, 2))
+
+    # A predicate that does not bind to the schema is ignored.
+    reader = read_batches(str(path), None, predicate=pc.field("region") > 1)
+    assert reader.read_all().num_rows == 100
+
+
+@pytest.mark.parametrize("name", ["data.csv", "data.parquet", "data.arrows"])
+def test_read_column_names(tmp_path: Path, name: str) -> None:
+    path = tmp_path / name
+    write_table(pa.table({"a": [1], "b c": ["x"]}), str(path), None)
+    assert read_column_names(str(path)) == ["a", "b c"]
+
+
+@pytest.mark.parametrize(
+    "name", ["data.csv", "data.parquet", "data.feather", "data.orc", "data.arrows"]
+)
+def test_read_statistics(tmp_path: Path, name: str) -> None:
+    path = tmp_path / name
+    table = pa.table({"a": list(range(1000)), "b": ["x" * 10] * 1000})
+    write_table(table, str(path), None)
+    stats = read_statistics(str(path))
+    assert stats.columns == ("a", "b")
+    assert stats.num_rows == 1000 if stats.exact else 500 < stats.num_rows < 2000
+    assert 0 < stats.bytes_for(["a"]) < stats.num_bytes
+
+
+def test_read_statistics_extrapolates_large_csv(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    write_table(pa.table({"a": list(range(100_000, 200_000))}), str(path), None)
+    stats = read_statistics(str(path))
+    assert not stats.exact
+    assert 90_000 < stats.num_rows < 110_000
+
+
+def _write_hive(root: Path) -> None:
+    for day in ("2024-01-01", "2024-01-02"):
+        for hour in ("00", "01"):
+            part = root / f"dt={day}" / f"hour={hour}"
+            part.mkdir(parents=True)
+            pq.write_table(pa.table({"v": [1, 2]}), part / "part.parquet")
+
+
+def test_read_batches_scans_hive_directory(tmp_path: Path) -> None:
+    _write_hive(tmp_path / "events")
+    predicate = (pc.field("dt") == "2024-01-02") & (pc.field("hour") == 1)
+    table = read_batches(str(tmp_path / "events"), None, predicate=predicate).read_all()
+    assert table.schema.names == ["v", "dt", "hour"]
+    assert table.to_pydict() == {"v": [1, 2], "dt": ["2024-01-02"] * 2, "hour": [1, 1]}
+    assert read_column_names(str(tmp_path / "events")) == ["v", "dt", "hour"]
+    stats = read_statistics(str(tmp_path / "events"))
+    assert (stats.num_rows, stats.columns) == (8, ("v", "dt", "hour"))
+
+
+def test_read_table_from_glob(tmp_path: Path) -> None:
+    _write_hive(tmp_path / "events")
+    table = read_table(str(tmp_path / "events" / "**" / "*.parquet"), None)
+    assert table.num_rows == 8
+    assert table.schema.metadata[b"format"] == b"parquet"
+    with pytest.raises(BarrowIOError):
+        read_table(str(tmp_path / "events" / "*.csv"), None)
+
+
+def test_write_dataset_partitions_and_shards(tmp_path: Path) -> None:
+    table = pa.table({"a": [1, 2, 3, 4, 5], "g": ["x", "y", "x", "x", "y"]})
+    dst = tmp_path / "out"
+    rows = write_dataset(
+        table.to_reader(max_chunksize=2),
+        str(dst),
+        "parquet",
+        partition_by=["g"],
+        max_rows_per_file=2,
+    )
+    assert rows == 5
+    assert sorted(p.name for p in (dst / "g=x").iterdir()) == [
+        "part-0.parquet",
+        "part-1.parquet",
+    ]
+    assert pq.read_table(dst / "g=y").column_names == ["a"]
+    back = read_table(str(dst), None).sort_by("a")
+    assert back.to_pydict() == table.to_pydict()
+
+
+def test_write_dataset_requires_directory_and_known_columns(tmp_path: Path) -> None:
+    table = pa.table({"a": [1]})
+    with pytest.raises(BarrowIOError):
+        write_dataset(table.to_reader(), None, "parquet", max_rows_per_file=1)
+    with pytest.raises(BarrowIOError):
+        write_dataset(table.to_reader(), str(tmp_path), "csv", partition_by=["b"])
+    with pytest.raises(UnsupportedFormatError):
+        write_dataset(table.to_reader(), str(tmp_path), "orc", partition_by=["a"])
+
+
+def test_write_batches_parquet_options(tmp_path: Path) -> None:
+    table = pa.table({"a": list(range(10)), "g": ["x"] * 10})
+    dst = tmp_path / "out.parquet"
+    options = WriteOptions(
+        compression="zstd",
+        compression_level=9,
+        row_group_size=4,
+        dictionary_columns=("g",),
+        sorting_columns=("a:desc",),
+        bloom_filter_columns=("g",),
+    )
+    write_batches(table.to_reader(max_chunksize=3), str(dst), None, options=options)
+    metadata = pq.ParquetFile(dst).metadata
+    groups = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
+    assert [g.num_rows for g in groups] == [4, 4, 2]
+    assert groups[0].column(0).compression == "ZSTD"
+    assert groups[0].sorting_columns[0].descending
+    assert pq.read_table(dst).equals(table)
+
+
+def test_write_options_for_ipc_and_orc(tmp_path: Path) -> None:
+    table = pa.table({"a": [1, 2], "b": ["x", "y"]})
+    feather_path = tmp_path / "out.feather"
+    write_table(
+        table, str(feather_path), None, options=WriteOptions(compression="zstd")
+    )
+    assert read_table(str(feather_path), None).equals(
+        table.replace_schema_metadata({b"format": b"feather"})
+    )
+    orc_path = tmp_path / "out.orc"
+    options = WriteOptions(compression="gzip", bloom_filter_columns=("b",))
+    write_table(table, str(orc_path), None, options=options)
+    assert orc.ORCFile(orc_path).compression == "ZLIB"
+    with pytest.raises(BarrowIOError):
+        write_table(
+            table, str(feather_path), None, options=WriteOptions(compression="snappy")
+        )
+    with pytest.raises(BarrowIOError):
+        WriteOptions(compression="lzo")
+
+
+def test_feather_reads_are_memory_mapped(tmp_path: Path, monkeypatch) -> None:
+    import pyarrow.feather as feather
+
+    table = pa.table({"a": list(range(100_000)), "b": [1.5] * 100_000})
+    path = tmp_path / "input.feather"
+    feather.write_feather(table, path, compression="uncompressed")
+    size = path.stat().st_size
+
+    before = pa.total_allocated_bytes()
+    result = read_table(str(path), None)
+    assert result.select(["a", "b"]).equals(table)
+    assert pa.total_allocated_bytes() - before < size // 10
+
+    class Dummy:
+        def __init__(self, stream) -> None:
+            self.buffer = stream
+
+    with open(path, "rb") as stream:
+        monkeypatch.setattr(sys, "stdin", Dummy(stream))
+        before = pa.total_allocated_bytes()
+        result = read_table(None, None)
+        assert pa.total_allocated_bytes() - before < size // 10
+    assert result.select(["a", "b"]).equals(table)
+    assert result.schema.metadata[b"format"] == b"feather"
+
+
+def test_read_batches_limit(tmp_path: Path, monkeypatch) -> None:
+    table = pa.table({"a": list(range(100)), "b": [str(i) for i in range(100)]})
+    pq_path = tmp_path / "input.parquet"
+    pq.write_table(table, pq_path, row_group_size=10)
+    reader = read_batches(str(pq_path), None, columns=["a"], limit=15)
+    assert reader.read_all().column("a").to_pylist() == list(range(15))
+
+    class Dummy:
+        def __init__(self, d: bytes) -> None:
+            self.buffer = io.BytesIO(d)
+
+    data = "a\n" + "\n".join(str(i) for i in range(1000)) + "\n"
+    monkeypatch.setattr(sys, "stdin", Dummy(data.encode()))
+    reader = read_batches(None, None, batch_size=7, limit=10)
+    assert reader.read_all().column("a").to_pylist() == list(range(10))
+    assert read_batches(str(pq_path), None, limit=0).read_all().num_rows == 0
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def test_tmp_pipeline_streams_arrow(sample_csv) -> None:
+    cmd_filter = [
+        sys.executable,
+        "-m",
+        "barrow.cli",
+        "filter",
+        "a > 1",
+        "--input",
+        sample_csv,
+        "-t",
+    ]
+    cmd_mutate = [sys.executable, "-m", "barrow.cli", "mutate", "c=a*2", "-t"]
+    cmd_select = [sys.executable, "-m", "barrow.cli", "select", "a,c"]
+    p1 = subprocess.Popen(cmd_filter, stdout=subprocess.PIPE)
+    p2 = subprocess.Popen(cmd_mutate, stdin=p1.stdout, stdout=subprocess.PIPE)
+    assert p1.stdout is not None and p2.stdout is not None
+    p1.stdout.close()
+    p3 = subprocess.Popen(cmd_select, stdin=p2.stdout, stdout=subprocess.PIPE)
+    p2.stdout.close()
+    out, _ = p3.communicate()
+    assert p3.returncode == 0
+
+    # The intermediate stream keeps the CSV input format for the final stage.
+    assert out.decode().splitlines() == ['"a","c"', "2,4", "3,6"]
+
+
+def test_tmp_pipeline_streams_large_batches(tmp_path) -> None:
+    # Batches larger than the bytes peeked for format detection must be
+    # read across the end of the peeked prefix.
+    src = tmp_path / "big.parquet"
+    n = 1_000_000
+    k = np.arange(n)
+    pq.write_table(pa.table({"k": k, "v": k % 10 / 10}), src)
+    cmd_filter = [
+        sys.executable,
+        "-m",
+        "barrow.cli",
+        "filter",
+        "v > 0.5",
+        "-i",
+        str(src),
+        "-t",
+    ]
+    cmd_select = [sys.executable, "-m", "barrow.cli", "select", "k", "-t"]
+    p1 = subprocess.Popen(cmd_filter, stdout=subprocess.PIPE)
+    p2 = subprocess.Popen(
+        cmd_select, stdin=p1.stdout, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    assert p1.stdout is not None
+    p1.stdout.close()
+    out, err = p2.communicate()
+    assert p1.wait() == 0
+    assert p2.returncode == 0, err.decode()
+    table = pa.ipc.open_stream(out).read_all()
+    assert table.column_names == ["k"]
+    assert table.num_rows == n * 4 // 10
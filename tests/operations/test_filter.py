@@ -1,4 +1,5 @@
 import logging
+import pyarrow as pa
 import pytest
 
 from barrow.expr import parse
@@ -38,3 +39,33 @@ def test_filter_invalid_expression(sample_table, expr_str, caplog):
     assert (
         "Filtering with expression" in caplog.text
     ), f"Missing log entry for expression '{expr_str}'"
+
+
+def test_filter_keeps_strings_and_nulls_in_arrow():
+    table = pa.table({"a": [1, None, 3], "s": ["EU", "US", None]})
+    assert filter_rows(table, parse('s == "EU"'))["a"].to_pylist() == [1]
+    assert filter_rows(table, parse("a != 1"))["a"].to_pylist() == [3]
+
+
+def test_filter_falls_back_to_numpy_functions(sample_table):
+    result = filter_rows(sample_table, parse("a % 2 == 1"))
+    assert result["a"].to_pylist() == [1, 3]
+
+
+def test_filter_evaluates_conjuncts_on_remaining_rows():
+    n = 1000
+    table = pa.table(
+        {"a": list(range(n)), "s": [None if i % 7 else "x" for i in range(n)]}
+    )
+    result = filter_rows(table, parse('a < 100 and s == "x" and a % 2 == 0'))
+    assert result["a"].to_pylist() == [i for i in range(0, 100, 14)]
+    result = filter_rows(table, parse("a >= 10 and True"))
+    assert result.num_rows == n - 10
+
+
+def test_filter_whole_column_conjuncts_see_every_row():
+    table = pa.table({"x": list(range(1, 101))})
+    result = filter_rows(table, parse("x > 80 and x > mean(x)"))
+    assert result["x"].to_pylist() == list(range(81, 101))
+    result = filter_rows(table, parse("x <= 10 and x >= max(x) - 95"))
+    assert result["x"].to_pylist() == list(range(5, 11))
@@ -1,7 +1,8 @@
 import pyarrow as pa
 import pytest
 
-from barrow.operations import join
+from barrow.errors import BarrowError
+from barrow.operations import join, join_batches
 
 
 def test_inner_join() -> None:
@@ -44,3 +45,54 @@ def test_suffixes() -> None:
     assert result.column_names == ["id", "val", "val_right"]
     assert result["val"].to_pylist() == [10]
     assert result["val_right"].to_pylist() == [20]
+
+
+def test_multi_key_and_short_join_types() -> None:
+    left = pa.table({"id": [1, 1, 2], "day": [1, 2, 1], "val": [10, 11, 20]})
+    right = pa.table({"id": [1, 2], "day": [2, 2], "other": ["a", "b"]})
+    result = join(left, right, ["id", "day"], ["id", "day"], "left")
+    assert result.sort_by("val").to_pydict() == {
+        "id": [1, 1, 2],
+        "day": [1, 2, 1],
+        "val": [10, 11, 20],
+        "other": [None, "a", None],
+    }
+    semi = join(left, right, ["id", "day"], ["id", "day"], "semi")
+    assert semi.to_pydict() == {"id": [1], "day": [2], "val": [11]}
+    anti = join(left, right, ["id", "day"], ["id", "day"], "anti")
+    assert anti.sort_by("val")["val"].to_pylist() == [10, 20]
+    with pytest.raises(BarrowError):
+        join(left, right, ["id", "day"], ["id"])
+    with pytest.raises(BarrowError):
+        join(left, right, "id", "id", "sideways")
+
+
+@pytest.mark.parametrize(
+    "join_type, build_side",
+    [
+        ("inner", "right"),
+        ("inner", "left"),
+        ("left", "right"),
+        ("semi", "right"),
+        ("anti", "right"),
+    ],
+)
+def test_join_batches_matches_join(join_type, build_side) -> None:
+    left = pa.table({"id": [1, 2, 3, 4] * 3, "val": list(range(12))})
+    right = pa.table({"key": [2, 3, 3, 5], "val": [20, 30, 31, 50]})
+    expected = join(left, right, "id", "key", join_type)
+    if build_side == "left":
+        probe, build = right.to_reader(max_chunksize=1), left
+    else:
+        probe, build = left.to_reader(max_chunksize=5), right
+    reader = join_batches(probe, build, "id", "key", join_type, build_side)
+    result = reader.read_all()
+    assert result.column_names == expected.column_names
+    keys = [(c, "ascending") for c in expected.column_names]
+    assert result.sort_by(keys).to_pylist() == expected.sort_by(keys).to_pylist()
+
+
+def test_join_batches_rejects_unstreamable_joins() -> None:
+    table = pa.table({"id": [1]})
+    with pytest.raises(BarrowError):
+        join_batches(table.to_reader(), table, "id", "id", "outer")
@@ -1,5 +1,6 @@
 import logging
 import numpy as np
+import pyarrow as pa
 import pytest
 
 from barrow.expr import parse
@@ -36,3 +37,15 @@ def test_mutate_unknown_function(sample_table, caplog):
         with pytest.raises(NameError):
             mutate(sample_table, d=expr)
     assert "Evaluating expression for column 'd'" in caplog.text
+
+
+def test_mutate_preserves_nulls_and_strings():
+    table = pa.table({"a": [1, None, 3], "s": ["x", None, "z"]})
+    result = mutate(table, half=parse("a / 2"), t=parse('s + "_"'))
+    assert result["half"].to_pylist() == [0.5, None, 1.5]
+    assert result["t"].to_pylist() == ["x_", None, "z_"]
+
+
+def test_mutate_uses_earlier_assignments(sample_table):
+    result = mutate(sample_table, c=parse("a * 2"), d=parse("c + 1"))
+    assert result["d"].to_pylist() == [3, 5, 7]
@@ -1,7 +1,7 @@
 """Tests for the sort operation."""
 
 import pyarrow as pa
-from barrow.operations import sort
+from barrow.operations import sort, top_k
 
 
 def test_sort_ascending(sample_table):
@@ -30,3 +30,15 @@ def test_sort_preserves_all_rows(sample_table):
     result = sort(sample_table, ["a"])
     assert result.num_rows == sample_table.num_rows
     assert set(result.column_names) == set(sample_table.column_names)
+
+
+def test_top_k_matches_sort_then_slice():
+    table = pa.table({"x": [3, 1, 2, 1, 3, None, 2], "y": list(range(7))})
+    for desc in ([False], [True]):
+        expected = sort(table, ["x"], desc).slice(0, 4)
+        assert top_k(table, 4, ["x"], desc).equals(expected)
+
+
+def test_top_k_larger_than_table(sample_table):
+    result = top_k(sample_table, 10, ["a"], [True])
+    assert result["a"].to_pylist() == [3, 2, 1]
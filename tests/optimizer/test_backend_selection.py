@@ -1,5 +1,8 @@
 """Tests for the backend selection optimizer rule."""
 
+import pyarrow as pa
+import pyarrow.parquet as pq
+
 from barrow.core.nodes import (
     Aggregate,
     Project,
@@ -10,6 +13,7 @@ from barrow.core.nodes import (
     Window,
 )
 from barrow.expr import parse
+from barrow.optimizer import CostModel, OperatorCost
 from barrow.optimizer.rules.backend_selection import select_backends
 
 
@@ -112,3 +116,42 @@ def test_nested_window_in_sink():
     result = select_backends(sink)
     assert isinstance(result, Sink)
     assert isinstance(result.child, SqlQuery)
+
+
+def _parquet(path, rows):
+    table = pa.table({"grp": [i % 7 for i in range(rows)], "ts": list(range(rows))})
+    pq.write_table(table, path)
+    return str(path)
+
+
+def _window(child):
+    return Window(
+        child=child,
+        by=["grp"],
+        order_by=["ts"],
+        assignments={"rn": parse("row_number()")},
+    )
+
+
+def test_small_known_inputs_stay_arrow(tmp_path):
+    """Inputs too small to amortize DuckDB's overhead keep the Arrow backend."""
+    scan = Scan(path=_parquet(tmp_path / "small.parquet", 100))
+    assert isinstance(select_backends(_window(scan)), Window)
+    aggregate = Aggregate(child=scan, group_keys=["grp"], aggregations={"ts": "sum"})
+    assert isinstance(select_backends(aggregate), Aggregate)
+
+
+def test_large_known_inputs_use_cheapest_backend(tmp_path):
+    scan = Scan(path=_parquet(tmp_path / "large.parquet", 50_000))
+    assert isinstance(select_backends(_window(scan)), SqlQuery)
+
+
+def test_custom_cost_model(tmp_path):
+    """A cost model that makes DuckDB free moves known-size nodes to SQL."""
+    scan = Scan(path=_parquet(tmp_path / "small.parquet", 100))
+    costs = {
+        ("Window", "arrow"): OperatorCost(1.0, 0.0),
+        ("Window", "duckdb"): OperatorCost(0.0, 0.0),
+    }
+    assert isinstance(select_backends(_window(scan), CostModel(costs)), SqlQuery)
+    assert isinstance(select_backends(_window(scan), CostModel({})), Window)
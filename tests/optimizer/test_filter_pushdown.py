@@ -1,6 +1,10 @@
 """Tests for filter pushdown optimizer rule."""
 
-from barrow.core.nodes import Scan, Sort, Filter
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from barrow.core.nodes import Scan, Sort, Filter, Join, Mutate, Project, Window
+from barrow.execution import execute
 from barrow.optimizer.rules.filter_pushdown import push_filters_down
 from barrow.expr import parse
 
@@ -22,3 +26,100 @@ def test_no_pushdown_without_sort():
     result = push_filters_down(filt)
     assert isinstance(result, Filter)
     assert isinstance(result.child, Scan)
+
+
+def test_filter_predicate_pushed_into_scan():
+    scan = Scan(path="data.parquet")
+    filt = Filter(child=scan, expression=parse("a > 1"))
+    result = push_filters_down(filt)
+    # The Filter stays; the scan only uses the predicate to skip data
+    assert isinstance(result, Filter)
+    assert result.child.predicate == parse("a > 1")
+    assert push_filters_down(result) == result
+
+
+def test_only_prunable_conjuncts_pushed_into_scan():
+    scan = Scan(path="data.parquet")
+    filt = Filter(child=scan, expression=parse("a != 1 and b <= 2 and sqrt(c) > 1"))
+    result = push_filters_down(filt)
+    assert result.child.predicate == parse("b <= 2")
+
+
+def test_membership_and_like_pushed_into_scan():
+    scan = Scan(path="data.parquet")
+    expression = parse('a in [1, 2] and s like "x%" and b in c')
+    result = push_filters_down(Filter(child=scan, expression=expression))
+    assert result.child.predicate == parse('a in [1, 2] and s like "x%"')
+
+
+def test_filter_pushed_past_sort_into_scan():
+    scan = Scan(path="data.parquet")
+    sort = Sort(child=scan, keys=["a"])
+    filt = Filter(child=sort, expression=parse("a > 1"))
+    result = push_filters_down(filt)
+    assert result.child.child.predicate == parse("a > 1")
+
+
+def test_conjuncts_split_around_mutate():
+    scan = Scan()
+    mutate = Mutate(child=scan, assignments={"c": parse("a * 2")})
+    filt = Filter(child=mutate, expression=parse("c > 2 and b < 6"))
+    result = push_filters_down(filt)
+    assert result.expression == parse("c > 2")
+    assert result.child.child.expression == parse("b < 6")
+    assert result.child.child.child.predicate == parse("b < 6")
+
+
+def test_filter_pushed_below_project_and_window_partition_keys():
+    scan = Scan()
+    window = Window(child=scan, by=["grp"], assignments={"n": parse("a + 1")})
+    proj = Project(child=window, columns=["grp", "n"])
+    filt = Filter(child=proj, expression=parse('grp == "x" and n == 1'))
+    result = push_filters_down(filt)
+    assert isinstance(result, Project)
+    assert result.child.expression == parse("n == 1")
+    assert result.child.child.child.expression == parse('grp == "x"')
+
+
+def test_filter_pushed_into_join_sides(tmp_path):
+    left_path = tmp_path / "left.parquet"
+    right_path = tmp_path / "right.parquet"
+    pq.write_table(pa.table({"id": [1, 2, 3], "a": [10, 20, 30]}), left_path)
+    pq.write_table(pa.table({"id": [1, 2, 3], "b": [7, 8, 9]}), right_path)
+    join = Join(
+        left=Scan(path=str(left_path)),
+        right=Scan(path=str(right_path)),
+        left_on=["id"],
+        right_on=["id"],
+    )
+    filt = Filter(child=join, expression=parse("a > 10 and b < 9 and id >= 2"))
+    result = push_filters_down(filt)
+    assert isinstance(result, Join)
+    assert result.left.expression == parse("a > 10 and id >= 2")
+    assert result.right.expression == parse("b < 9 and id >= 2")
+    assert execute(result).table.to_pydict() == {"id": [2], "a": [20], "b": [8]}
+
+
+def test_whole_column_filters_stay_in_place(tmp_path):
+    left_path = tmp_path / "left.parquet"
+    right_path = tmp_path / "right.parquet"
+    pq.write_table(pa.table({"id": [1, 2, 3], "a": [10, 20, 30]}), left_path)
+    pq.write_table(pa.table({"id": [1, 2], "b": [7, 8]}), right_path)
+    join = Join(
+        left=Scan(path=str(left_path)),
+        right=Scan(path=str(right_path)),
+        left_on=["id"],
+        right_on=["id"],
+    )
+    filt = Filter(child=join, expression=parse("a > 10 and a >= mean(a)"))
+    result = push_filters_down(filt)
+    assert result == filt
+    # The mean is taken over the joined rows (10 and 20), not the left input.
+    assert execute(result).table["a"].to_pylist() == [20]
+
+    sort = Sort(child=Scan(path=str(left_path)), keys=["a"], descending=True)
+    filt = Filter(child=sort, expression=parse("cumsum(a) < 40"))
+    assert push_filters_down(filt) == filt
+    mutate = Mutate(child=Scan(), assignments={"c": parse("a * 2")})
+    filt = Filter(child=mutate, expression=parse("b > mean(b)"))
+    assert push_filters_down(filt) == filt
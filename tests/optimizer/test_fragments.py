@@ -0,0 +1,162 @@
+"""Tests for compiling plan fragments into single DuckDB queries."""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from barrow.core.nodes import (
+    Aggregate,
+    Filter,
+    Join,
+    LogicalNode,
+    Mutate,
+    Project,
+    Scan,
+    Sort,
+    SqlQuery,
+    Window,
+)
+from barrow.execution import execute
+from barrow.expr import parse
+from barrow.optimizer import CostModel, OperatorCost
+from barrow.optimizer.rules.backend_selection import select_backends
+from barrow.optimizer.rules.fragments import expression_to_sql
+
+# Window functions always run on DuckDB, everything else on Arrow.
+_DUCKDB_WINDOWS = CostModel(
+    {
+        ("Window", "arrow"): OperatorCost(1.0, 0.0),
+        ("Window", "duckdb"): OperatorCost(0.0, 0.0),
+    }
+)
+
+
+@pytest.fixture
+def paths(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 2_000
+    left = pa.table(
+        {
+            "g": rng.integers(0, 20, n),
+            "ts": np.arange(n),
+            "x": rng.random(n),
+            "s": [f"it's {i % 3}" for i in range(n)],
+        }
+    )
+    right = pa.table(
+        {
+            "g": np.arange(0, 30, 2),
+            "x": np.arange(15) / 2,
+            "name": list("abcdefghijklmno"),
+        }
+    )
+    pq.write_table(left, tmp_path / "left.parquet")
+    pq.write_table(right, tmp_path / "right.parquet")
+    return str(tmp_path / "left.parquet"), str(tmp_path / "right.parquet")
+
+
+def _window(child):
+    return Window(
+        child=child,
+        by=["g"],
+        order_by=["ts"],
+        assignments={"rn": parse("row_number()")},
+    )
+
+
+def _assert_same_result(plan, optimized):
+    expected = execute(plan).table
+    result = execute(optimized).table
+    assert result.column_names == expected.column_names
+    keys = [(c, "ascending") for c in expected.column_names]
+    assert result.cast(expected.schema).sort_by(keys).equals(expected.sort_by(keys))
+
+
+def test_fragment_reads_parquet_and_runs_as_one_query(paths):
+    left, _ = paths
+    plan = Filter(
+        child=_window(
+            Mutate(
+                child=Filter(child=Scan(path=left), expression=parse('s != "it\'s 1"')),
+                assignments={"y": parse("x * 2"), "x": parse("y + 1")},
+            )
+        ),
+        expression=parse("rn <= 5"),
+    )
+    result = select_backends(plan, _DUCKDB_WINDOWS)
+    assert isinstance(result, SqlQuery)
+    assert type(result.child) is LogicalNode
+    assert "read_parquet" in result.query
+    _assert_same_result(plan, result)
+
+
+@pytest.mark.parametrize("join_type", ["inner", "left", "outer", "semi", "anti"])
+def test_fragment_compiles_joins(paths, join_type):
+    left, right = paths
+    plan = _window(
+        Join(
+            left=Scan(path=left),
+            right=Project(child=Scan(path=right), columns=["g", "x", "name"]),
+            left_on=["g"],
+            right_on=["g"],
+            join_type=join_type,
+        )
+    )
+    result = select_backends(plan, _DUCKDB_WINDOWS)
+    assert isinstance(result, SqlQuery)
+    assert type(result.child) is LogicalNode
+    _assert_same_result(plan, result)
+
+
+def test_fragment_stops_at_sort_and_untranslatable_expressions(paths):
+    left, _ = paths
+    scan = Scan(path=left)
+    modulo = Filter(child=scan, expression=parse("ts % 2 == 0"))
+    plan = Sort(
+        child=_window(Filter(child=modulo, expression=parse("x > 0.5"))),
+        keys=["g", "ts"],
+    )
+    result = select_backends(plan, _DUCKDB_WINDOWS)
+    assert isinstance(result, Sort)
+    fragment = result.child
+    assert isinstance(fragment, SqlQuery)
+    assert fragment.child == modulo
+    assert "FROM tbl WHERE" in fragment.query
+    _assert_same_result(plan, result)
+
+
+def test_fragment_wraps_sql_queries(paths):
+    left, _ = paths
+    plan = Aggregate(
+        child=SqlQuery(
+            child=Filter(child=Scan(path=left), expression=parse("x < 0.5")),
+            query="WITH t AS (SELECT g, x FROM tbl) SELECT * FROM t;",
+        ),
+        group_keys=["g"],
+        aggregations={"x": "max"},
+    )
+    result = select_backends(plan, CostModel({}))
+    assert isinstance(result, SqlQuery)
+    assert result.query.count("read_parquet") == 1
+    _assert_same_result(plan, result)
+
+
+def test_fragment_without_seed_stays_arrow(paths):
+    left, _ = paths
+    plan = Filter(child=Scan(path=left), expression=parse("x > 0.5"))
+    assert select_backends(plan, _DUCKDB_WINDOWS) == plan
+
+
+def test_expression_to_sql_checks_semantics():
+    columns = ["a", "b"]
+    assert expression_to_sql(parse("a / 2 > b and not b == 'x'"), columns) == (
+        '((("a" / 2) > "b") AND NOT (("b" = \'x\')))'
+    )
+    assert expression_to_sql(parse('a == "it\'s"'), columns) == "(\"a\" = 'it''s')"
+    assert expression_to_sql(parse("a % 2"), columns) is None
+    assert expression_to_sql(parse("a ** 2"), columns) is None
+    assert expression_to_sql(parse("a * pi"), columns) is None
+    assert expression_to_sql(parse("a * pi"), None) is None
+    assert expression_to_sql(parse("c + 1"), columns) is None
+    assert expression_to_sql(parse("c + 1"), None) == '("c" + 1)'
@@ -1,6 +1,6 @@
 """Tests for the fusion optimizer rule."""
 
-from barrow.core.nodes import Scan, Mutate, Project
+from barrow.core.nodes import Scan, Mutate, Project, Limit, Sort, TopK
 from barrow.optimizer.rules.fusion import fuse
 from barrow.expr import parse
 
@@ -32,3 +32,26 @@ def test_no_fusion_needed():
     result = fuse(proj)
     assert isinstance(result, Project)
     assert isinstance(result.child, Scan)
+
+
+def test_fuse_limit_sort_into_top_k():
+    scan = Scan()
+    sort = Sort(child=scan, keys=["a"], descending=[True])
+    result = fuse(Limit(child=Limit(child=sort, n=5), n=3))
+    assert result == TopK(child=scan, keys=["a"], descending=[True], n=3)
+
+
+def test_fused_mutate_shares_subexpressions(sample_parquet):
+    scan = Scan(path=sample_parquet, format="parquet")
+    m1 = Mutate(child=scan, assignments={"c": parse("a * b")})
+    m2 = Mutate(child=m1, assignments={"d": parse("a * b * 1 + (2 - 1)")})
+    result = fuse(m2)
+    assert result.assignments == {"c": parse("a * b"), "d": parse("c + 1")}
+
+
+def test_mutates_reassigning_a_column_stay_apart():
+    scan = Scan()
+    m1 = Mutate(child=scan, assignments={"c": parse("a + 1"), "d": parse("b")})
+    m2 = Mutate(child=m1, assignments={"c": parse("d * 2")})
+    result = fuse(m2)
+    assert isinstance(result.child, Mutate)
@@ -0,0 +1,43 @@
+"""Tests for the join side selection rule."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from barrow.core.nodes import Filter, Join, Scan
+from barrow.expr import parse
+from barrow.optimizer.rules.join_selection import choose_build_sides
+
+
+def _write(path, rows):
+    pq.write_table(pa.table({"id": list(range(rows))}), path)
+    return str(path)
+
+
+def test_builds_the_smaller_side(tmp_path):
+    small = _write(tmp_path / "small.parquet", 10)
+    large = _write(tmp_path / "large.parquet", 100_000)
+    join = Join(
+        left=Filter(child=Scan(path=small), expression=parse("id > 1")),
+        right=Scan(path=large),
+        left_on=["id"],
+        right_on=["id"],
+    )
+    assert choose_build_sides(join).build_side == "left"
+    swapped = Join(left=Scan(path=large), right=Scan(path=small), left_on=["id"])
+    assert choose_build_sides(swapped).build_side is None
+
+
+def test_stdin_and_outer_joins_keep_the_right_build_side(tmp_path):
+    small = _write(tmp_path / "small.parquet", 10)
+    join = Join(left=Scan(path=small), right=Scan(), left_on=["id"], right_on=["id"])
+    assert choose_build_sides(join).build_side == "left"
+    stdin = Join(left=Scan(), right=Scan(path=small), left_on=["id"], right_on=["id"])
+    assert choose_build_sides(stdin).build_side is None
+    outer = Join(
+        left=Scan(path=small),
+        right=Scan(),
+        left_on=["id"],
+        right_on=["id"],
+        join_type="left",
+    )
+    assert choose_build_sides(outer).build_side is None
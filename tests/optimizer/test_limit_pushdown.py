@@ -0,0 +1,29 @@
+"""Tests for the limit pushdown optimizer rule."""
+
+from barrow.core.nodes import Filter, Limit, Mutate, Project, Scan, Sink, View
+from barrow.expr import parse
+from barrow.optimizer.rules.limit_pushdown import push_limits_down
+
+
+def test_limit_reaches_scan_through_row_preserving_nodes():
+    scan = Scan(path="data.parquet")
+    mutate = Mutate(child=scan, assignments={"b": parse("a + 1")})
+    plan = Sink(
+        child=View(child=Limit(child=Project(child=mutate, columns=["b"]), n=5))
+    )
+    result = push_limits_down(plan)
+    limit = result.child.child
+    assert isinstance(limit, Limit) and limit.n == 5
+    assert limit.child.child.child.limit == 5
+
+
+def test_nested_limits_keep_the_smallest():
+    plan = Limit(child=Limit(child=Scan(), n=3), n=10)
+    result = push_limits_down(plan)
+    assert result.child.child.limit == 3
+
+
+def test_limit_stops_at_filter():
+    plan = Limit(child=Filter(child=Scan(), expression=parse("a > 1")), n=5)
+    result = push_limits_down(plan)
+    assert result.child.child.limit is None
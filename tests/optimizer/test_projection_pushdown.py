@@ -1,6 +1,18 @@
 """Tests for projection pushdown optimizer rule."""
 
-from barrow.core.nodes import Scan, Project
+from barrow.core.nodes import (
+    Aggregate,
+    Filter,
+    GroupBy,
+    Join,
+    Mutate,
+    Project,
+    Scan,
+    Sink,
+    Sort,
+    SqlQuery,
+)
+from barrow.expr import parse
 from barrow.optimizer.rules.projection_pushdown import push_projections_down
 
 
@@ -20,3 +32,40 @@ def test_no_pushdown_when_scan_has_columns():
     result = push_projections_down(proj)
     # No change — scan already has columns
     assert result.child.columns == ["a", "b", "c"]
+
+
+def test_push_projection_through_filter_into_scan():
+    scan = Scan(path="data.parquet")
+    filt = Filter(child=scan, expression=parse('region == "EU"'))
+    proj = Project(child=filt, columns=["a", "b"])
+    result = push_projections_down(proj)
+    assert result.child.child.columns == ["a", "b", "region"]
+
+
+def test_push_aggregate_inputs_through_mutate_and_sort():
+    scan = Scan(path="data.parquet")
+    mutate = Mutate(child=scan, assignments={"c": parse("a * 2"), "d": parse("c + b")})
+    sort = Sort(child=mutate, keys=["k"])
+    agg = Aggregate(child=GroupBy(child=sort, keys=["g"]), aggregations={"d": "sum"})
+    result = push_projections_down(Sink(child=agg))
+    assert result.child.child.child.child.child.columns == ["g", "k", "a", "b"]
+
+
+def test_push_projection_into_both_join_sides():
+    left = Scan(path="left.parquet")
+    right = Scan(path="right.parquet")
+    join = Join(left=left, right=right, left_on=["id"], right_on=["key"])
+    result = push_projections_down(Project(child=join, columns=["a", "b_right"]))
+    assert result.child.left.columns == ["a", "b", "b_right", "id"]
+    assert result.child.right.columns == ["a", "b", "b_right", "key"]
+
+
+def test_no_pushdown_below_sql_or_without_projection():
+    scan = Scan(path="data.parquet")
+    sql = SqlQuery(child=scan, query="SELECT a FROM tbl")
+    result = push_projections_down(Project(child=sql, columns=["a"]))
+    assert result.child.child.columns is None
+    result = push_projections_down(
+        Sink(child=Filter(child=scan, expression=parse("a > 1")))
+    )
+    assert result.child.child.columns is None
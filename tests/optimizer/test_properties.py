@@ -0,0 +1,76 @@
+"""Tests for property derivation."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from barrow.core.nodes import Aggregate, Filter, Join, Limit, Project, Scan, SqlQuery
+from barrow.expr import parse
+from barrow.optimizer import derive_properties
+
+
+def _write(path, rows):
+    table = pa.table({"id": list(range(rows)), "name": ["abcdefgh"] * rows})
+    pq.write_table(table, path)
+    return str(path)
+
+
+def test_scan_reads_parquet_metadata(tmp_path):
+    path = _write(tmp_path / "t.parquet", 1000)
+    props = derive_properties(Scan(path=path))
+    assert props.estimated_rows == 1000
+    assert props.columns == ["id", "name"]
+    narrow = derive_properties(Scan(path=path, columns=["id"]))
+    assert narrow.columns == ["id"]
+    assert 0 < narrow.estimated_bytes < props.estimated_bytes
+    assert derive_properties(Scan(path=path, limit=10)).estimated_rows == 10
+
+
+def test_unknown_inputs_propagate_none(tmp_path):
+    assert (
+        derive_properties(
+            Filter(child=Scan(), expression=parse("a > 1"))
+        ).estimated_rows
+        is None
+    )
+    path = _write(tmp_path / "t.parquet", 1000)
+    sql = SqlQuery(child=Scan(path=path), query="SELECT * FROM tbl")
+    assert derive_properties(sql).estimated_rows is None
+
+
+def test_operators_scale_estimates(tmp_path):
+    scan = Scan(path=_write(tmp_path / "t.parquet", 1000))
+    assert (
+        derive_properties(
+            Filter(child=scan, expression=parse("id == 1"))
+        ).estimated_rows
+        == 100
+    )
+    both = Filter(child=scan, expression=parse("id > 1 and not id == 5"))
+    assert derive_properties(both).estimated_rows == 300
+    assert derive_properties(Limit(child=scan, n=5)).estimated_rows == 5
+    project = derive_properties(Project(child=scan, columns=["id"]))
+    assert project.columns == ["id"]
+    aggregate = derive_properties(
+        Aggregate(child=scan, group_keys=["name"], aggregations={"id": "sum"})
+    )
+    assert aggregate.estimated_rows == 100
+    assert aggregate.columns == ["name", "id_sum"]
+
+
+def test_join_estimates(tmp_path):
+    left = Scan(path=_write(tmp_path / "l.parquet", 1000))
+    right = Scan(path=_write(tmp_path / "r.parquet", 10))
+    inner = derive_properties(
+        Join(left=left, right=right, left_on=["id"], right_on=["id"])
+    )
+    assert inner.estimated_rows == 1000
+    assert inner.columns == ["id", "name", "name"]
+    semi = derive_properties(
+        Join(left=left, right=right, left_on=["id"], right_on=["id"], join_type="semi")
+    )
+    assert semi.estimated_rows == 500
+    assert semi.columns == ["id", "name"]
+    outer = Join(
+        left=left, right=Scan(), left_on=["id"], right_on=["id"], join_type="outer"
+    )
+    assert derive_properties(outer).estimated_rows is None
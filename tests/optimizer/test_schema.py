@@ -0,0 +1,112 @@
+"""Tests for schema derivation and plan validation."""
+
+import pyarrow as pa
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
+import pytest
+
+from barrow.core.nodes import (
+    Aggregate,
+    Filter,
+    GroupBy,
+    Join,
+    Mutate,
+    Project,
+    Scan,
+    Sort,
+    SqlQuery,
+    Window,
+)
+from barrow.errors import PlanningError
+from barrow.execution import execute
+from barrow.expr import parse
+from barrow.optimizer import derive_schema, validate_plan
+
+
+@pytest.fixture
+def source(tmp_path):
+    table = pa.table({"id": pa.array([1, 2, 3], pa.int32()), "grp": ["x", "y", "x"]})
+    path = tmp_path / "t.parquet"
+    pq.write_table(table, path)
+    return str(path)
+
+
+def _fields(schema):
+    return [(f.name, f.type) for f in schema]
+
+
+def test_scan_schema_comes_from_metadata(source, tmp_path):
+    assert _fields(derive_schema(Scan(path=source))) == [
+        ("id", pa.int32()),
+        ("grp", pa.string()),
+    ]
+    path = tmp_path / "t.csv"
+    csv.write_csv(pa.table({"a": [1.5], "b": ["x"]}), path)
+    schema = derive_schema(Project(child=Scan(path=str(path)), columns=["b"]))
+    assert _fields(schema) == [("b", pa.string())]
+
+
+def test_derived_schemas_match_execution(source, tmp_path):
+    right = tmp_path / "r.parquet"
+    pq.write_table(pa.table({"grp": ["x"], "w": [1.0]}), right)
+    scan = Scan(path=source)
+    plans = [
+        Mutate(
+            child=scan,
+            assignments={
+                "d": parse("id / 2"),
+                "id": parse("id * 2"),
+                "e": parse("grp + grp"),
+            },
+        ),
+        Aggregate(child=GroupBy(child=scan, keys=["grp"]), aggregations={"id": "sum"}),
+        Join(
+            left=scan,
+            right=Scan(path=str(right)),
+            left_on=["grp"],
+            right_on=["grp"],
+            join_type="left",
+        ),
+    ]
+    for plan in plans:
+        assert _fields(derive_schema(plan)) == _fields(execute(plan).table.schema)
+
+
+def test_unknown_inputs_propagate_none(source):
+    assert derive_schema(Filter(child=Scan(), expression=parse("a > 1"))) is None
+    sql = SqlQuery(child=Scan(path=source), query="SELECT * FROM tbl")
+    assert derive_schema(Mutate(child=sql, assignments={"b": parse("a")})) is None
+
+
+@pytest.mark.parametrize(
+    "make_plan, message",
+    [
+        (lambda s: Project(child=s, columns=["id", "nope"]), "nope"),
+        (lambda s: Sort(child=s, keys=["nope"]), "nope"),
+        (lambda s: Filter(child=s, expression=parse("nope > 1")), "nope"),
+        (lambda s: Mutate(child=s, assignments={"c": parse("grp - 1")}), "'-'"),
+        (
+            lambda s: Aggregate(
+                child=s, group_keys=["grp"], aggregations={"id": "nope"}
+            ),
+            "nope",
+        ),
+    ],
+)
+def test_invalid_plans_are_rejected(source, make_plan, message):
+    with pytest.raises(PlanningError, match=message):
+        validate_plan(make_plan(Scan(path=source)))
+
+
+def test_errors_are_prefixed_once(source):
+    plan = Aggregate(child=Scan(path=source), group_keys=[], aggregations={"id": "sum"})
+    with pytest.raises(PlanningError) as info:
+        validate_plan(plan)
+    assert str(info.value) == "summary requires grouping metadata"
+
+
+def test_unknown_window_function_is_a_planning_error(source):
+    plan = Window(child=Scan(path=source), assignments={"y": parse("nosuch(id)")})
+    with pytest.raises(PlanningError) as info:
+        validate_plan(plan)
+    assert str(info.value) == "window: name 'nosuch' is not defined"
@@ -1,6 +1,7 @@
 """Tests for the simplify optimizer rule."""
 
-from barrow.core.nodes import Scan, Project
+from barrow.core.nodes import Filter, Scan, Project
+from barrow.expr import parse
 from barrow.optimizer.rules.simplify import simplify
 
 
@@ -10,3 +11,10 @@ def test_simplify_passthrough():
     result = simplify(proj)
     assert isinstance(result, Project)
     assert isinstance(result.child, Scan)
+
+
+def test_simplify_filter_conditions():
+    scan = Scan(path="data.csv")
+    node = Filter(child=scan, expression=parse("a > 5 and not not (a > 3)"))
+    result = simplify(node)
+    assert result.expression == parse("a > 5")
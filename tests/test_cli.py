@@ -10,13 +10,14 @@ import pytest
 
 from barrow.cli import main
 from barrow.errors import InvalidExpressionError
+from barrow.execution import set_memory_limit
 
 
 def test_cli_returns_error_on_exception(monkeypatch, capsys) -> None:
-    def fake_read_table(path, fmt, delimiter=None):
+    def fake_read_batches(path, fmt, delimiter=None, **kwargs):
         raise InvalidExpressionError("bad format")
 
-    monkeypatch.setattr("barrow.io.read_table", fake_read_table)
+    monkeypatch.setattr("barrow.io.read_batches", fake_read_batches)
 
     rc = main(["filter", "a > 1", "--input", "in.csv", "--output", "out.parquet"])
     assert rc == 1
@@ -244,3 +245,215 @@ def test_ungroup_removes_metadata(sample_csv, tmp_path) -> None:
     assert p2.returncode == 0
     table = pq.read_table(dst)
     assert (table.schema.metadata or {}).get(b"grouped_by") is None
+
+
+def test_pipe_runs_stages_in_one_plan(sample_csv, tmp_path) -> None:
+    dst = tmp_path / "out.csv"
+    rc = main(
+        [
+            "pipe",
+            "filter 'a > 1' | mutate 'c=a*2' | groupby grp | summary c=sum",
+            "--input",
+            sample_csv,
+            "--output",
+            str(dst),
+        ]
+    )
+    assert rc == 0
+    table = csv.read_csv(dst, read_options=csv.ReadOptions(skip_rows=1))
+    assert table.sort_by("grp").to_pydict() == {"grp": ["x", "y"], "c_sum": [4, 6]}
+
+
+def test_pipe_rejects_stage_io_options(sample_csv, capsys) -> None:
+    rc = main(["pipe", "filter 'a > 1' --output x.csv", "--input", sample_csv])
+    assert rc == 1
+    assert "cannot set --output" in capsys.readouterr().err
+
+
+def test_explain_annotates_estimates(tmp_path, capsys) -> None:
+    src = tmp_path / "in.parquet"
+    pq.write_table(pa.table({"a": [1, 2, 3]}), src)
+    rc = main(["explain", "filter", "a > 1", "--input", str(src)])
+    assert rc == 0
+    out = capsys.readouterr().out
+    assert "Filter(" in out and "backend=arrow" in out
+    assert "rows≈3" in out
+
+
+def test_explain_analyze_annotates_plan(sample_csv, capsys) -> None:
+    rc = main(["explain", "--analyze", "filter", "a > 1", "--input", sample_csv])
+    assert rc == 0
+    out = capsys.readouterr().out
+    assert "Optimized Plan (analyzed):" in out
+    assert "Filter(" in out and "backend=arrow" in out
+    assert "rows_in=3 rows_out=2" in out
+    assert "peak_mem=" in out
+
+
+def test_head_sort_by_keeps_top_rows(sample_csv, tmp_path) -> None:
+    dst = tmp_path / "out.csv"
+    rc = main(
+        ["head", "2", "--sort-by", "a", "--desc", "-i", sample_csv, "-o", str(dst)]
+    )
+    assert rc == 0
+    assert csv.read_csv(dst)["a"].to_pylist() == [3, 2]
+
+
+def test_partition_by_writes_hive_directories(sample_csv, tmp_path) -> None:
+    dst = tmp_path / "out"
+    rc = main(
+        ["select", "a,grp", "-i", sample_csv, "-o", str(dst), "--partition-by", "grp"]
+    )
+    assert rc == 0
+    assert sorted(p.name for p in dst.iterdir()) == ["grp=x", "grp=y"]
+    table = csv.read_csv(dst / "grp=x" / "part-0.csv")
+    assert table.to_pydict() == {"a": [1, 2]}
+
+
+def test_cli_parquet_write_options(sample_csv, tmp_path) -> None:
+    dst = tmp_path / "out.parquet"
+    rc = main(
+        [
+            "select",
+            "a,b",
+            "-i",
+            sample_csv,
+            "-o",
+            str(dst),
+            "--parquet",
+            "--compression",
+            "zstd",
+            "--row-group-size",
+            "2",
+            "--no-statistics",
+        ]
+    )
+    assert rc == 0
+    metadata = pq.ParquetFile(dst).metadata
+    assert metadata.num_row_groups == 2
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    assert not metadata.row_group(0).column(0).is_stats_set
+
+
+def test_cli_unknown_sorting_column_keeps_output(sample_csv, tmp_path, capsys) -> None:
+    dst = tmp_path / "out.parquet"
+    dst.write_bytes(b"previous")
+    argv = ["select", "a", "-i", sample_csv, "-o", str(dst), "--parquet"]
+    assert main([*argv, "--sorting-columns", "zz"]) == 1
+    assert "Unknown sorting column 'zz'" in capsys.readouterr().err
+    assert dst.read_bytes() == b"previous"
+
+
+def test_join_cli_multi_key_join_types(tmp_path) -> None:
+    left = pa.table({"id": [1, 1, 2], "day": [1, 2, 1], "val": [10, 11, 20]})
+    right = pa.table({"uid": [1, 2], "day": [2, 2], "other": ["a", "b"]})
+    left_path = tmp_path / "left.parquet"
+    right_path = tmp_path / "right.parquet"
+    pq.write_table(left, left_path)
+    pq.write_table(right, right_path)
+
+    def run(join_type):
+        out_path = tmp_path / f"{join_type}.parquet"
+        rc = main(
+            [
+                "join",
+                "id,day",
+                "uid,day",
+                "-i",
+                str(left_path),
+                "--right",
+                str(right_path),
+                "--join-type",
+                join_type,
+                "-o",
+                str(out_path),
+            ]
+        )
+        assert rc == 0
+        return pq.read_table(out_path).sort_by("val")
+
+    assert run("left")["other"].to_pylist() == [None, "a", None]
+    assert run("semi")["val"].to_pylist() == [11]
+    assert run("anti")["val"].to_pylist() == [10, 20]
+
+
+def test_cli_memory_limit_spills_sort(tmp_path) -> None:
+    table = pa.table({"a": list(range(50_000, 0, -1)), "b": ["x"] * 50_000})
+    src = tmp_path / "in.parquet"
+    dst = tmp_path / "out.parquet"
+    pq.write_table(table, src, row_group_size=5_000)
+    try:
+        rc = main(
+            ["sort", "a", "--memory-limit", "64K", "-i", str(src), "-o", str(dst)]
+        )
+    finally:
+        set_memory_limit(None)
+    assert rc == 0
+    assert pq.read_table(dst)["a"].to_pylist() == list(range(1, 50_001))
+    with pytest.raises(SystemExit):
+        main(["sort", "a", "--memory-limit", "lots", "-i", str(src)])
+
+
+def test_invalid_plan_fails_before_reading(sample_parquet, capsys) -> None:
+    rc = main(["mutate", "c=grp - 1", "-i", sample_parquet])
+    assert rc == 1
+    assert "not defined for string" in capsys.readouterr().err
+
+
+def test_cli_whole_column_functions_span_row_groups(tmp_path) -> None:
+    src = tmp_path / "in.parquet"
+    pq.write_table(pa.table({"x": [1, 2, 3, 4, 5, 6]}), src, row_group_size=2)
+
+    def run(*argv: str) -> pa.Table:
+        dst = tmp_path / "out.parquet"
+        assert main([*argv, "-i", str(src), "-o", str(dst)]) == 0
+        return pq.read_table(dst)
+
+    assert run("mutate", "y=cumsum(x)")["y"].to_pylist() == [1, 3, 6, 10, 15, 21]
+    assert run("mutate", "y=x - max(x)")["y"].to_pylist() == [-5, -4, -3, -2, -1, 0]
+    assert run("filter", "x > mean(x)")["x"].to_pylist() == [4, 5, 6]
+
+
+def test_cli_mutate_types_span_row_groups(tmp_path) -> None:
+    src = tmp_path / "in.parquet"
+    dst = tmp_path / "out.parquet"
+    table = pa.table({"x": [8, 9, None, 10]})
+    pq.write_table(table, src, row_group_size=2)
+    assert main(["mutate", "y=x % 7", "-i", str(src), "-o", str(dst)]) == 0
+    # NumPy evaluates ``%``; the null in the second row group makes the
+    # whole column float rather than failing to cast to the first's type.
+    y = pq.read_table(dst)["y"]
+    assert y.type == pa.float64()
+    assert [v for i, v in enumerate(y.to_pylist()) if i != 2] == [1, 2, 3]
+
+
+def test_cli_stops_reading_piped_csv_early(tmp_path) -> None:
+    src = tmp_path / "in.csv"
+    n = 300_000
+    csv.write_csv(pa.table({"a": pa.array(range(n)), "b": ["x"] * n}), src)
+    cmd = [sys.executable, "-m", "barrow.cli", "view", "--rows", "2"]
+    for _ in range(3):
+        with open(src, "rb") as f:
+            result = subprocess.run(cmd, stdin=f, capture_output=True, timeout=60)
+        assert result.returncode == 0, result.stderr.decode()
+        assert result.stdout.decode().splitlines() == ['"a","b"', '0,"x"', '1,"x"']
+
+
+def test_cli_widens_csv_types_inferred_from_first_block(
+    tmp_path, monkeypatch, capsys
+) -> None:
+    monkeypatch.setenv("BARROW_CSV_BLOCK_SIZE", "64")
+    src = tmp_path / "in.csv"
+    dst = tmp_path / "out.csv"
+    values = [str(i) for i in range(50)] + ["1.5"]
+    src.write_text("x\n" + "\n".join(values) + "\n")
+
+    assert main(["select", "x", "-i", str(src), "-o", str(dst)]) == 0
+    x = csv.read_csv(dst)["x"]
+    assert x.type == pa.float64()
+    assert x.to_pylist()[-1] == 1.5
+
+    monkeypatch.setattr("sys.stdin", open(src))
+    assert main(["select", "x", "-o", str(dst)]) == 1
+    err = capsys.readouterr().err
+    assert "STDIN" in err and "BARROW_CSV_BLOCK_SIZE" in err
@@ -0,0 +1,118 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"),
+    reason="requires Unix sockets and fork",
+)
+
+_CLIENT = (
+    "import sys; from barrow.client import main; rc = main(sys.argv[1:]); "
+    "print('pyarrow' in sys.modules, file=sys.stderr); sys.exit(rc)"
+)
+
+
+def _client(args, env, **kwargs):
+    return subprocess.run(
+        [sys.executable, "-c", _CLIENT, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        **kwargs,
+    )
+
+
+def _serve(tmp_path, **extra):
+    path = str(tmp_path / "barrow.sock")
+    env = {**os.environ, "BARROW_SOCKET": path}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "barrow.cli", "serve"],
+        stderr=subprocess.DEVNULL,
+        env={**env, **extra},
+    )
+    for _ in range(100):
+        if os.path.exists(path):
+            break
+        time.sleep(0.05)
+    yield env
+    proc.terminate()
+    proc.wait(timeout=10)
+    assert not os.path.exists(path)
+
+
+@pytest.fixture
+def server_env(tmp_path):
+    yield from _serve(tmp_path)
+
+
+@pytest.fixture
+def profiling_server_env(tmp_path):
+    yield from _serve(tmp_path, BARROW_PROFILE="1")
+
+
+def test_client_forwards_to_server(server_env, sample_csv, tmp_path) -> None:
+    result = _client(["filter", "a > 1", "-i", sample_csv], server_env)
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == ['"a","b","grp"', '2,5,"x"', '3,6,"y"']
+    # The client never imported the data stack itself.
+    assert result.stderr.strip() == "False"
+
+    failed = _client(["filter", "nosuch > 1", "-i", sample_csv], server_env)
+    assert failed.returncode == 1
+    assert "nosuch" in failed.stderr
+
+
+def test_client_runs_in_process_without_server(sample_csv, tmp_path) -> None:
+    env = {**os.environ, "BARROW_SOCKET": str(tmp_path / "missing.sock")}
+    result = _client(["select", "a", "-i", sample_csv], env)
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == ['"a"', "1", "2", "3"]
+    assert result.stderr.strip() == "True"
+
+
+def test_client_ignores_shared_socket_directory(server_env, sample_csv) -> None:
+    directory = os.path.dirname(server_env["BARROW_SOCKET"])
+    os.chmod(directory, 0o755)
+    try:
+        result = _client(["select", "a", "-i", sample_csv], server_env)
+    finally:
+        os.chmod(directory, 0o700)
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == ['"a"', "1", "2", "3"]
+    # The command ran in-process instead of on the server.
+    assert result.stderr.strip() == "True"
+
+
+def test_is_private_dir(tmp_path) -> None:
+    from barrow.client import is_private_dir
+
+    assert is_private_dir(str(tmp_path))
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    os.chmod(shared, 0o777)
+    assert not is_private_dir(str(shared))
+    assert not is_private_dir(str(tmp_path / "missing"))
+    (tmp_path / "link").symlink_to(tmp_path)
+    assert not is_private_dir(str(tmp_path / "link"))
+
+
+def test_server_profiles_with_client_environment(server_env, sample_csv) -> None:
+    env = {**server_env, "BARROW_PROFILE": "1"}
+    result = _client(["select", "a", "-i", sample_csv], env)
+    assert result.returncode == 0
+    assert "BARROW_PROFILE: scan=" in result.stderr
+    assert result.stderr.splitlines()[-1] == "False"
+
+
+def test_server_ignores_its_own_barrow_environment(
+    profiling_server_env, sample_csv
+) -> None:
+    result = _client(["select", "a", "-i", sample_csv], profiling_server_env)
+    assert result.returncode == 0
+    assert "BARROW_PROFILE" not in result.stderr
+    assert result.stderr.strip() == "False"